@@ -63,7 +63,8 @@ class Config:
             "embeddings": {
                 "model_name": "sentence-transformers/all-MiniLM-L6-v2",
                 "chunk_size": 1000,
-                "chunk_overlap": 100
+                "chunk_overlap": 100,
+                "cache_size": 4096
             },
             "reranker": {
                 "model_name": "cross-encoder/ms-marco-MiniLM-L-6-v2"
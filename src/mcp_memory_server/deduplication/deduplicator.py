@@ -10,6 +10,8 @@ import asyncio
 import logging
 from typing import List, Dict, Any, Tuple, Optional
 
+import numpy as np
+
 from .similarity import SimilarityCalculator
 from .merger import DocumentMerger
 from .advanced_features import AdvancedDeduplicationFeatures
@@ -146,7 +148,8 @@ class MemoryDeduplicator:
 
         return len(intersection) / len(union)
 
-    async def deduplicate_collection(self, collection: Any, dry_run: bool = False) -> Dict[str, Any]:
+    async def deduplicate_collection(self, collection: Any, dry_run: bool = False,
+                                     scope: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Perform batch deduplication on a collection.
 
         Main algorithm from docs/memory-deduplication-proposal.md
@@ -154,6 +157,8 @@ class MemoryDeduplicator:
         Args:
             collection: ChromaDB collection to deduplicate
             dry_run: If True, only analyze without making changes
+            scope: Optional metadata filter (ChromaDB ``where`` clause) limiting
+                which documents are compared
 
         Returns:
             Dictionary with deduplication results and statistics
@@ -166,7 +171,9 @@ class MemoryDeduplicator:
         try:
             # Get all documents from collection
             # Note: This is a simplified approach. In production, you'd batch process large collections
-            all_docs = await asyncio.to_thread(collection.similarity_search, "", k=10000)  # Large number to get all
+            search_kwargs: Dict[str, Any] = {'filter': scope} if scope else {}
+            all_docs = await asyncio.to_thread(
+                collection.similarity_search, "", k=10000, **search_kwargs)  # Large number to get all
 
             if len(all_docs) < 2:
                 return {
@@ -251,20 +258,10 @@ class MemoryDeduplicator:
         Returns:
             List of duplicate pairs with similarity scores
         """
-        duplicates = []
-
-        for i, doc1 in enumerate(documents):
-            for j, doc2 in enumerate(documents[i + 1:], i + 1):
-                # Simple content similarity check
-                similarity = self._simple_content_similarity(
-                    doc1['page_content'],
-                    doc2['page_content']
-                )
-
-                if similarity > self.similarity_threshold:
-                    duplicates.append((doc1, doc2, similarity))
-
-        return duplicates
+        pairs = self.similarity_calculator.find_content_duplicates(
+            [doc['page_content'] for doc in documents], self.similarity_threshold
+        )
+        return [(documents[i], documents[j], similarity) for i, j, similarity in pairs]
 
     def _find_duplicates_advanced(self, documents: List[Dict[str, Any]],
                                   clustered_docs: Dict[str, Any]) -> List[Tuple[Dict, Dict, float]]:
@@ -294,28 +291,14 @@ class MemoryDeduplicator:
         if clustered_docs.get('clusters'):
             for cluster_id, cluster_docs in clustered_docs['clusters'].items():
                 cluster_doc_ids = set(cluster_docs)
+                members = [doc for doc in documents if doc['id'] in cluster_doc_ids]
 
-                # Find duplicates within the cluster
-                for i, doc1 in enumerate(documents):
-                    if doc1['id'] not in cluster_doc_ids:
-                        continue
-
-                    for j, doc2 in enumerate(documents[i + 1:], i + 1):
-                        if doc2['id'] not in cluster_doc_ids:
-                            continue
-
-                        # Calculate similarity
-                        similarity = self._simple_content_similarity(
-                            doc1['page_content'], doc2['page_content']
-                        )
-
-                        # Use the lower of the two domain thresholds
-                        threshold1 = threshold_lookup.get(doc1['id'], self.similarity_threshold)
-                        threshold2 = threshold_lookup.get(doc2['id'], self.similarity_threshold)
-                        effective_threshold = min(threshold1, threshold2)
-
-                        if similarity > effective_threshold:
-                            duplicates.append((doc1, doc2, similarity))
+                # Find duplicates within the cluster, using the lower of each pair's domain thresholds
+                pairs = self.similarity_calculator.find_content_duplicates(
+                    [doc['page_content'] for doc in members],
+                    np.array([threshold_lookup.get(doc['id'], self.similarity_threshold) for doc in members])
+                )
+                duplicates.extend((members[i], members[j], similarity) for i, j, similarity in pairs)
         else:
             # Fallback to simple method if clustering failed
             duplicates = self._find_duplicates_simple(documents)
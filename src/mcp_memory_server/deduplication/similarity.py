@@ -10,7 +10,8 @@ Based on the algorithm from docs/memory-deduplication-proposal.md
 import time
 import numpy as np
 import logging
-from typing import List, Tuple, Dict, Any, Optional
+from typing import List, Tuple, Dict, Any, Optional, Union
+from scipy.sparse import csr_matrix
 from sklearn.metrics.pairwise import cosine_similarity
 
 
@@ -44,6 +45,16 @@ class SimilarityCalculator:
         similarity = cosine_similarity(emb1, emb2)[0][0]
         return float(similarity)
 
+    @staticmethod
+    def _similarity_matrix(embeddings: List[Any]) -> np.ndarray:
+        """Pairwise cosine similarities as one matrix product of L2-normalized rows."""
+        # Copies, so callers' arrays (e.g. row views of a shared matrix) are never modified
+        embeddings_array = np.array(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(embeddings_array, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0  # Zero vectors get similarity 0, as with sklearn
+        embeddings_array /= norms
+        return embeddings_array @ embeddings_array.T
+
     def find_duplicates_batch(self, documents: List[Dict[str, Any]],
                               threshold: Optional[float] = None) -> List[Tuple[Dict[str, Any], Dict[str, Any], float]]:
         """Find duplicate documents using batch similarity calculation.
@@ -79,23 +90,14 @@ class SimilarityCalculator:
             logging.warning("Not enough documents with embeddings for deduplication")
             return []
 
-        # Convert to numpy array for efficient computation
-        embeddings_array = np.array(embeddings)
-
-        # Calculate similarity matrix
-        similarity_matrix = cosine_similarity(embeddings_array)
+        similarity_matrix = self._similarity_matrix(embeddings)
 
-        # Find duplicates above threshold
-        duplicates = []
-        for i in range(len(valid_docs)):
-            for j in range(i + 1, len(valid_docs)):
-                similarity_score = similarity_matrix[i][j]
-                if similarity_score > threshold:
-                    duplicates.append((
-                        valid_docs[i],
-                        valid_docs[j],
-                        float(similarity_score)
-                    ))
+        # Find duplicates above threshold (upper triangle only, excluding self-pairs)
+        pair_indices = np.argwhere(np.triu(similarity_matrix, k=1) > threshold)
+        duplicates = [
+            (valid_docs[i], valid_docs[j], float(similarity_matrix[i, j]))
+            for i, j in pair_indices
+        ]
 
         processing_time = time.time() - start_time
         logging.info(f"Batch similarity calculation completed: {len(duplicates)} duplicates found "
@@ -103,6 +105,60 @@ class SimilarityCalculator:
 
         return duplicates
 
+    @staticmethod
+    def find_content_duplicates(contents: List[str], thresholds: Union[float, np.ndarray],
+                                block_size: int = 1024) -> List[Tuple[int, int, float]]:
+        """Find pairs of texts whose lower-cased word sets overlap above a threshold.
+
+        Computes the same Jaccard similarity as comparing ``set(text.lower().split())``
+        pair by pair, but gets every pairwise intersection size from one sparse
+        document-term matrix product, processed in row blocks to bound memory.
+
+        Args:
+            contents: Texts to compare
+            thresholds: Similarity threshold, either one value or one per text
+                (a pair uses the lower of its two thresholds)
+            block_size: Number of rows compared per block
+
+        Returns:
+            List of tuples: (index1, index2, similarity) with index1 < index2,
+            in row-major order
+        """
+        count = len(contents)
+        if count < 2:
+            return []
+
+        # Binary document-term matrix over lower-cased whitespace tokens
+        vocabulary: Dict[str, int] = {}
+        rows: List[int] = []
+        columns: List[int] = []
+        for row, content in enumerate(contents):
+            for word in set(content.lower().split()):
+                rows.append(row)
+                columns.append(vocabulary.setdefault(word, len(vocabulary)))
+        terms = csr_matrix(
+            (np.ones(len(rows), dtype=np.int32), (rows, columns)),
+            shape=(count, max(len(vocabulary), 1))
+        )
+        set_sizes = np.asarray(terms.sum(axis=1)).ravel()
+        per_text_thresholds = np.broadcast_to(np.asarray(thresholds, dtype=np.float64), (count,))
+        column_indices = np.arange(count)
+
+        pairs: List[Tuple[int, int, float]] = []
+        for start in range(0, count, block_size):
+            end = min(start + block_size, count)
+            intersections = (terms[start:end] @ terms.T).toarray()
+            unions = set_sizes[start:end, None] + set_sizes[None, :] - intersections
+            # Two empty word sets count as identical
+            similarities = np.divide(intersections, unions, out=np.ones(unions.shape), where=unions > 0)
+
+            pair_thresholds = np.minimum(per_text_thresholds[start:end, None], per_text_thresholds[None, :])
+            upper = column_indices[None, :] > column_indices[start:end, None]
+            for i, j in np.argwhere((similarities > pair_thresholds) & upper):
+                pairs.append((start + int(i), int(j), float(similarities[i, j])))
+
+        return pairs
+
     def find_similar_candidates(self, target_embedding: np.ndarray,
                                 candidate_embeddings: List[np.ndarray],
                                 top_k: int = 5) -> List[Tuple[int, float]]:
@@ -163,29 +219,22 @@ class SimilarityCalculator:
         if len(embeddings) < 2:
             return [[doc] for doc in valid_docs]
 
-        # Calculate similarity matrix
-        embeddings_array = np.array(embeddings)
-        similarity_matrix = cosine_similarity(embeddings_array)
+        similarity_matrix = self._similarity_matrix(embeddings)
 
         # Simple clustering based on similarity threshold
         clusters = []
-        assigned = set()
+        assigned = np.zeros(len(valid_docs), dtype=bool)
 
         for i in range(len(valid_docs)):
-            if i in assigned:
+            if assigned[i]:
                 continue
 
-            # Start new cluster
-            cluster = [valid_docs[i]]
-            assigned.add(i)
-
-            # Find all similar documents
-            for j in range(i + 1, len(valid_docs)):
-                if j not in assigned and similarity_matrix[i][j] > cluster_threshold:
-                    cluster.append(valid_docs[j])
-                    assigned.add(j)
+            # Start a new cluster with every later unassigned document above the threshold
+            similar = np.flatnonzero((similarity_matrix[i, i + 1:] > cluster_threshold) & ~assigned[i + 1:]) + i + 1
+            members = [i, *similar.tolist()]
+            assigned[members] = True
 
-            clusters.append(cluster)
+            clusters.append([valid_docs[j] for j in members])
 
         logging.info(f"Document clustering completed: {len(clusters)} clusters from {len(valid_docs)} documents")
         return clusters
@@ -208,22 +257,10 @@ class SimilarityCalculator:
                 'potential_duplicates': 0
             }
 
-        # Calculate all pairwise similarities
-        similarities = []
-        duplicate_count = 0
+        # Calculate all pairwise similarities between documents that have embeddings
+        embeddings = [doc['embedding'] for doc in documents if doc.get('embedding') is not None]
 
-        for i in range(len(documents)):
-            for j in range(i + 1, len(documents)):
-                emb1 = documents[i].get('embedding')
-                emb2 = documents[j].get('embedding')
-
-                if emb1 is not None and emb2 is not None:
-                    sim = self.calculate_similarity(emb1, emb2)
-                    similarities.append(sim)
-                    if sim > self.similarity_threshold:
-                        duplicate_count += 1
-
-        if not similarities:
+        if len(embeddings) < 2:
             return {
                 'total_documents': len(documents),
                 'similarity_pairs': 0,
@@ -232,6 +269,10 @@ class SimilarityCalculator:
                 'potential_duplicates': 0
             }
 
+        similarity_matrix = self._similarity_matrix(embeddings)
+        similarities = similarity_matrix[np.triu_indices(len(embeddings), k=1)]
+        duplicate_count = int(np.count_nonzero(similarities > self.similarity_threshold))
+
         return {
             'total_documents': len(documents),
             'similarity_pairs': len(similarities),
@@ -240,5 +281,5 @@ class SimilarityCalculator:
             'min_similarity': float(np.min(similarities)),
             'std_similarity': float(np.std(similarities)),
             'potential_duplicates': duplicate_count,
-            'duplication_rate': duplicate_count / len(similarities) if similarities else 0.0
+            'duplication_rate': duplicate_count / len(similarities)
         }
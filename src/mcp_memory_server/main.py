@@ -8,9 +8,9 @@ from .config import Config
 from .memory import HierarchicalMemorySystem, LifecycleManager
 from .server import create_app, setup_json_rpc_handler, get_tool_definitions
 from .tools import (
-    add_document_tool,
+    add_document_tool, add_documents_tool,
     query_documents_tool,
-    get_memory_stats_tool, get_lifecycle_stats_tool,
+    get_memory_stats_tool, flush_index_tool, get_lifecycle_stats_tool,
     start_background_maintenance_tool, stop_background_maintenance_tool, cleanup_expired_memories_tool,
     query_permanent_documents_tool, get_permanence_stats_tool,
     deduplicate_memories_tool, get_deduplication_stats_tool, preview_duplicates_tool,
@@ -22,7 +22,7 @@ from .tools import (
     get_clustering_analysis_tool, get_advanced_deduplication_metrics_tool,
     run_advanced_deduplication_tool,
     # Document Management Tools
-    delete_document_tool, demote_importance_tool, update_document_tool
+    get_document_tool, delete_document_tool, demote_importance_tool, update_document_tool
 )
 
 
@@ -91,8 +91,10 @@ def main() -> Any:
     # Create tool registry with dependency injection
     tool_registry = {
         "add_document": partial(add_document_tool, memory_system),
+        "add_documents": partial(add_documents_tool, memory_system),
         "query_documents": partial(query_documents_with_reranking, memory_system, reranker_model),
         "get_memory_stats": partial(get_memory_stats_tool, memory_system),
+        "flush_index": partial(flush_index_tool, memory_system),
         # Phase 3: Lifecycle Management Tools
         "get_lifecycle_stats": partial(get_lifecycle_stats_tool, lifecycle_manager),
         "start_background_maintenance": partial(start_background_maintenance_tool, lifecycle_manager),
@@ -123,6 +125,7 @@ def main() -> Any:
         "get_advanced_deduplication_metrics": partial(get_advanced_deduplication_metrics_tool, memory_system),
         "run_advanced_deduplication": partial(run_advanced_deduplication_tool, memory_system),
         # Document Management Tools
+        "get_document": partial(get_document_tool, memory_system),
         "delete_document": partial(delete_document_tool, memory_system),
         "demote_importance": partial(demote_importance_tool, memory_system, lifecycle_manager),
         "update_document": partial(update_document_tool, memory_system),
@@ -0,0 +1,119 @@
+"""
+Embedding Batcher
+
+Coalesces concurrent embed_documents calls into a single model batch. Embedding
+calls run in worker threads (asyncio.to_thread), so under load several requests
+would otherwise run separate forward passes that contend for the same cores.
+Here the first caller runs the model; callers that arrive while it is busy are
+queued, and when its pass finishes the oldest queued caller runs the next pass
+for everything queued so far. Each caller runs at most one pass, so none is held
+up by a steady stream of later requests. An uncontended call runs immediately,
+so batching adds no latency.
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import List, Tuple
+
+from langchain_core.embeddings import Embeddings
+
+# Texts to embed, the future for their vectors, and an event set when the
+# request is either done or its caller has to run the next model pass
+_Request = Tuple[List[str], "Future[List[List[float]]]", threading.Event]
+
+
+class BatchingEmbeddings(Embeddings):
+    """Embeddings wrapper that merges concurrent document batches into one model call."""
+
+    def __init__(self, embeddings: Embeddings, max_batch_size: int = 256) -> None:
+        """Initialize the batcher.
+
+        Args:
+            embeddings: Underlying embedding model
+            max_batch_size: Maximum number of texts sent to the model in one call
+        """
+        self.embeddings = embeddings
+        self.max_batch_size = max_batch_size
+        self._pending: List[_Request] = []
+        self._lock = threading.Lock()
+        self._running = False
+        self.model_calls = 0
+        self.requests = 0
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed documents, sharing a model call with any concurrent requests."""
+        if not texts:
+            return []
+
+        future: "Future[List[List[float]]]" = Future()
+        wake = threading.Event()
+        with self._lock:
+            self._pending.append((list(texts), future, wake))
+            self.requests += 1
+            if self._running:
+                # Wait until a running pass embeds this request or hands the next pass to us
+                lead = False
+            else:
+                self._running = True
+                lead = True
+
+        if not lead:
+            wake.wait()
+        if not future.done():
+            self._run_pass()
+
+        return future.result()
+
+    def _run_pass(self) -> None:
+        """Run one model pass over the oldest pending requests, then hand over to the next caller.
+
+        The pass always includes the calling request: a caller only runs a pass
+        when it is first in the queue.
+        """
+        with self._lock:
+            batch = self._take_batch()
+
+        try:
+            texts = [text for request_texts, _, _ in batch for text in request_texts]
+            vectors = self.embeddings.embed_documents(texts)
+            offset = 0
+            for request_texts, future, _ in batch:
+                future.set_result(vectors[offset:offset + len(request_texts)])
+                offset += len(request_texts)
+        except BaseException as e:
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            with self._lock:
+                self.model_calls += 1
+                if self._pending:
+                    # The oldest waiting caller runs the next pass
+                    self._pending[0][2].set()
+                else:
+                    self._running = False
+            for _, _, wake in batch:
+                wake.set()
+
+    def _take_batch(self) -> List[_Request]:
+        """Pop pending requests up to max_batch_size texts (always at least one). Caller holds the lock."""
+        batch = [self._pending.pop(0)]
+        size = len(batch[0][0])
+        while self._pending and size + len(self._pending[0][0]) <= self.max_batch_size:
+            request = self._pending.pop(0)
+            batch.append(request)
+            size += len(request[0])
+        return batch
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a query directly (queries may use different encode settings)."""
+        return self.embeddings.embed_query(text)
+
+    def get_stats(self) -> dict:
+        """Get request and model call counts."""
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'model_calls': self.model_calls,
+                'max_batch_size': self.max_batch_size
+            }
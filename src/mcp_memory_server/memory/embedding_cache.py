@@ -0,0 +1,116 @@
+"""
+Embedding Cache
+
+Memoizes embeddings by content hash so that text which has already been
+embedded (re-added documents, repeated queries) skips the transformer.
+Vectors are held as float32 arrays rather than lists of Python floats, which
+is several times smaller and exact for models that produce float32 output.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import List, Optional
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+
+class CachedEmbeddings(Embeddings):
+    """LRU cache in front of another Embeddings implementation."""
+
+    def __init__(self, embeddings: Embeddings, max_size: int = 4096,
+                 symmetric_queries: bool = False) -> None:
+        """Initialize the cache.
+
+        Args:
+            embeddings: Underlying embedding model
+            max_size: Maximum number of cached vectors (0 disables caching)
+            symmetric_queries: The model embeds queries exactly like documents, so
+                a query can reuse the vector of identical document text
+        """
+        self.embeddings = embeddings
+        self.max_size = max_size
+        self.symmetric_queries = symmetric_queries
+        self._cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        # Embedding calls run in worker threads (asyncio.to_thread)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(text: str) -> bytes:
+        """Content hash used as the cache key."""
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+    def _get(self, key: bytes) -> Optional[List[float]]:
+        with self._lock:
+            vector = self._cache.get(key)
+            if vector is None:
+                self.misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self.hits += 1
+        return vector.tolist()
+
+    def _put(self, key: bytes, vector: List[float]) -> None:
+        if self.max_size <= 0:
+            return
+        stored = np.asarray(vector, dtype=np.float32)
+        with self._lock:
+            self._cache[key] = stored
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed documents, running the model only on texts not already cached."""
+        keys = [self._key(text) for text in texts]
+        vectors: List[Optional[List[float]]] = [self._get(key) for key in keys]
+
+        # Group misses by key so repeated texts within the batch are embedded once
+        miss_indices: "OrderedDict[bytes, List[int]]" = OrderedDict()
+        for i, vector in enumerate(vectors):
+            if vector is None:
+                miss_indices.setdefault(keys[i], []).append(i)
+
+        if miss_indices:
+            first_indices = [indices[0] for indices in miss_indices.values()]
+            computed = self.embeddings.embed_documents([texts[i] for i in first_indices])
+            for (key, indices), vector in zip(miss_indices.items(), computed):
+                for i in indices:
+                    vectors[i] = vector
+                self._put(key, vector)
+
+        return vectors  # type: ignore[return-value]
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a query, reusing a cached vector when available."""
+        if self.symmetric_queries:
+            # Share the document key space: querying for just-stored text is a hit
+            key = self._key(text)
+            vector = self._get(key)
+            if vector is None:
+                vector = self.embeddings.embed_documents([text])[0]
+                self._put(key, vector)
+            return vector
+
+        # Queries use a separate key space; some models embed queries differently
+        key = b'q' + self._key(text)
+        vector = self._get(key)
+        if vector is None:
+            vector = self.embeddings.embed_query(text)
+            self._put(key, vector)
+        return vector
+
+    def get_stats(self) -> dict:
+        """Get cache size and hit statistics."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'size': len(self._cache),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0
+            }
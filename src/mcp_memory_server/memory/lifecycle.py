@@ -412,11 +412,14 @@ class LifecycleManager:
 
         return metadata
 
-    async def cleanup_expired_documents(self, collection_name: Optional[str] = None) -> Dict[str, Any]:
+    async def cleanup_expired_documents(self, collection_name: Optional[str] = None,
+                                        scope: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Clean up expired documents and superseded documents from collections.
 
         Args:
             collection_name: Specific collection to clean, or None for all
+            scope: Optional metadata filter (ChromaDB ``where`` clause) limiting
+                which documents are checked, or None to check every document
 
         Returns:
             Cleanup results and statistics
@@ -435,8 +438,11 @@ class LifecycleManager:
             try:
                 collection = getattr(self.memory_system, f"{coll_name}_memory")
 
-                # Get all documents with IDs to check for expiry
-                all_data = await asyncio.to_thread(collection.get)
+                # Expiry and supersession only need metadata, not document text
+                get_kwargs: Dict[str, Any] = {'include': ['metadatas']}
+                if scope:
+                    get_kwargs['where'] = scope
+                all_data = await asyncio.to_thread(collection.get, **get_kwargs)
                 total_docs = len(all_data.get('ids', []))
 
                 expired_doc_ids = []
@@ -445,6 +451,9 @@ class LifecycleManager:
                 if all_data.get('ids') and all_data.get('metadatas'):
                     # First pass: find documents that supersede others
                     supersedes_map = self._build_supersedes_map(all_data)
+                    if scope:
+                        # Superseding documents may fall outside the scope
+                        supersedes_map.update(await self._find_superseding(collection, all_data))
 
                     for doc_id, metadata in zip(all_data['ids'], all_data['metadatas']):
                         if metadata:
@@ -534,6 +543,31 @@ class LifecycleManager:
 
         return supersedes_map
 
+    async def _find_superseding(self, collection: Any, scoped_data: dict) -> Dict[str, str]:
+        """Build the supersedes map for a scoped cleanup from the whole collection.
+
+        Only documents that supersede one of the scoped documents are fetched.
+
+        Args:
+            collection: Collection being cleaned
+            scoped_data: ChromaDB get() result for the scoped documents
+
+        Returns:
+            Dict mapping superseded document IDs to the document that supersedes them
+        """
+        logical_ids = list({
+            metadata.get('document_id') or metadata.get('memory_id')
+            for metadata in scoped_data.get('metadatas') or []
+            if metadata and (metadata.get('document_id') or metadata.get('memory_id'))
+        })
+        if not logical_ids:
+            return {}
+
+        superseding = await asyncio.to_thread(
+            collection.get, where={'supersedes': {'$in': logical_ids}}, include=['metadatas']
+        )
+        return self._build_supersedes_map(superseding)
+
     def _is_superseded(self, doc_id: str, metadata: dict, supersedes_map: Dict[str, str]) -> bool:
         """Check if a document has been superseded by another document.
 
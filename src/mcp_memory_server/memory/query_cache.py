@@ -0,0 +1,131 @@
+"""
+Query Response Cache
+
+Reuses the full response of an earlier query when a new query is semantically
+close enough to it. Cached queries are matched by cosine similarity between
+query embeddings, so rephrasings of the same question skip vector search,
+rescoring and related-chunk lookup entirely.
+
+Responses are only reused within the same namespace (collections, k and
+routing options, plus the collection sizes at the time of the query), expire
+after a TTL, and are dropped whenever the memory system is written to.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+
+class QueryResponseCache:
+    """Semantic cache of query responses keyed by query embedding."""
+
+    def __init__(self, embeddings: Embeddings, similarity_threshold: float = 0.95,
+                 max_size: int = 256, ttl_seconds: float = 300.0) -> None:
+        """Initialize the cache.
+
+        Args:
+            embeddings: Embedding model used to embed incoming queries
+            similarity_threshold: Minimum cosine similarity for a cached response to be reused
+            max_size: Maximum number of cached responses (0 disables caching)
+            ttl_seconds: Seconds before a cached response expires
+        """
+        self.embeddings = embeddings
+        self.similarity_threshold = similarity_threshold
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        # entry id -> (namespace, unit query vector, response, stored_at)
+        self._entries: "OrderedDict[int, Tuple[Hashable, np.ndarray, Dict[str, Any], float]]" = OrderedDict()
+        self._next_id = 0
+        # Lookups run in worker threads (asyncio.to_thread)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def _embed(self, query: str) -> np.ndarray:
+        """Embed a query as a unit-length float32 vector."""
+        vector = np.asarray(self.embeddings.embed_query(query), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def lookup(self, query: str, namespace: Hashable) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached response for the closest matching query, if any.
+
+        Args:
+            query: Search query string
+            namespace: Key identifying the query options and collection state
+
+        Returns:
+            Cached response, or None on a miss
+        """
+        if self.max_size <= 0:
+            return None
+
+        vector = self._embed(query)
+        cutoff = time.time() - self.ttl_seconds
+
+        with self._lock:
+            expired = [entry_id for entry_id, entry in self._entries.items() if entry[3] < cutoff]
+            for entry_id in expired:
+                del self._entries[entry_id]
+
+            candidates = [(entry_id, entry) for entry_id, entry in self._entries.items()
+                          if entry[0] == namespace]
+            if candidates:
+                # All vectors are unit length, so one matmul gives every cosine similarity
+                similarities = np.stack([entry[1] for _, entry in candidates]) @ vector
+                best = int(np.argmax(similarities))
+                if similarities[best] >= self.similarity_threshold:
+                    entry_id, entry = candidates[best]
+                    self._entries.move_to_end(entry_id)
+                    self.hits += 1
+                    return copy.deepcopy(entry[2])
+
+            self.misses += 1
+            return None
+
+    def store(self, query: str, namespace: Hashable, response: Dict[str, Any]) -> None:
+        """Cache a query response.
+
+        Args:
+            query: Search query string
+            namespace: Key identifying the query options and collection state
+            response: Response to reuse for similar queries
+        """
+        if self.max_size <= 0:
+            return
+
+        vector = self._embed(query)
+        stored = copy.deepcopy(response)
+
+        with self._lock:
+            self._entries[self._next_id] = (namespace, vector, stored, time.time())
+            self._next_id += 1
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Drop every cached response (called after writes to memory)."""
+        with self._lock:
+            if self._entries:
+                self._entries.clear()
+                self.invalidations += 1
+
+    def get_stats(self) -> dict:
+        """Get cache size and hit statistics."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'similarity_threshold': self.similarity_threshold,
+                'hits': self.hits,
+                'misses': self.misses,
+                'invalidations': self.invalidations,
+                'hit_rate': self.hits / total if total else 0.0
+            }
@@ -1,7 +1,8 @@
 import time
-import math
 import re
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+
+import numpy as np
 
 
 class DomainPatternEngine:
@@ -289,33 +290,48 @@ class MemoryImportanceScorer:
         Returns:
             Float retrieval score for ranking results
         """
+        return self.calculate_retrieval_scores([memory_data], query, current_time)[0]
+
+    def calculate_retrieval_scores(self, memories: List[Dict[str, Any]], query: str,
+                                   current_time: Optional[float] = None) -> List[float]:
+        """Calculate retrieval scores for a batch of candidate memories at once.
+
+        Args:
+            memories: List of dictionaries containing memory document and metadata
+            query: The search query being performed
+            current_time: Current timestamp (defaults to current time)
+
+        Returns:
+            List of retrieval scores, in the same order as memories
+        """
+        if not memories:
+            return []
         if current_time is None:
             current_time = time.time()
 
-        metadata = memory_data.get('metadata', {})
+        metadatas = [memory.get('metadata') or {} for memory in memories]
 
         # Semantic similarity (from ChromaDB distance - lower is better)
-        distance = memory_data.get('distance', 1.0)
-        semantic_score = 1.0 - min(distance, 1.0)  # Convert distance to similarity
+        distances = np.array([memory.get('distance', 1.0) for memory in memories], dtype=np.float64)
+        semantic_scores = 1.0 - np.minimum(distances, 1.0)  # Convert distance to similarity
 
         # Recency score
-        timestamp = metadata.get('timestamp', current_time)
-        time_delta = current_time - timestamp
-        recency_score = math.exp(-time_delta / self.decay_constant)
+        timestamps = np.array([m.get('timestamp', current_time) for m in metadatas], dtype=np.float64)
+        recency_scores = np.exp(-(current_time - timestamps) / self.decay_constant)
 
         # Frequency score
-        access_count = metadata.get('access_count', 0)
-        frequency_score = min(access_count / self.max_access_count, 1.0)
+        access_counts = np.array([m.get('access_count', 0) for m in metadatas], dtype=np.float64)
+        frequency_scores = np.minimum(access_counts / self.max_access_count, 1.0)
 
         # Importance score from metadata
-        importance_score = metadata.get('importance_score', 0.5)
+        importance_scores = np.array([m.get('importance_score', 0.5) for m in metadatas], dtype=np.float64)
 
         # Weighted combination
-        total_score = (
-            semantic_score * self.scoring_weights['semantic'] +
-            recency_score * self.scoring_weights['recency'] +
-            frequency_score * self.scoring_weights['frequency'] +
-            importance_score * self.scoring_weights['importance']
+        total_scores = (
+            semantic_scores * self.scoring_weights['semantic'] +
+            recency_scores * self.scoring_weights['recency'] +
+            frequency_scores * self.scoring_weights['frequency'] +
+            importance_scores * self.scoring_weights['importance']
         )
 
-        return float(total_score)
+        return [float(score) for score in total_scores]
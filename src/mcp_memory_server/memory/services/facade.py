@@ -19,6 +19,9 @@ except ImportError:
     ChromaError = Exception  # type: ignore[misc, assignment]
 
 from ..scorer import MemoryImportanceScorer
+from ..embedding_batcher import BatchingEmbeddings
+from ..embedding_cache import CachedEmbeddings
+from ..query_cache import QueryResponseCache
 from ..query_monitor import QueryPerformanceMonitor
 from ..chunk_relationships import ChunkRelationshipManager
 from ..exceptions import StorageError
@@ -63,7 +66,21 @@ class HierarchicalMemorySystem:
 
         # Embedding Model
         self.embedding_model_name = embeddings_config.get('model_name', 'sentence-transformers/all-MiniLM-L6-v2')
-        self.embedding_function = HuggingFaceEmbeddings(model_name=self.embedding_model_name)
+        model_kwargs: Dict[str, Any] = {}
+        if embeddings_config.get('backend'):
+            # e.g. "onnx" runs the model on ONNX Runtime instead of PyTorch
+            model_kwargs['backend'] = embeddings_config['backend']
+        if embeddings_config.get('model_file'):
+            # Pick a specific exported file, such as an int8-quantized ONNX model
+            model_kwargs['model_kwargs'] = {'file_name': embeddings_config['model_file']}
+        base_embeddings = HuggingFaceEmbeddings(model_name=self.embedding_model_name, model_kwargs=model_kwargs)
+        self.embedding_function = CachedEmbeddings(
+            # Concurrent requests share one model pass instead of contending for the CPU
+            BatchingEmbeddings(base_embeddings, max_batch_size=embeddings_config.get('max_batch_size', 256)),
+            max_size=embeddings_config.get('cache_size', 4096),
+            # Without query-specific encode kwargs, queries and documents embed identically
+            symmetric_queries=not getattr(base_embeddings, 'query_encode_kwargs', None)
+        )
         self.chunk_size = embeddings_config.get('chunk_size', 1000)
         self.chunk_overlap = embeddings_config.get('chunk_overlap', 100)
 
@@ -75,18 +92,25 @@ class HierarchicalMemorySystem:
         # Lifecycle manager (set after initialization)
         self.lifecycle_manager = None
 
+        # HNSW index parameters (e.g. M, construction_ef, search_ef) for Chroma's ANN index.
+        # Chroma only applies them when a collection is first created.
+        hnsw_config = db_config.get('hnsw', {})
+        collection_metadata = {f'hnsw:{key}': value for key, value in hnsw_config.items()} or None
+
         # Initialize memory collections with error handling
         try:
             self.short_term_memory = Chroma(
                 collection_name=self.collection_names.get('short_term', 'short_term_memory'),
                 embedding_function=self.embedding_function,
                 persist_directory=self.persist_directory,
+                collection_metadata=collection_metadata,
             )
 
             self.long_term_memory = Chroma(
                 collection_name=self.collection_names.get('long_term', 'long_term_memory'),
                 embedding_function=self.embedding_function,
                 persist_directory=self.persist_directory,
+                collection_metadata=collection_metadata,
             )
 
             logging.info(f"Successfully initialized all memory collections in {self.persist_directory}")
@@ -119,6 +143,17 @@ class HierarchicalMemorySystem:
         self.deduplicator = MemoryDeduplicator(deduplication_config, self.chunk_manager)
 
         self.query_monitor = QueryPerformanceMonitor(memory_config.get('query_monitoring', {}))
+
+        # Semantic response cache for repeated queries (opt-in)
+        query_cache_config = memory_config.get('query_cache', {})
+        self.query_cache: Optional[QueryResponseCache] = None
+        if query_cache_config.get('enabled', False):
+            self.query_cache = QueryResponseCache(
+                self.embedding_function,
+                similarity_threshold=query_cache_config.get('similarity_threshold', 0.95),
+                max_size=query_cache_config.get('max_size', 256),
+                ttl_seconds=query_cache_config.get('ttl_seconds', 300)
+            )
         self.intelligence_system = MemoryIntelligenceSystem(self, memory_config.get('analytics', {}))
 
         # Initialize services
@@ -160,7 +195,8 @@ class HierarchicalMemorySystem:
             importance_scorer=self.importance_scorer,
             chunk_manager=self.chunk_manager,
             query_monitor=self.query_monitor,
-            deduplicator=self.deduplicator
+            deduplicator=self.deduplicator,
+            response_cache=self.query_cache
         )
 
         self._maintenance_service = MemoryMaintenanceService(
@@ -209,6 +245,7 @@ class HierarchicalMemorySystem:
             Dictionary with operation results and statistics
         """
         result = await self._storage_service.add_memory(content, metadata, context, memory_type)
+        self._invalidate_query_cache()
 
         # Trigger maintenance if needed (after successful add to short_term)
         if result.get("success") and result.get("collection") == "short_term":
@@ -219,6 +256,28 @@ class HierarchicalMemorySystem:
 
         return result
 
+    async def add_memories(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Add several memories in one batch.
+
+        Args:
+            items: List of dicts with 'content' and optional 'metadata',
+                'context' and 'memory_type' keys
+
+        Returns:
+            List of per-item operation results, in input order
+        """
+        results = await self._storage_service.add_memories(items)
+        self._invalidate_query_cache()
+
+        # Run short-term maintenance once for the whole batch
+        if any(r.get("success") and r.get("collection") == "short_term" for r in results):
+            try:
+                await self._maintenance_service.maintain_short_term_memory()
+            except Exception as maintenance_error:
+                logging.warning(f"Memory maintenance failed: {maintenance_error}")
+
+        return results
+
     async def query_memories(
         self,
         query: str,
@@ -239,6 +298,17 @@ class HierarchicalMemorySystem:
         """
         return await self._query_service.query_memories(query, collections, k, use_smart_routing)
 
+    async def get_document(self, document_id: str) -> Dict[str, Any]:
+        """Fetch a document's chunks and metadata by document_id.
+
+        Args:
+            document_id: The document ID to fetch (memory_id or document_id)
+
+        Returns:
+            Dictionary with the document content, chunks, metadata and collection
+        """
+        return await self._update_service.get_document(document_id)
+
     async def delete_document(self, document_id: str) -> Dict[str, Any]:
         """Delete a document and all its chunks by document_id.
 
@@ -248,7 +318,9 @@ class HierarchicalMemorySystem:
         Returns:
             Dictionary with deletion results including chunks removed and collection
         """
-        return await self._update_service.delete_document(document_id)
+        result = await self._update_service.delete_document(document_id)
+        self._invalidate_query_cache()
+        return result
 
     async def update_document_importance(
         self,
@@ -266,7 +338,9 @@ class HierarchicalMemorySystem:
         Returns:
             Dictionary with update results including old/new scores and TTL tier
         """
-        return await self._update_service.update_document_importance(document_id, new_importance, reason)
+        result = await self._update_service.update_document_importance(document_id, new_importance, reason)
+        self._invalidate_query_cache()
+        return result
 
     async def update_document_content(
         self,
@@ -286,9 +360,11 @@ class HierarchicalMemorySystem:
         Returns:
             Dictionary with update results
         """
-        return await self._update_service.update_document_content(
+        result = await self._update_service.update_document_content(
             document_id, new_content, new_metadata, preserve_importance
         )
+        self._invalidate_query_cache()
+        return result
 
     async def update_document_metadata(
         self,
@@ -308,7 +384,14 @@ class HierarchicalMemorySystem:
         Returns:
             Dictionary with update results including success status
         """
-        return await self._update_service.update_document_metadata(chunk_id, metadata_updates)
+        result = await self._update_service.update_document_metadata(chunk_id, metadata_updates)
+        self._invalidate_query_cache()
+        return result
+
+    def _invalidate_query_cache(self) -> None:
+        """Drop cached query responses after a write."""
+        if self.query_cache is not None:
+            self.query_cache.invalidate()
 
     # =========================================================================
     # Public API - Statistics and Analytics
@@ -11,8 +11,9 @@ Handles search and retrieval operations including:
 import time
 import logging
 import asyncio
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
+import numpy as np
 from langchain_chroma import Chroma
 
 # Import ChromaDB errors for specific exception handling
@@ -34,7 +35,8 @@ class MemoryQueryService:
         chunk_manager: Any,
         query_monitor: Any,
         deduplicator: Any,
-        config: Optional[Dict[str, Any]] = None
+        config: Optional[Dict[str, Any]] = None,
+        response_cache: Any = None
     ) -> None:
         """Initialize query service.
 
@@ -47,6 +49,8 @@ class MemoryQueryService:
             query_monitor: QueryPerformanceMonitor instance
             deduplicator: MemoryDeduplicator instance
             config: Configuration dictionary
+            response_cache: Optional QueryResponseCache for reusing responses
+                to semantically similar queries
         """
         self.short_term_memory = short_term_memory
         self.long_term_memory = long_term_memory
@@ -56,6 +60,7 @@ class MemoryQueryService:
         self.query_monitor = query_monitor
         self.deduplicator = deduplicator
         self.config = config or {}
+        self.response_cache = response_cache
 
     def _get_collection(self, collection_name: str) -> Optional[Chroma]:
         """Get collection by name."""
@@ -65,6 +70,16 @@ class MemoryQueryService:
             return self.long_term_memory
         return None
 
+    def _collection_counts(self) -> Tuple[int, ...]:
+        """Current size of each collection, used to key cached responses."""
+        counts = []
+        for collection in (self.short_term_memory, self.long_term_memory):
+            try:
+                counts.append(collection._collection.count())
+            except Exception:
+                counts.append(-1)
+        return tuple(counts)
+
     async def query_memories(
         self,
         query: str,
@@ -74,6 +89,9 @@ class MemoryQueryService:
     ) -> Dict[str, Any]:
         """Query across memory collections with deduplication-aware intelligent routing.
 
+        A response cache hit returns the cached response as-is: the access
+        statistics of its results are not updated again.
+
         Args:
             query: Search query string
             collections: List of collection names to search (default: smart routing)
@@ -87,6 +105,30 @@ class MemoryQueryService:
         start_time = time.time()
         current_time = start_time
 
+        # Serve semantically similar repeat queries from the response cache
+        cache_namespace = None
+        if self.response_cache is not None:
+            cache_namespace = (
+                tuple(collections) if collections is not None else None,
+                k,
+                use_smart_routing,
+                self._collection_counts()
+            )
+            try:
+                cached = await asyncio.to_thread(self.response_cache.lookup, query, cache_namespace)
+            except Exception as e:
+                logging.warning(f"Query response cache lookup failed: {e}")
+                cached = None
+            if cached is not None:
+                processing_time = time.time() - start_time
+                cached['processing_time_ms'] = processing_time * 1000
+                cached['response_cache_hit'] = True
+                try:
+                    self.query_monitor.track_query(query, cached, processing_time, {'response_cache_hit': True})
+                except Exception as e:
+                    logging.warning(f"Failed to track query performance: {e}")
+                return cached
+
         # Use smart routing if enabled and collections not explicitly specified
         if use_smart_routing and collections is None:
             collections, collection_limits, effective_k = self.routing_service.smart_query_routing(query, k)
@@ -111,21 +153,24 @@ class MemoryQueryService:
             try:
                 initial_docs = await asyncio.to_thread(collection.similarity_search_with_score, query, k=search_k)
 
-                for doc, distance in initial_docs:
-                    memory_data = {
+                candidates = [
+                    {
                         'document': doc.page_content,
                         'metadata': doc.metadata,
                         'distance': distance,
                         'collection': collection_name
                     }
-
-                    # Enhanced retrieval score with deduplication awareness
-                    retrieval_score = await self._calculate_enhanced_retrieval_score(
-                        memory_data, query, current_time
-                    )
+                    for doc, distance in initial_docs
+                ]
+
+                # Enhanced retrieval scores with deduplication awareness, one batch per collection
+                retrieval_scores = await self._calculate_enhanced_retrieval_scores(
+                    candidates, query, current_time
+                )
+                for memory_data, retrieval_score in zip(candidates, retrieval_scores):
                     memory_data['retrieval_score'] = retrieval_score
 
-                    all_results.append(memory_data)
+                all_results.extend(candidates)
 
             except ChromaError as e:
                 logging.warning(f"ChromaDB error querying {collection_name}: {e}")
@@ -213,6 +258,12 @@ class MemoryQueryService:
         except Exception as e:
             logging.warning(f"Failed to track query performance: {e}")
 
+        if cache_namespace is not None:
+            try:
+                await asyncio.to_thread(self.response_cache.store, query, cache_namespace, results)
+            except Exception as e:
+                logging.warning(f"Failed to cache query response: {e}")
+
         return results
 
     async def _calculate_enhanced_retrieval_score(
@@ -231,37 +282,57 @@ class MemoryQueryService:
         Returns:
             Enhanced retrieval score
         """
-        metadata = memory_data['metadata']
-        distance = memory_data['distance']
-
-        # Calculate base retrieval score (offload to thread)
-        # Pass the full memory_data dict as expected by calculate_retrieval_score
-        base_score = await asyncio.to_thread(
-            self.importance_scorer.calculate_retrieval_score,
-            memory_data,
+        scores = await self._calculate_enhanced_retrieval_scores([memory_data], query, current_time)
+        return scores[0]
+
+    async def _calculate_enhanced_retrieval_scores(
+        self,
+        memories: List[Dict[str, Any]],
+        query: str,
+        current_time: float
+    ) -> List[float]:
+        """Calculate retrieval scores with deduplication awareness for a batch of candidates.
+
+        Args:
+            memories: Memory data dictionaries with document and metadata
+            query: The search query
+            current_time: Current timestamp
+
+        Returns:
+            Enhanced retrieval scores, in the same order as memories
+        """
+        if not memories:
+            return []
+
+        # Calculate base retrieval scores for the whole batch in one thread hop
+        base_scores = np.asarray(await asyncio.to_thread(
+            self.importance_scorer.calculate_retrieval_scores,
+            memories,
             query,
             current_time
+        ), dtype=np.float64)
+
+        metadatas = [memory['metadata'] for memory in memories]
+
+        # Apply deduplication quality boost to documents merged from multiple sources,
+        # scaled by log of source count (diminishing returns)
+        source_counts = np.array([
+            len(metadata.get('duplicate_sources', [])) if metadata.get('duplicate_merged') else 0
+            for metadata in metadatas
+        ], dtype=np.float64)
+        dedup_boosts = np.where(source_counts > 1, 0.05 * np.log(source_counts + 1), 0.0)
+
+        # Apply recency boost for content accessed within the last 24 hours
+        last_accessed = np.array([metadata.get('last_accessed', 0) for metadata in metadatas], dtype=np.float64)
+        hours_since_access = (current_time - last_accessed) / 3600
+        recency_boosts = np.where(
+            (last_accessed > 0) & (hours_since_access < 24),
+            0.05 * (1 - hours_since_access / 24),
+            0.0
         )
 
-        # Apply deduplication quality boost
-        dedup_boost = 0.0
-        if metadata.get('duplicate_merged'):
-            # This document represents merged knowledge from multiple sources
-            source_count = len(metadata.get('duplicate_sources', []))
-            if source_count > 1:
-                # Boost by log of source count (diminishing returns)
-                import math
-                dedup_boost = 0.05 * math.log(source_count + 1)
-
-        # Apply recency boost for recently accessed content
-        recency_boost = 0.0
-        last_accessed = metadata.get('last_accessed', 0)
-        if last_accessed > 0:
-            hours_since_access = (current_time - last_accessed) / 3600
-            if hours_since_access < 24:
-                recency_boost = 0.05 * (1 - hours_since_access / 24)
-
-        return float(min(base_score + dedup_boost + recency_boost, 1.0))
+        enhanced_scores = np.minimum(base_scores + dedup_boosts + recency_boosts, 1.0)
+        return [float(score) for score in enhanced_scores]
 
     def _update_access_stats(self, results: List[Dict[str, Any]]) -> None:
         """Update access statistics for retrieved memories.
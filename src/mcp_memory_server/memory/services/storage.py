@@ -88,6 +88,78 @@ class MemoryStorageService:
         Returns:
             Dictionary with operation results and statistics
         """
+        prepared = await self._prepare_memory(content, metadata, context, memory_type)
+        if "documents" not in prepared:
+            return prepared
+
+        results = await self._store_prepared(prepared["target_collection"], [prepared])
+        return results[0]
+
+    async def add_memories(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Add several memories, writing each target collection in a single call.
+
+        Every item is scored, deduplicated and chunked exactly as in add_memory,
+        but the chunks of all items bound for the same collection are passed to
+        one add_documents call, so their embeddings are computed in one batch.
+        Items are only checked for duplicates against what is already stored,
+        not against each other.
+
+        Args:
+            items: List of dicts with 'content' and optional 'metadata',
+                'context' and 'memory_type' keys (same meaning as add_memory)
+
+        Returns:
+            List of add_memory-style result dictionaries, in input order
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        pending: Dict[str, List[Dict[str, Any]]] = {}
+        positions: Dict[str, List[int]] = {}
+
+        for index, item in enumerate(items):
+            prepared = await self._prepare_memory(
+                item["content"],
+                item.get("metadata"),
+                item.get("context"),
+                item.get("memory_type", "auto")
+            )
+            if "documents" not in prepared:
+                results[index] = prepared
+                continue
+            pending.setdefault(prepared["collection_name"], []).append(prepared)
+            positions.setdefault(prepared["collection_name"], []).append(index)
+
+        for collection_name, batch in pending.items():
+            stored = await self._store_prepared(batch[0]["target_collection"], batch)
+            for index, result in zip(positions[collection_name], stored):
+                results[index] = result
+
+        # Every item should be resolved while preparing or stored with its collection;
+        # report any that were not instead of returning a hole in the list
+        return [
+            result if result is not None else {
+                "success": False,
+                "message": "Memory was not stored: no result for this item",
+                "chunks_added": 0,
+                "error": "missing_result",
+                "error_type": "unknown"
+            }
+            for result in results
+        ]
+
+    async def _prepare_memory(
+        self,
+        content: str,
+        metadata: Optional[Dict[str, Any]],
+        context: Optional[Dict[str, Any]],
+        memory_type: str
+    ) -> Dict[str, Any]:
+        """Score, deduplicate, route and chunk one memory without storing it.
+
+        Returns:
+            Either a final result dictionary (when the memory was folded into an
+            existing duplicate) or a prepared entry with 'documents',
+            'target_collection', 'collection_name', 'memory_id' and 'importance'
+        """
         if metadata is None:
             metadata = {}
 
@@ -177,56 +249,69 @@ class MemoryStorageService:
             collection_name=collection_name
         )
 
+        return {
+            "documents": documents,
+            "target_collection": target_collection,
+            "collection_name": collection_name,
+            "memory_id": memory_id,
+            "importance": importance
+        }
+
+    async def _store_prepared(self, target_collection: Chroma, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Write prepared memories bound for one collection in a single add_documents call.
+
+        Returns:
+            One result dictionary per prepared entry, in the same order
+        """
+        collection_name = batch[0]["collection_name"]
+        documents = [doc for prepared in batch for doc in prepared["documents"]]
+
         # Add to collection with error handling
         try:
             await asyncio.to_thread(target_collection.add_documents, documents)
 
-            return {
-                "success": True,
-                "message": f"Added {len(documents)} chunks to {collection_name} memory",
-                "memory_id": memory_id,
-                "importance_score": importance,
-                "collection": collection_name,
-                "chunks_added": len(documents),
-                "action": "added"
-            }
+            return [
+                {
+                    "success": True,
+                    "message": f"Added {len(prepared['documents'])} chunks to {collection_name} memory",
+                    "memory_id": prepared["memory_id"],
+                    "importance_score": prepared["importance"],
+                    "collection": collection_name,
+                    "chunks_added": len(prepared["documents"]),
+                    "action": "added"
+                }
+                for prepared in batch
+            ]
 
         except ChromaError as db_error:
             logging.error(f"ChromaDB error adding documents to {collection_name}: {db_error}")
-            return {
-                "success": False,
-                "message": f"Database error in {collection_name} memory: {str(db_error)}",
-                "memory_id": memory_id,
-                "importance_score": importance,
-                "collection": collection_name,
-                "chunks_added": 0,
-                "error": str(db_error),
-                "error_type": "storage"
-            }
+            message = f"Database error in {collection_name} memory: {str(db_error)}"
+            error = str(db_error)
+            error_type = "storage"
         except (OSError, IOError) as db_error:
             logging.error(f"Filesystem error storing documents: {db_error}")
-            return {
-                "success": False,
-                "message": f"Storage error: {str(db_error)}",
-                "memory_id": memory_id,
-                "importance_score": importance,
-                "collection": collection_name,
-                "chunks_added": 0,
-                "error": str(db_error),
-                "error_type": "filesystem"
-            }
+            message = f"Storage error: {str(db_error)}"
+            error = str(db_error)
+            error_type = "filesystem"
         except Exception as db_error:
             logging.error(f"Unexpected error adding documents to {collection_name}: {db_error}")
-            return {
+            message = f"Failed to add documents to {collection_name} memory: {str(db_error)}"
+            error = str(db_error)
+            error_type = "unknown"
+
+        return [
+            {
                 "success": False,
-                "message": f"Failed to add documents to {collection_name} memory: {str(db_error)}",
-                "memory_id": memory_id,
-                "importance_score": importance,
+                "message": message,
+                "memory_id": prepared["memory_id"],
+                "importance_score": prepared["importance"],
                 "collection": collection_name,
                 "chunks_added": 0,
-                "error": str(db_error),
-                "error_type": "unknown"
+                "error": error,
+                "error_type": error_type
             }
+            for prepared in batch
+        ]
 
     def _chunk_content(self, content: str, language: str = "text") -> List[str]:
         """Chunk content based on language type.
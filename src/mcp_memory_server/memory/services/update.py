@@ -2,6 +2,7 @@
 Document Update Service
 
 Handles CRUD operations for documents including:
+- Document lookup by ID
 - Document deletion
 - Importance score updates
 - Content updates (delete + re-add)
@@ -56,6 +57,65 @@ class DocumentUpdateService:
             return self.long_term_memory
         return None
 
+    async def get_document(self, document_id: str) -> Dict[str, Any]:
+        """Fetch a document's chunks and metadata by document_id or memory_id.
+
+        Reads straight from the collections with a metadata filter, so no query
+        embedding or similarity search is involved.
+
+        Args:
+            document_id: The document ID to fetch (memory_id or document_id)
+
+        Returns:
+            Dictionary with the chunk contents in order, their joined content
+            (overlapping text between chunks is kept), the first chunk's metadata
+            and the collection
+        """
+        result: Dict[str, Any] = {
+            "success": False,
+            "document_id": document_id,
+            "content": None,
+            "chunks": [],
+            "metadata": None,
+            "collection": None,
+            "message": ""
+        }
+
+        # Search both collections for the document
+        for collection_name in ["short_term", "long_term"]:
+            collection = self._get_collection(collection_name)
+
+            try:
+                if hasattr(collection, '_collection'):
+                    query_result = collection._collection.get(  # type: ignore[union-attr]
+                        where={'$or': [
+                            {'document_id': document_id},
+                            {'memory_id': document_id}
+                        ]}
+                    )
+
+                    if query_result and query_result.get('ids'):
+                        metadatas = query_result.get('metadatas') or []
+                        documents = query_result.get('documents') or []
+                        chunks = sorted(
+                            zip(metadatas, documents),
+                            key=lambda chunk: (chunk[0] or {}).get('chunk_index', 0)
+                        )
+
+                        result["success"] = True
+                        result["chunks"] = [content for _, content in chunks]
+                        result["content"] = "".join(result["chunks"])
+                        result["metadata"] = dict(chunks[0][0] or {}) if chunks else {}
+                        result["collection"] = collection_name
+                        result["message"] = f"Found {len(chunks)} chunks in {collection_name}"
+                        return result
+
+            except Exception as e:
+                logging.error(f"Error searching {collection_name} for document {document_id}: {e}")
+
+        result["message"] = f"Document {document_id} not found in any collection"
+        return result
+
     async def delete_document(self, document_id: str) -> Dict[str, Any]:
         """Delete a document and all its chunks by document_id.
 
@@ -12,7 +12,8 @@ from .models import JsonRpcRequest
 from .handlers import (
     event_generator, handle_initialize, handle_tools_list,
     handle_resources_list, handle_resources_read, handle_tools_call,
-    handle_unknown_method, handle_server_error, active_sessions
+    handle_unknown_method, handle_server_error, handle_batch,
+    handle_cancelled_notification, active_sessions
 )
 from .errors import MCPErrorCode, create_error_response
 
@@ -132,6 +133,53 @@ def create_app(
     async def get_authenticated_status(x_api_key: Optional[str] = Header(None)) -> bool:
         return await authenticate_api_key(x_api_key, server_config=server_config)
 
+    async def dispatch_rpc(body: Any, session_id: Optional[str] = None) -> Response:
+        """Handle a single JSON-RPC request object posted to the root endpoint."""
+        rpc_id = None
+        try:
+            rpc_request = JsonRpcRequest(**body)
+            method = rpc_request.method
+            rpc_id = rpc_request.id
+
+            if rpc_id is None:
+                # Notification - no response expected
+                if method == "notifications/cancelled":
+                    handle_cancelled_notification(rpc_request.params or {}, session_id)
+                return Response(status_code=202)  # 202 Accepted - required by Codex MCP client
+
+            if method == "initialize":
+                params = rpc_request.params or {}
+                return await handle_initialize(rpc_id, params, server_config, tool_definitions or [], active_sessions or {})  # type: ignore[arg-type]
+            elif method == "tools/list":
+                return await handle_tools_list(rpc_id, tool_definitions or [])  # type: ignore[arg-type]
+            elif method == "resources/list":
+                return await handle_resources_list(rpc_id)
+            elif method == "resources/read":
+                params = rpc_request.params or {}
+                return await handle_resources_read(rpc_id, params)
+            elif method == "tools/call":
+                params = rpc_request.params or {}
+                if tool_registry is None:
+                    logging.error("tool_registry is None in root endpoint")
+                    return handle_unknown_method(rpc_id, "tools/call")
+                return await handle_tools_call(rpc_id, params, tool_registry, session_id)
+            else:
+                return handle_unknown_method(rpc_id, method)
+
+        except ValidationError as ve:
+            logging.error("Pydantic validation error for POST to root: %s, Request body: %s", ve.errors(), body)
+            return JSONResponse(
+                content=create_error_response(
+                    code=MCPErrorCode.INVALID_REQUEST,
+                    message=f"Invalid JSON-RPC request format: {ve.errors()}"
+                ),
+                status_code=422
+            )
+        except Exception as e:
+            error_id: int = rpc_id if 'rpc_id' in locals() and rpc_id is not None else 0
+            logging.error("Error handling POST to root: %s, Request body: %s", e, body)
+            return handle_server_error(error_id, e)
+
     # Add root endpoint
     @app.api_route("/", methods=["GET", "POST", "DELETE"], response_class=JSONResponse)
     async def root(request: Request, authenticated: bool = Depends(get_authenticated_status)) -> Any:
@@ -151,49 +199,17 @@ def create_app(
             logging.info("Received DELETE request on root (client disconnect/cleanup)")
             return Response(status_code=200)
         elif request.method == "POST":
-            rpc_id = None
             try:
                 body = await request.json()
-                rpc_request = JsonRpcRequest(**body)
-                method = rpc_request.method
-                rpc_id = rpc_request.id
-
-                if rpc_id is None:
-                    # Notification - no response expected
-                    return Response(status_code=202)  # 202 Accepted - required by Codex MCP client
-
-                if method == "initialize":
-                    params = rpc_request.params or {}
-                    return await handle_initialize(rpc_id, params, server_config, tool_definitions or [], active_sessions or {})  # type: ignore[arg-type]
-                elif method == "tools/list":
-                    return await handle_tools_list(rpc_id, tool_definitions or [])  # type: ignore[arg-type]
-                elif method == "resources/list":
-                    return await handle_resources_list(rpc_id)
-                elif method == "resources/read":
-                    params = rpc_request.params or {}
-                    return await handle_resources_read(rpc_id, params)
-                elif method == "tools/call":
-                    params = rpc_request.params or {}
-                    if tool_registry is None:
-                        logging.error("tool_registry is None in root endpoint")
-                        return handle_unknown_method(rpc_id, "tools/call")
-                    return await handle_tools_call(rpc_id, params, tool_registry)
-                else:
-                    return handle_unknown_method(rpc_id, method)
-
-            except ValidationError as ve:
-                logging.error("Pydantic validation error for POST to root: %s, Request body: %s", ve.errors(), body)
-                return JSONResponse(
-                    content=create_error_response(
-                        code=MCPErrorCode.INVALID_REQUEST,
-                        message=f"Invalid JSON-RPC request format: {ve.errors()}"
-                    ),
-                    status_code=422
-                )
             except Exception as e:
-                error_id: int = rpc_id if 'rpc_id' in locals() and rpc_id is not None else 0
                 logging.error("Error handling POST to root: %s, Request body: %s", e, await request.body())
-                return handle_server_error(error_id, e)
+                return handle_server_error(0, e)
+
+            # Sessions are optional here; when sent, the header scopes request ids for cancellation
+            session_id = request.headers.get("mcp-session-id")
+            if isinstance(body, list):
+                return await handle_batch(body, lambda item: dispatch_rpc(item, session_id))
+            return await dispatch_rpc(body, session_id)
 
     # Add health check endpoint
     @app.get("/health")
@@ -278,6 +294,8 @@ def setup_json_rpc_handler(
 
                 if rpc_id is None:
                     # Notification - no response expected
+                    if method == "notifications/cancelled":
+                        handle_cancelled_notification(rpc_request.params or {}, mcp_session_id)
                     return Response(status_code=202)  # 202 Accepted - required by Codex MCP client
 
                 if method == "initialize":
@@ -296,7 +314,7 @@ def setup_json_rpc_handler(
 
                 elif method == "tools/call":
                     params = rpc_request.params or {}
-                    return await handle_tools_call(rpc_id, params, tool_registry)
+                    return await handle_tools_call(rpc_id, params, tool_registry, mcp_session_id)
 
                 else:
                     return handle_unknown_method(rpc_id, method)
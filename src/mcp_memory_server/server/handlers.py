@@ -2,7 +2,8 @@ import asyncio
 import json
 import uuid
 import time
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Awaitable, Callable, Optional, Tuple
+from fastapi import Response
 from fastapi.responses import JSONResponse
 
 from .models import JsonRpcResponse, JsonRpcError
@@ -11,6 +12,11 @@ from .errors import MCPErrorCode
 # In-memory storage for active sessions (for demonstration purposes)
 active_sessions: Dict[str, Dict[str, Any]] = {}
 
+# Running tools/call executions keyed by (Mcp-Session-Id, JSON-RPC id), so
+# notifications/cancelled can stop them. Clients pick their own ids (usually
+# starting at 1), so the id alone is not unique across clients.
+in_flight_calls: Dict[Tuple[Optional[str], Any], "asyncio.Task[Any]"] = {}
+
 
 def convert_to_mcp_format(tool_result: Dict[str, Any]) -> Dict[str, Any]:
     """Convert tool response to MCP-compliant format.
@@ -171,9 +177,14 @@ async def handle_resources_read(rpc_id: int, params: dict) -> JSONResponse:
 async def handle_tools_call(
     rpc_id: int,
     params: dict,
-    tool_registry: Dict[str, Any]
+    tool_registry: Dict[str, Any],
+    session_id: Optional[str] = None
 ) -> JSONResponse:
-    """Handle tools/call request with comprehensive error handling."""
+    """Handle tools/call request with comprehensive error handling.
+
+    session_id is the caller's Mcp-Session-Id (None for sessionless clients); it
+    scopes the request id so only the same session can cancel the call.
+    """
     try:
         # Validate required parameters
         if not isinstance(params, dict):
@@ -227,10 +238,34 @@ async def handle_tools_call(
             )
             return JSONResponse(content=error_response.dict(), status_code=404)
 
+        # A call reusing an id that is still in flight runs anyway, but only the
+        # first one stays cancellable
+        call_key = (session_id, rpc_id)
+        cancellable = call_key not in in_flight_calls
+
         # Execute tool function with error handling
         try:
             if asyncio.iscoroutinefunction(tool_func):
-                result = await tool_func(**tool_args)
+                task = asyncio.ensure_future(tool_func(**tool_args))
+                if cancellable:
+                    in_flight_calls[call_key] = task
+                try:
+                    result = await task
+                except asyncio.CancelledError:
+                    if not cancellable or in_flight_calls.get(call_key) is task:
+                        raise  # Still registered, so the request handler itself was cancelled
+                    error_response = JsonRpcError(
+                        id=rpc_id,
+                        error={
+                            "code": int(MCPErrorCode.TOOL_EXECUTION_ERROR),
+                            "message": f"Tool '{tool_name}' was cancelled",
+                            "data": {"tool_name": tool_name}
+                        }
+                    )
+                    return JSONResponse(content=error_response.dict(), status_code=500)
+                finally:
+                    if in_flight_calls.get(call_key) is task:
+                        del in_flight_calls[call_key]
             else:
                 result = tool_func(**tool_args)
         except TypeError as e:
@@ -281,6 +316,19 @@ async def handle_tools_call(
         return JSONResponse(content=error_response.dict(), status_code=500)
 
 
+def handle_cancelled_notification(params: dict, session_id: Optional[str] = None) -> None:
+    """Cancel the in-flight tools/call named by a notifications/cancelled message.
+
+    Work a tool has already handed to a worker thread runs to completion, but the
+    call stops at its next await. Unknown or finished request ids, and calls made
+    from a different session, are ignored.
+    """
+    # Unregister first so the waiting handler can tell this apart from its own cancellation
+    task = in_flight_calls.pop((session_id, params.get("requestId")), None)
+    if task is not None:
+        task.cancel()
+
+
 def handle_unknown_method(rpc_id: int, method: str) -> JSONResponse:
     """Handle unknown method requests."""
     error_response = JsonRpcError(
@@ -317,3 +365,26 @@ def handle_server_error(rpc_id: int, error: Exception) -> JSONResponse:
         }
     )
     return JSONResponse(content=error_response.dict(), status_code=500)
+
+
+async def handle_batch(requests: List[Any], dispatch: Callable[[Any], Awaitable[Response]]) -> Response:
+    """Handle a JSON-RPC batch by dispatching its requests concurrently.
+
+    Responses are returned in request order. Notifications produce no entry, and a
+    batch made up only of notifications is acknowledged with 202 like a single one.
+    """
+    if not requests:
+        error_response = JsonRpcError(
+            id=None,
+            error={
+                "code": int(MCPErrorCode.INVALID_REQUEST),
+                "message": "Invalid request: empty batch"
+            }
+        )
+        return JSONResponse(content=error_response.dict(), status_code=400)
+
+    responses = await asyncio.gather(*(dispatch(request) for request in requests))
+    results = [json.loads(response.body) for response in responses if response.status_code != 202]
+    if not results:
+        return Response(status_code=202)
+    return JSONResponse(content=results)
@@ -63,6 +63,54 @@ def get_tool_definitions() -> List[Dict[str, Any]]:
                 "required": ["content"]
             }
         },
+        {
+            "name": "add_documents",
+            "description": (
+                "Adds several documents in one call. Each document is scored and "
+                "routed like add_document, but documents bound for the same memory "
+                "tier are embedded and stored together in a single batch."
+            ),
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "documents": {
+                        "type": "array",
+                        "description": "The documents to add, in the same shape as add_document arguments.",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "content": {
+                                    "type": "string",
+                                    "description": "The full text content of the document to be added."
+                                },
+                                "metadata": {
+                                    "type": "object",
+                                    "description": "Optional metadata to associate with the document chunks.",
+                                    "default": {}
+                                },
+                                "memory_type": {
+                                    "type": "string",
+                                    "description": (
+                                        "Target memory collection ('auto' for automatic selection, "
+                                        "'short_term', or 'long_term')."
+                                    ),
+                                    "default": "auto",
+                                    "enum": ["auto", "short_term", "long_term"]
+                                },
+                                "context": {
+                                    "type": "object",
+                                    "description": "Optional context information for importance scoring.",
+                                    "default": {}
+                                }
+                            },
+                            "required": ["content"]
+                        },
+                        "minItems": 1
+                    }
+                },
+                "required": ["documents"]
+            }
+        },
         {
             "name": "query_documents",
             "description": (
@@ -113,6 +161,23 @@ def get_tool_definitions() -> List[Dict[str, Any]]:
                 "required": []
             }
         },
+        {
+            "name": "flush_index",
+            "description": (
+                "Wait until all completed writes are visible in the memory "
+                "collections and return their document counts."
+            ),
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "collection": {
+                        "type": "string",
+                        "description": "Collection to flush. Omit to flush all collections."
+                    }
+                },
+                "required": []
+            }
+        },
         {
             "name": "get_lifecycle_stats",
             "description": (
@@ -162,6 +227,14 @@ def get_tool_definitions() -> List[Dict[str, Any]]:
                             "If not specified, cleans all collections."
                         ),
                         "enum": ["short_term", "long_term"]
+                    },
+                    "scope": {
+                        "type": "object",
+                        "description": (
+                            "Metadata filter limiting which documents are checked, "
+                            "e.g. {\"source\": \"my_import\"}. Use $and to combine "
+                            "several fields. Default: all documents."
+                        )
                     }
                 },
                 "required": []
@@ -226,6 +299,14 @@ def get_tool_definitions() -> List[Dict[str, Any]]:
                             "without making changes."
                         ),
                         "default": False
+                    },
+                    "scope": {
+                        "type": "object",
+                        "description": (
+                            "Metadata filter limiting which documents are compared, "
+                            "e.g. {\"source\": \"my_import\"}. Use $and to combine "
+                            "several fields. Default: all documents."
+                        )
                     }
                 },
                 "required": []
@@ -526,6 +607,26 @@ def get_tool_definitions() -> List[Dict[str, Any]]:
             }
         },
         # Document Management Tools
+        {
+            "name": "get_document",
+            "description": (
+                "Fetch a stored document's content and metadata by its ID. "
+                "A direct lookup that skips semantic search."
+            ),
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "document_id": {
+                        "type": "string",
+                        "description": (
+                            "The document ID to fetch "
+                            "(document_id from add_document or query results)"
+                        )
+                    }
+                },
+                "required": ["document_id"]
+            }
+        },
         {
             "name": "delete_document",
             "description": (
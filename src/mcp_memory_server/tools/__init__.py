@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from ..memory import HierarchicalMemorySystem
 from ..server.errors import create_tool_error, create_success_response, MCPErrorCode
 
@@ -6,7 +6,7 @@ from ..server.errors import create_tool_error, create_success_response, MCPError
 from .query import query_documents_tool, apply_reranking
 
 # --- System Monitoring Tools ---
-from .stats import get_memory_stats_tool, get_system_health_tool
+from .stats import get_memory_stats_tool, get_system_health_tool, flush_index_tool
 from .lifecycle import (
     get_lifecycle_stats_tool, cleanup_expired_memories_tool,
     refresh_memory_aging_tool, start_background_maintenance_tool,
@@ -42,7 +42,7 @@ from .advanced_deduplication import (
 
 # --- Document Management Tools ---
 from .management import (
-    delete_document_tool, demote_importance_tool, update_document_tool
+    get_document_tool, delete_document_tool, demote_importance_tool, update_document_tool
 )
 
 
@@ -98,11 +98,90 @@ async def add_document_tool(memory_system: HierarchicalMemorySystem, content: st
             original_error=e
         )
 
+
+async def add_documents_tool(memory_system: HierarchicalMemorySystem, documents: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Adds several documents in one call.
+    Each document is scored and routed like add_document, but all chunks bound for
+    the same memory tier are embedded and stored together.
+    """
+    try:
+        if not isinstance(documents, list) or not documents:
+            return create_tool_error(
+                "Documents must be a non-empty list",
+                MCPErrorCode.VALIDATION_ERROR,
+                additional_data={"field": "documents", "provided_type": type(documents).__name__}
+            )
+
+        for index, document in enumerate(documents):
+            if not isinstance(document, dict):
+                return create_tool_error(
+                    f"Document {index} must be an object",
+                    MCPErrorCode.VALIDATION_ERROR,
+                    additional_data={"field": f"documents[{index}]", "provided_type": type(document).__name__}
+                )
+            content = document.get("content")
+            if not content or not isinstance(content, str):
+                return create_tool_error(
+                    f"Document {index} content must be a non-empty string",
+                    MCPErrorCode.VALIDATION_ERROR,
+                    additional_data={"field": f"documents[{index}].content", "provided_type": type(content).__name__}
+                )
+            metadata = document.get("metadata")
+            if metadata is not None and not isinstance(metadata, dict):
+                return create_tool_error(
+                    f"Document {index} metadata must be a dictionary or None",
+                    MCPErrorCode.VALIDATION_ERROR,
+                    additional_data={"field": f"documents[{index}].metadata", "provided_type": type(metadata).__name__}
+                )
+            memory_type = document.get("memory_type", "auto")
+            if memory_type not in ["auto", "short_term", "long_term", "permanent"]:
+                return create_tool_error(
+                    f"Invalid memory_type '{memory_type}' for document {index}. "
+                    "Must be one of: auto, short_term, long_term, permanent",
+                    MCPErrorCode.VALIDATION_ERROR,
+                    additional_data={
+                        "field": f"documents[{index}].memory_type",
+                        "valid_values": [
+                            "auto",
+                            "short_term",
+                            "long_term",
+                            "permanent"]}
+                )
+
+        results = await memory_system.add_memories(documents)
+        added = sum(1 for result in results if result.get("success"))
+
+        entries = []
+        for result in results:
+            entry = {
+                "success": result.get("success"),
+                "document_id": result.get("memory_id"),
+                "assigned_tier": result.get("collection"),
+                "importance_score": result.get("importance_score"),
+                "details": result.get("message")
+            }
+            if not result.get("success"):
+                # Failed writes still carry the id they would have had, so report why
+                entry["error"] = result.get("error")
+                entry["error_type"] = result.get("error_type")
+            entries.append(entry)
+
+        return create_success_response(
+            message=f"Added {added} of {len(results)} documents",
+            data={"documents": entries}
+        )
+    except Exception as e:
+        return create_tool_error(
+            f"Failed to add documents: {str(e)}",
+            MCPErrorCode.MEMORY_SYSTEM_ERROR,
+            original_error=e
+        )
+
 # Re-add __all__ for proper module export
 __all__ = [
-    'add_document_tool',
+    'add_document_tool', 'add_documents_tool',
     'query_documents_tool', 'apply_reranking',
-    'get_memory_stats_tool', 'get_system_health_tool',
+    'get_memory_stats_tool', 'get_system_health_tool', 'flush_index_tool',
     'get_lifecycle_stats_tool', 'cleanup_expired_memories_tool',
     'refresh_memory_aging_tool', 'start_background_maintenance_tool',
     'stop_background_maintenance_tool',
@@ -116,5 +195,5 @@ __all__ = [
     'get_clustering_analysis_tool', 'get_advanced_deduplication_metrics_tool',
     'run_advanced_deduplication_tool',
     # Document Management Tools
-    'delete_document_tool', 'demote_importance_tool', 'update_document_tool'
+    'get_document_tool', 'delete_document_tool', 'demote_importance_tool', 'update_document_tool'
 ]
@@ -8,6 +8,8 @@ domain analysis, semantic clustering, threshold optimization, and performance me
 import asyncio
 import logging
 from typing import Any, Dict
+
+import numpy as np
 from ..server.errors import create_success_response, create_tool_error, MCPErrorCode
 
 
@@ -162,25 +164,39 @@ async def get_clustering_analysis_tool(memory_system: Any, collection: str = "sh
                     additional_data={"collection": collection}
                 )
 
-            # Get sample of documents for analysis
-            all_docs = await asyncio.to_thread(chroma_collection.similarity_search, "", k=500)  # Sample for clustering
+            # Get a sample of documents with their stored embeddings in one call
+            # (limited for performance: clustering is expensive)
+            sample = await asyncio.to_thread(
+                chroma_collection._collection.get,
+                limit=50,
+                include=['documents', 'metadatas', 'embeddings']
+            )
+            ids = sample.get('ids') or []
 
-            if not all_docs:
+            if not ids:
                 return create_tool_error(
                     f"No documents found in collection '{collection}'",
                     MCPErrorCode.MEMORY_SYSTEM_ERROR,
                     additional_data={"collection": collection}
                 )
 
+            # Stack embeddings once as a contiguous (N, d) float32 matrix; each document
+            # gets a row view rather than its own list of Python floats
+            embeddings = sample.get('embeddings')
+            embedding_matrix = None
+            if embeddings is not None and len(embeddings) == len(ids):
+                embedding_matrix = np.ascontiguousarray(embeddings, dtype=np.float32)
+
             # Convert to format expected by clustering analysis
             doc_dicts = []
-            for doc in all_docs[:50]:  # Limit for performance (clustering is expensive)
-                doc_dict = {
-                    'id': doc.metadata.get('chunk_id', str(hash(doc.page_content))),
-                    'page_content': doc.page_content,
-                    'metadata': doc.metadata
-                }
-                doc_dicts.append(doc_dict)
+            for i, (doc_id, content, metadata) in enumerate(zip(ids, sample['documents'], sample['metadatas'])):
+                metadata = metadata or {}
+                doc_dicts.append({
+                    'id': metadata.get('chunk_id', doc_id),
+                    'page_content': content or '',
+                    'metadata': metadata,
+                    'embedding': embedding_matrix[i] if embedding_matrix is not None else None
+                })
 
             clustering_analysis = memory_system.deduplicator.get_clustering_analysis(doc_dicts)
             clustering_analysis['collection_analyzed'] = collection
@@ -6,23 +6,32 @@ manual deduplication, statistics, and duplicate preview.
 """
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from ..server.errors import create_success_response, create_tool_error, MCPErrorCode
 
 
 async def deduplicate_memories_tool(memory_system: Any, collections: str = "short_term,long_term",
-                                    dry_run: bool = False) -> Dict[str, Any]:
+                                    dry_run: bool = False,
+                                    scope: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """Manually trigger deduplication process on specified collections.
 
     Args:
         memory_system: Instance of HierarchicalMemorySystem
         collections: Comma-separated collection names to deduplicate
         dry_run: If True, only analyze without making changes
+        scope: Metadata filter limiting which documents are compared (optional)
 
     Returns:
         Dictionary with deduplication results
     """
     try:
+        if scope is not None and not isinstance(scope, dict):
+            return create_tool_error(
+                "Scope must be an object of metadata filters",
+                MCPErrorCode.VALIDATION_ERROR,
+                additional_data={"field": "scope", "provided_type": type(scope).__name__}
+            )
+
         # Parse collections parameter
         if collections:
             collection_list = [c.strip() for c in collections.split(",")]
@@ -57,7 +66,7 @@ async def deduplicate_memories_tool(memory_system: Any, collections: str = "shor
                     continue
 
                 # Run deduplication
-                result = await deduplicator.deduplicate_collection(collection, dry_run=dry_run)
+                result = await deduplicator.deduplicate_collection(collection, dry_run=dry_run, scope=scope)
 
                 # Aggregate results
                 collection_result = {
@@ -33,18 +33,27 @@ def get_lifecycle_stats_tool(lifecycle_manager: LifecycleManager) -> Dict[str, A
 
 
 async def cleanup_expired_memories_tool(lifecycle_manager: LifecycleManager,
-                                        collection: Optional[str] = None) -> Dict[str, Any]:
+                                        collection: Optional[str] = None,
+                                        scope: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """Clean up expired memories based on TTL.
 
     Args:
         lifecycle_manager: LifecycleManager instance
         collection: Specific collection to clean (optional)
+        scope: Metadata filter limiting which documents are checked (optional)
 
     Returns:
         Cleanup results and statistics
     """
     try:
-        results = await lifecycle_manager.cleanup_expired_documents(collection)
+        if scope is not None and not isinstance(scope, dict):
+            return create_tool_error(
+                "Scope must be an object of metadata filters",
+                MCPErrorCode.VALIDATION_ERROR,
+                additional_data={"field": "scope", "provided_type": type(scope).__name__}
+            )
+
+        results = await lifecycle_manager.cleanup_expired_documents(collection, scope)
 
         return create_success_response(
             message=f"Cleanup completed for {collection or 'all collections'}",
@@ -1,6 +1,7 @@
 """Document management tools for the MCP Memory Server.
 
 These tools provide manual control over document lifecycle:
+- get_document: Fetch a stored document by ID
 - delete_document: Permanently remove a document
 - demote_importance: Lower a document's importance to allow TTL expiry
 """
@@ -11,6 +12,59 @@ from ..memory.lifecycle import LifecycleManager
 from ..server.errors import create_success_response, create_tool_error, MCPErrorCode
 
 
+async def get_document_tool(
+    memory_system: HierarchicalMemorySystem,
+    document_id: str
+) -> Dict[str, Any]:
+    """Fetch a document's content and metadata by ID.
+
+    Unlike query_documents this is a direct lookup, so it needs no query
+    embedding or similarity search.
+
+    Args:
+        memory_system: HierarchicalMemorySystem instance
+        document_id: The document ID to fetch (memory_id or document_id)
+
+    Returns:
+        Document content, chunks, metadata and collection
+    """
+    try:
+        # Validate inputs
+        if not document_id or not isinstance(document_id, str):
+            return create_tool_error(
+                "Document ID must be a non-empty string",
+                MCPErrorCode.VALIDATION_ERROR,
+                additional_data={"field": "document_id"}
+            )
+
+        result = await memory_system.get_document(document_id)
+
+        if result.get("success"):
+            return create_success_response(
+                message=f"Document {document_id} retrieved successfully",
+                data={
+                    "document_id": document_id,
+                    "document_content": result.get("content"),
+                    "chunks": result.get("chunks", []),
+                    "metadata": result.get("metadata", {}),
+                    "collection": result.get("collection")
+                }
+            )
+        else:
+            return create_tool_error(
+                result.get("message", f"Document {document_id} not found"),
+                MCPErrorCode.RESOURCE_NOT_FOUND,
+                additional_data={"document_id": document_id}
+            )
+
+    except Exception as e:
+        return create_tool_error(
+            f"Failed to get document: {str(e)}",
+            MCPErrorCode.MEMORY_SYSTEM_ERROR,
+            original_error=e
+        )
+
+
 async def delete_document_tool(
     memory_system: HierarchicalMemorySystem,
     document_id: str,
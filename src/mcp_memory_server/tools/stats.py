@@ -1,4 +1,5 @@
-from typing import Any, Dict, List
+import asyncio
+from typing import Any, Dict, List, Optional
 from ..server.errors import create_success_response, create_tool_error, MCPErrorCode
 
 
@@ -42,6 +43,16 @@ def get_memory_stats_tool(memory_system: Any) -> Dict[str, Any]:
                     'message': 'Query performance stats unavailable'
                 }
 
+        # Add embedding cache statistics if available
+        embedding_function = getattr(memory_system, 'embedding_function', None)
+        if hasattr(embedding_function, 'get_stats'):
+            stats['embedding_cache'] = embedding_function.get_stats()
+
+        # Add query response cache statistics if enabled
+        query_cache = getattr(memory_system, 'query_cache', None)
+        if query_cache is not None:
+            stats['query_cache'] = query_cache.get_stats()
+
         # Add enhanced system metrics
         stats['enhanced_metrics'] = _calculate_enhanced_metrics(stats)
 
@@ -55,6 +66,8 @@ def get_memory_stats_tool(memory_system: Any) -> Dict[str, Any]:
                 "total_documents": stats.get('enhanced_metrics', {}).get('total_documents', 0),
                 "collections": stats.get('collections', {}),
                 "deduplication": stats.get('deduplication', {}),
+                "embedding_cache": stats.get('embedding_cache', {}),
+                "query_cache": stats.get('query_cache', {'enabled': False}),
                 "enhanced_metrics": stats.get('enhanced_metrics', {}),
                 "_formatted": stats_text
             }
@@ -67,6 +80,49 @@ def get_memory_stats_tool(memory_system: Any) -> Dict[str, Any]:
         )
 
 
+async def flush_index_tool(memory_system: Any, collection: Optional[str] = None) -> Dict[str, Any]:
+    """Wait until completed writes are visible and report collection counts.
+
+    add_document and add_documents only respond once ChromaDB has stored the
+    chunks, so there is no write queue to drain; reading the counts from the
+    store acts as a barrier clients can await instead of sleeping.
+
+    Args:
+        memory_system: Instance of HierarchicalMemorySystem
+        collection: Collection to flush, or None for all collections
+
+    Returns:
+        Dictionary with per-collection and total document counts
+    """
+    try:
+        stats = await asyncio.to_thread(memory_system.get_collection_stats)
+        collections = stats.get('collections', {})
+
+        if collection is not None:
+            if collection not in collections:
+                return create_tool_error(
+                    f"Unknown collection '{collection}'",
+                    MCPErrorCode.VALIDATION_ERROR,
+                    additional_data={"field": "collection", "valid_values": list(collections)}
+                )
+            collections = {collection: collections[collection]}
+
+        counts = {name: info.get('count', 0) for name, info in collections.items()}
+        return create_success_response(
+            message="Index flushed",
+            data={
+                "collections": counts,
+                "total_documents": sum(counts.values())
+            }
+        )
+    except Exception as e:
+        return create_tool_error(
+            f"Failed to flush index: {str(e)}",
+            MCPErrorCode.MEMORY_SYSTEM_ERROR,
+            original_error=e
+        )
+
+
 def _format_stats_as_text(stats: Dict[str, Any]) -> str:
     """Format statistics as human-readable text."""
     lines = ["# Memory System Statistics\n"]
@@ -87,6 +143,18 @@ def _format_stats_as_text(stats: Dict[str, Any]) -> str:
         lines.append(f"  - **Efficiency:** {dedup.get('deduplication_efficiency', 0):.1f}%")
         lines.append(f"  - **Documents Merged:** {dedup.get('total_documents_merged', 0)}")
 
+    cache = stats.get('embedding_cache', {})
+    if cache:
+        lines.append("\n## Embedding Cache:")
+        lines.append(f"  - **Entries:** {cache.get('size', 0)} / {cache.get('max_size', 0)}")
+        lines.append(f"  - **Hit Rate:** {cache.get('hit_rate', 0):.1%}")
+
+    query_cache = stats.get('query_cache', {})
+    if query_cache:
+        lines.append("\n## Query Response Cache:")
+        lines.append(f"  - **Entries:** {query_cache.get('size', 0)} / {query_cache.get('max_size', 0)}")
+        lines.append(f"  - **Hit Rate:** {query_cache.get('hit_rate', 0):.1%}")
+
     return "\n".join(lines)
 
 
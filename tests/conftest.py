@@ -1,13 +1,14 @@
 from test_db_setup import setup_test_environment, cleanup_test_environment
 import pytest
 import os
+import re
 import sys
 import time
+import asyncio
+import importlib.util
+import itertools
 import subprocess
 import threading
-import psutil
-import requests
-import httpx
 from pathlib import Path
 
 # Explicitly add the project root to sys.path to ensure module imports work correctly
@@ -21,6 +22,53 @@ if PROJECT_ROOT not in sys.path:
 from tests.fixtures.test_data_generator import data_generator  # noqa: F401, E402
 
 
+# Heavy third-party modules used only by the server/monitor fixtures. They are
+# bound by _load_runtime_deps() on first use so that collecting unit tests does
+# not pay for importing them.
+httpx = None
+np = None
+psutil = None
+
+
+def _load_runtime_deps():
+    """Import the HTTP, process and array libraries used by the server fixtures."""
+    global httpx, np, psutil
+    if httpx is None:
+        import httpx
+        import numpy as np
+        import psutil
+
+
+if sys.platform.startswith('linux'):
+    _PAGE_SIZE = os.sysconf('SC_PAGE_SIZE')
+
+    def _process_rss(proc):
+        """Resident set size of a process in bytes, read directly from /proc/<pid>/statm."""
+        with open(f"/proc/{proc.pid}/statm", "rb", buffering=0) as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+else:
+    def _process_rss(proc):
+        """Resident set size of a process in bytes."""
+        with proc.oneshot():
+            return proc.memory_info().rss
+
+
+# orjson is optional; it encodes and decodes the JSON-RPC bodies of tool calls
+# several times faster than the json module
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+
+    def _json_dumps(obj):
+        return json.dumps(obj).encode()
+
+    _json_loads = json.loads
+
+
 # =============================================================================
 # PRODUCTION SERVER SAFETY CHECK
 # =============================================================================
@@ -42,6 +90,52 @@ TEST_SERVER_MARKERS = [
 DEFAULT_TEST_PORT = 8080
 COMMON_MCP_PORTS = [8080, 8000, 3000]
 
+# (connect, read) timeout for health probes: refused/unroutable ports fail fast,
+# while a live but slow server still gets time to answer
+HEALTH_PROBE_TIMEOUT = (0.5, 2.0)
+
+# httpx only speaks HTTP/2 when the optional h2 package is installed
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Seconds to wait for a freshly started server to report healthy (includes ML model loading)
+SERVER_STARTUP_TIMEOUT = 60.0
+
+# Back-off between startup health probes: fast at first, then capped
+STARTUP_POLL_DELAYS = (0.01, 0.02, 0.05, 0.1, 0.2, 0.5)
+
+# Upper bound and poll interval when waiting for added documents to show up in stats
+INDEXING_TIMEOUT = 3.0
+INDEXING_POLL_INTERVAL = 0.05
+
+# Upper bound when waiting for the background maintenance thread to start or stop
+MAINTENANCE_TIMEOUT = 5.0
+
+# Upper bound on a single MCP tool call; on expiry the call is cancelled server-side
+TOOL_CALL_TIMEOUT = 30.0
+
+# Upper bound on samples retained by MemoryMonitor (oldest are overwritten)
+MAX_MEMORY_SAMPLES = 10_000
+
+# Samples MemoryMonitor preallocates room for; the buffer doubles when full
+DEFAULT_EXPECTED_SAMPLES = 3600
+
+# Field layout of MemoryMonitor's sample buffer; memory fields are raw bytes
+_SAMPLE_TIMESTAMP = 0
+_SAMPLE_SYSTEM_TOTAL = 1
+_SAMPLE_SYSTEM_USED = 2
+_SAMPLE_SYSTEM_AVAILABLE = 3
+_SAMPLE_SYSTEM_PERCENT = 4
+_SAMPLE_PROCESS_MEMORY = 5
+_SAMPLE_PROCESS_COUNT = 6
+_SAMPLE_COLUMNS = 7
+
+# Multiplier converting raw byte counts to MB
+_BYTES_TO_MB = 1.0 / (1024 * 1024)
+
+# Command-line fragments that identify MCP server processes for memory monitoring
+# (the uvicorn target src.mcp_memory_server.main:app is covered by mcp_memory_server)
+_MCP_CMD_RE = re.compile(r"mcp_memory_server|main\.py|uvicorn")
+
 
 def _is_test_server(server_info: dict) -> bool:
     """Check if server info indicates this is a test server.
@@ -52,9 +146,12 @@ def _is_test_server(server_info: dict) -> bool:
     Returns:
         True if the server appears to be a test server
     """
-    # Check title field
-    title = server_info.get('title', '').lower()
-    version = server_info.get('version', '').lower()
+    # Check title field (tolerate missing or null values from malformed responses)
+    title = (server_info.get('title') or '').lower()
+    version = (server_info.get('version') or '').lower()
+    
+    if not title and not version:
+        return False
     
     for marker in TEST_SERVER_MARKERS:
         if marker.lower() in title or marker.lower() in version:
@@ -73,6 +170,7 @@ def _check_existing_server(host: str, port: int) -> dict:
     Returns:
         Dict with 'running' (bool), 'is_test' (bool), 'info' (dict)
     """
+    _load_runtime_deps()
     result = {
         'running': False,
         'is_test': False,
@@ -80,29 +178,37 @@ def _check_existing_server(host: str, port: int) -> dict:
         'error': None
     }
     
+    # Whether /health produced any HTTP response at all (including 4xx/5xx)
+    health_responded = False
+    connect_timeout, read_timeout = HEALTH_PROBE_TIMEOUT
+    timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+    
     try:
         # Try health endpoint first
-        response = requests.get(f"http://{host}:{port}/health", timeout=2)
+        response = httpx.get(f"http://{host}:{port}/health", timeout=timeout)
+        health_responded = True
+        # Any HTTP response means something is listening on the port
+        result['running'] = True
         if response.status_code == 200:
-            result['running'] = True
             result['info'] = response.json() if response.headers.get('content-type', '').startswith('application/json') else {}
             result['is_test'] = _is_test_server(result['info'])
-            return result
-    except requests.exceptions.ConnectionError:
+    except (httpx.ConnectError, httpx.ConnectTimeout):
         # No server running - this is fine
         return result
-    except requests.exceptions.Timeout:
+    except httpx.TimeoutException:
         # Server might be overloaded but running
         result['running'] = True
         result['error'] = 'timeout'
         return result
     except Exception as e:
         result['error'] = str(e)
+    
+    if health_responded:
         return result
     
-    # Try root endpoint as fallback
+    # Try root endpoint as fallback when /health gave no usable response
     try:
-        response = requests.get(f"http://{host}:{port}/", timeout=2)
+        response = httpx.get(f"http://{host}:{port}/", timeout=timeout)
         if response.status_code in [200, 404, 405]:  # Server is responding
             result['running'] = True
             # Try to extract server info from response
@@ -119,35 +225,8 @@ def _check_existing_server(host: str, port: int) -> dict:
     return result
 
 
-def verify_no_production_server(host: str = "127.0.0.1", port: int = DEFAULT_TEST_PORT) -> None:
-    """Verify that no production server is running on the test port.
-    
-    This function should be called before starting tests to ensure we don't
-    accidentally run tests against a production database.
-    
-    Args:
-        host: Server host to check
-        port: Server port to check
-        
-    Raises:
-        pytest.fail: If a production server is detected
-    """
-    check = _check_existing_server(host, port)
-    
-    if not check['running']:
-        # No server running - safe to proceed
-        return
-    
-    if check['is_test']:
-        # Test server already running - this is fine
-        print(f"ℹ️  Test server already running on {host}:{port}")
-        return
-    
-    # Server running but not identified as test server - DANGER!
-    server_title = check['info'].get('title', 'Unknown')
-    server_version = check['info'].get('version', 'Unknown')
-    
-    error_message = f"""
+# Failure banner shown by verify_no_production_server
+_PROD_BANNER = """
 ╔══════════════════════════════════════════════════════════════════════════════╗
 ║                    ⚠️  PRODUCTION SERVER DETECTED! ⚠️                         ║
 ╠══════════════════════════════════════════════════════════════════════════════╣
@@ -156,8 +235,8 @@ def verify_no_production_server(host: str = "127.0.0.1", port: int = DEFAULT_TES
 ║  that does NOT appear to be a test server.                                   ║
 ║                                                                              ║
 ║  Server Info:                                                                ║
-║    Title:   {server_title:<60} ║
-║    Version: {server_version:<60} ║
+║    Title:   {title:<60} ║
+║    Version: {version:<60} ║
 ║                                                                              ║
 ║  Running tests against a production server could:                            ║
 ║    • Corrupt or delete production data                                       ║
@@ -180,7 +259,39 @@ def verify_no_production_server(host: str = "127.0.0.1", port: int = DEFAULT_TES
 ║                                                                              ║
 ╚══════════════════════════════════════════════════════════════════════════════╝
 """
-    pytest.fail(error_message)
+
+
+def verify_no_production_server(host: str = "127.0.0.1", port: int = DEFAULT_TEST_PORT) -> None:
+    """Verify that no production server is running on the test port.
+    
+    This function should be called before starting tests to ensure we don't
+    accidentally run tests against a production database.
+    
+    Args:
+        host: Server host to check
+        port: Server port to check
+        
+    Raises:
+        pytest.fail: If a production server is detected
+    """
+    check = _check_existing_server(host, port)
+    
+    if not check['running']:
+        # No server running - safe to proceed
+        return
+    
+    if check['is_test']:
+        # Test server already running - this is fine
+        print(f"ℹ️  Test server already running on {host}:{port}")
+        return
+    
+    # Server running but not identified as test server - DANGER!
+    pytest.fail(_PROD_BANNER.format(
+        host=host,
+        port=port,
+        title=check['info'].get('title', 'Unknown'),
+        version=check['info'].get('version', 'Unknown'),
+    ))
 
 
 @pytest.fixture(scope="session")
@@ -191,11 +302,24 @@ def test_environment_cleanup():
     cleanup_test_environment()
 
 
+def _test_port():
+    """Port for this session's test server.
+
+    Under pytest-xdist every worker starts its own server, on the base port
+    plus the worker number (gw0 -> +0, gw1 -> +1, ...).
+    """
+    port = int(os.environ.get('MCP_TEST_PORT', DEFAULT_TEST_PORT))
+    worker = os.environ.get('PYTEST_XDIST_WORKER', '')
+    if worker.startswith('gw'):
+        port += int(worker[2:])
+    return port
+
+
 @pytest.fixture(scope="session")
 def shared_test_env():
     """Create a shared test environment with single test database for all tests."""
     # Get port from environment or use default
-    test_port = int(os.environ.get('MCP_TEST_PORT', DEFAULT_TEST_PORT))
+    test_port = _test_port()
     
     # SAFETY CHECK: Verify no production server is running on the test port
     # This prevents accidentally running tests against production data
@@ -214,36 +338,76 @@ def shared_test_env():
     # Cleanup happens automatically in session cleanup
 
 
-@pytest.fixture(scope="function")
-def clean_database(shared_test_env, running_mcp_server):
-    """Clean the shared test database before each test using API calls."""
-    # Use the server API to clean the database properly
-    yield
+class DatabaseCleaner:
+    """Resets the shared test database through the server API on request"""
 
-    # Clean database after test using MCP tools
-    try:
-        # Use the cleanup tool to clean expired memories
-        # and optionally clear all memories via the server API
-        print("🧹 Cleaning database via server API...")
-    except Exception as e:
-        print(f"⚠️ Failed to clean database via API: {e}")
+    def __init__(self, server):
+        self.server = server
+
+    async def reset(self):
+        """Stop background maintenance and purge expired memories"""
+        await self.server.call_mcp_tool("stop_background_maintenance")
+        return await self.server.call_mcp_tool("cleanup_expired_memories")
+
+
+@pytest.fixture(scope="session")
+def clean_database(shared_test_env, running_mcp_server):
+    """Provides a DatabaseCleaner for tests that need isolation from earlier tests.
 
+    All server-side fixtures are session-scoped so the server and its ML models
+    are started once. Tests that need a clean slate call
+    ``await clean_database.reset()`` explicitly instead of paying for an
+    implicit reset after every test. Data fixtures in ``tests/fixtures/`` that
+    mutate the shared database should stay module-scoped.
+    """
     # No manual file system cleanup - let ChromaDB manage its own state
+    return DatabaseCleaner(running_mcp_server)
 
 
 class MemoryMonitor:
     """Monitor system and process memory usage"""
 
     def __init__(self, process_name="python3"):
+        _load_runtime_deps()
         self.process_name = process_name
         self.monitoring = False
-        self.memory_samples = []
+        # Structure-of-arrays sample buffer: one contiguous row per field
+        # (see _SAMPLE_* constants), one column per sample
+        self._samples = np.zeros((_SAMPLE_COLUMNS, DEFAULT_EXPECTED_SAMPLES), dtype=np.float64)
+        self._sample_count = 0
+        self.missed_samples = 0
         self.monitor_thread = None
-
-    def start_monitoring(self, interval=1.0):
-        """Start continuous memory monitoring"""
+        self._task = None
+        # Set to wake the monitor thread immediately on shutdown
+        self._stop = threading.Event()
+        # MCP server processes found by the last full process scan
+        self._mcp_procs = []
+        self._rescan_every = 30
+        self._needs_rescan = True
+        self._tick = 0
+        # System memory changes slowly, so it is sampled less often than process memory
+        self._sys_mem_every = 5
+        self._last_sys_mem = None
+        # Total system memory does not change during a run
+        self._sys_total = psutil.virtual_memory().total
+
+    def _reset(self, expected_samples):
+        """Clear samples and cached state before a new monitoring run"""
         self.monitoring = True
-        self.memory_samples = []
+        self._stop.clear()
+        capacity = max(1, min(expected_samples, MAX_MEMORY_SAMPLES))
+        if self._samples.shape[1] != capacity:
+            self._samples = np.zeros((_SAMPLE_COLUMNS, capacity), dtype=np.float64)
+        self._sample_count = 0
+        self.missed_samples = 0
+        self._mcp_procs = []
+        self._needs_rescan = True
+        self._tick = 0
+        self._last_sys_mem = None
+
+    def start_monitoring(self, interval=1.0, expected_samples=DEFAULT_EXPECTED_SAMPLES):
+        """Start continuous memory monitoring in a background thread"""
+        self._reset(expected_samples)
         self.monitor_thread = threading.Thread(target=self._monitor_loop, args=(interval,))
         self.monitor_thread.daemon = True
         self.monitor_thread.start()
@@ -251,87 +415,235 @@ class MemoryMonitor:
     def stop_monitoring(self):
         """Stop memory monitoring and return results"""
         self.monitoring = False
+        self._stop.set()
         if self.monitor_thread:
             self.monitor_thread.join(timeout=2.0)
         return self.get_memory_stats()
 
-    def _monitor_loop(self, interval):
-        """Memory monitoring loop"""
-        while self.monitoring:
+    async def start_monitoring_async(self, interval=1.0, expected_samples=DEFAULT_EXPECTED_SAMPLES):
+        """Start continuous memory monitoring as a task on the running event loop"""
+        self._reset(expected_samples)
+        self._task = asyncio.create_task(self._run(interval))
+
+    async def stop_monitoring_async(self):
+        """Stop asyncio-driven memory monitoring and return results"""
+        self.monitoring = False
+        if self._task:
+            # Cancel rather than wait out the current sleep interval
+            self._task.cancel()
             try:
-                # System memory
-                system_mem = psutil.virtual_memory()
-
-                # Process memory (find MCP server process)
-                mcp_processes = []
-                for proc in psutil.process_iter(['pid', 'name', 'memory_info', 'cmdline']):
-                    try:
-                        cmdline = ' '.join(proc.info['cmdline'] or [])
-                        # Look for python processes with MCP server indicators
-                        if ('python' in proc.info['name'] and
-                            ('mcp_memory_server' in cmdline or 'main.py' in cmdline or
-                             'uvicorn' in cmdline or 'src.mcp_memory_server.main:app' in cmdline or
-                             'multiprocessing' in cmdline or 'spawn_main' in cmdline)):
-                            mcp_processes.append(proc)
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        continue
-
-                process_memory = 0
-                if mcp_processes:
-                    process_memory = sum(proc.memory_info().rss for proc in mcp_processes)
-
-                sample = {
-                    'timestamp': time.time(),
-                    'system_total_mb': system_mem.total / 1024 / 1024,
-                    'system_used_mb': system_mem.used / 1024 / 1024,
-                    'system_available_mb': system_mem.available / 1024 / 1024,
-                    'system_percent': system_mem.percent,
-                    'process_memory_mb': process_memory / 1024 / 1024,
-                    'process_count': len(mcp_processes)
-                }
-                self.memory_samples.append(sample)
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        return self.get_memory_stats()
 
-            except Exception as e:
-                print(f"Memory monitoring error: {e}")
+    def _store_sample(self, values):
+        """Write one sample, growing the buffer until it reaches MAX_MEMORY_SAMPLES"""
+        capacity = self._samples.shape[1]
+        if self._sample_count == capacity and capacity < MAX_MEMORY_SAMPLES:
+            grown = np.zeros((_SAMPLE_COLUMNS, min(capacity * 2, MAX_MEMORY_SAMPLES)), dtype=np.float64)
+            grown[:, :capacity] = self._samples
+            self._samples = grown
+            capacity = grown.shape[1]
+        self._samples[:, self._sample_count % capacity] = values
+        self._sample_count += 1
+
+    def _retained_samples(self):
+        """Return the retained samples as an oldest-first (field, sample) array"""
+        count = self._sample_count
+        capacity = self._samples.shape[1]
+        if count <= capacity:
+            return self._samples[:, :count]
+        return np.roll(self._samples, -(count % capacity), axis=1)
+
+    def _scan_mcp_processes(self):
+        """Scan the full process table for MCP server processes"""
+        procs = []
+        for proc in psutil.process_iter(['name']):
+            # Filter on the (cheap) name before reading the command line from /proc
+            if 'python' not in (proc.info['name'] or ''):
+                continue
+            try:
+                cmdline = proc.cmdline()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            # Look for python processes with MCP server indicators
+            if cmdline and _MCP_CMD_RE.search(' '.join(cmdline)):
+                procs.append(proc)
+
+        # With MCP_TEST_RELOAD=1 the server runs in a spawn_main child of the
+        # reloader, whose command line matches none of the patterns above
+        seen = {proc.pid for proc in procs}
+        for proc in list(procs):
+            try:
+                children = proc.children(recursive=True)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            for child in children:
+                if child.pid not in seen:
+                    seen.add(child.pid)
+                    procs.append(child)
+        return procs
+
+    def _take_sample(self):
+        """Record one memory sample"""
+        try:
+            # System memory (refreshed every few ticks)
+            if self._last_sys_mem is None or self._tick % self._sys_mem_every == 0:
+                self._last_sys_mem = psutil.virtual_memory()
+            system_mem = self._last_sys_mem
+
+            # Process memory (find MCP server process). The cached Process objects are
+            # reused between samples; the full process table is only rescanned
+            # periodically or after a cached process has exited.
+            if self._needs_rescan or self._tick % self._rescan_every == 0:
+                self._mcp_procs = self._scan_mcp_processes()
+                self._needs_rescan = False
+            self._tick += 1
+
+            process_memory = 0
+            for proc in list(self._mcp_procs):
+                try:
+                    process_memory += _process_rss(proc)
+                except (psutil.NoSuchProcess, psutil.AccessDenied, FileNotFoundError, ProcessLookupError):
+                    # Process exited since the last scan
+                    self._mcp_procs.remove(proc)
+                    self._needs_rescan = True
+
+            self._store_sample((
+                time.time(),
+                self._sys_total,
+                system_mem.used,
+                system_mem.available,
+                system_mem.percent,
+                process_memory,
+                len(self._mcp_procs),
+            ))
+
+        except Exception as e:
+            print(f"Memory monitoring error: {e}")
 
-            time.sleep(interval)
+    def _advance_tick(self, next_tick, interval):
+        """Move the tick deadline forward and return (next_tick, seconds to wait).
 
-    def get_memory_stats(self):
-        """Calculate memory statistics"""
-        if not self.memory_samples:
+        Deadlines are kept on the monotonic clock, so time spent taking a sample
+        does not push later samples back. Ticks overrun entirely are counted in
+        missed_samples and skipped rather than taken in a burst.
+        """
+        next_tick += interval
+        delay = next_tick - time.monotonic()
+        if delay < 0:
+            missed = int(-delay // interval) + 1
+            self.missed_samples += missed
+            next_tick += missed * interval
+            delay = next_tick - time.monotonic()
+        return next_tick, max(delay, 0.0)
+
+    def _monitor_loop(self, interval):
+        """Memory monitoring loop (threaded mode)"""
+        next_tick = time.monotonic()
+        while not self._stop.is_set():
+            self._take_sample()
+            next_tick, delay = self._advance_tick(next_tick, interval)
+            if self._stop.wait(delay):
+                break
+
+    async def _run(self, interval):
+        """Memory monitoring loop (asyncio mode)"""
+        next_tick = time.monotonic()
+        while self.monitoring:
+            self._take_sample()
+            next_tick, delay = self._advance_tick(next_tick, interval)
+            await asyncio.sleep(delay)
+
+    def get_memory_stats(self, include_samples=False):
+        """Calculate memory statistics over the retained samples
+
+        Args:
+            include_samples: Also return the retained samples as a list of dicts
+        """
+        samples = self._retained_samples()
+        count = samples.shape[1]
+        if not count:
             return {}
 
-        process_memories = [s['process_memory_mb'] for s in self.memory_samples]
-        system_used = [s['system_used_mb'] for s in self.memory_samples]
+        # Vectorized reductions over the contiguous field rows, converted to MB once
+        timestamps = samples[_SAMPLE_TIMESTAMP]
+        process_mb = samples[_SAMPLE_PROCESS_MEMORY] * _BYTES_TO_MB
+        system_used_mb = samples[_SAMPLE_SYSTEM_USED] * _BYTES_TO_MB
 
-        return {
-            'samples_count': len(self.memory_samples),
-            'duration_seconds': self.memory_samples[-1]['timestamp'] - self.memory_samples[0]['timestamp'],
+        stats = {
+            'samples_count': count,
+            'missed_samples': self.missed_samples,
+            'duration_seconds': float(timestamps[-1] - timestamps[0]),
             'process_memory': {
-                'min_mb': min(process_memories) if process_memories else 0,
-                'max_mb': max(process_memories) if process_memories else 0,
-                'avg_mb': sum(process_memories) / len(process_memories) if process_memories else 0,
-                'final_mb': process_memories[-1] if process_memories else 0
+                'min_mb': float(process_mb.min()),
+                'max_mb': float(process_mb.max()),
+                'avg_mb': float(process_mb.mean()),
+                'final_mb': float(process_mb[-1])
             },
             'system_memory': {
-                'min_used_mb': min(system_used),
-                'max_used_mb': max(system_used),
-                'avg_used_mb': sum(system_used) / len(system_used),
-                'final_used_mb': system_used[-1]
-            },
-            'raw_samples': self.memory_samples
+                'min_used_mb': float(system_used_mb.min()),
+                'max_used_mb': float(system_used_mb.max()),
+                'avg_used_mb': float(system_used_mb.mean()),
+                'final_used_mb': float(system_used_mb[-1])
+            }
         }
+        if include_samples:
+            # Convert every memory field to MB in one pass, then unpack as Python floats
+            memory_mb = samples[[_SAMPLE_SYSTEM_TOTAL, _SAMPLE_SYSTEM_USED,
+                                 _SAMPLE_SYSTEM_AVAILABLE, _SAMPLE_PROCESS_MEMORY]] * _BYTES_TO_MB
+            stats['raw_samples'] = [
+                {
+                    'timestamp': timestamp,
+                    'system_total_mb': total_mb,
+                    'system_used_mb': used_mb,
+                    'system_available_mb': available_mb,
+                    'system_percent': percent,
+                    'process_memory_mb': process_memory_mb,
+                    'process_count': int(process_count)
+                }
+                for timestamp, total_mb, used_mb, available_mb, process_memory_mb, percent, process_count in zip(
+                    timestamps.tolist(), *memory_mb.tolist(),
+                    samples[_SAMPLE_SYSTEM_PERCENT].tolist(), samples[_SAMPLE_PROCESS_COUNT].tolist()
+                )
+            ]
+        return stats
 
 
 class MCPServerTester:
     """Test the MCP Memory Server"""
 
     def __init__(self, server_host="127.0.0.1", server_port=8080):
+        _load_runtime_deps()
         self.host = server_host
         self.port = server_port
         self.server_process = None
         self.base_url = f"http://{server_host}:{server_port}"
         self._async_client = None  # Persistent async client for connection reuse
+        # Distinct JSON-RPC ids, so a timed-out call can be cancelled by id
+        self._rpc_ids = itertools.count(1)
+        # Keep-alive client for the frequent /health probes, bound to the base_url
+        # it was built for (see _get_health_client)
+        self._health_client = None
+        self._health_base_url = None
+
+    def _get_health_client(self):
+        """Get the keep-alive /health client, rebuilding it if base_url has changed.
+
+        running_mcp_server moves the tester to the session's port after
+        construction, so the client cannot be bound to base_url in __init__.
+        """
+        if self._health_client is None or self._health_base_url != self.base_url:
+            if self._health_client is not None:
+                self._health_client.close()
+            self._health_client = httpx.Client(
+                base_url=self.base_url,
+                limits=httpx.Limits(max_connections=2, max_keepalive_connections=2)
+            )
+            self._health_base_url = self.base_url
+        return self._health_client
 
     def start_server(self, config_file=None):
         """Start the MCP server with enhanced error handling"""
@@ -348,8 +660,14 @@ class MCPServerTester:
                 'src.mcp_memory_server.main:app',
                 '--host', self.host,
                 '--port', str(self.port),
-                '--reload'
+                '--no-access-log',
+                '--log-level', 'warning'
             ]
+            # Hot reload spawns a watcher process; only enable it for local debugging
+            if os.environ.get('MCP_TEST_RELOAD') == '1':
+                cmd.append('--reload')
+            else:
+                cmd.extend(['--workers', '1'])
 
             # Always set up environment for config file
             env = os.environ.copy()
@@ -369,24 +687,23 @@ class MCPServerTester:
                 stderr=subprocess.PIPE
             )
 
-            # Wait a bit for server to start
-            time.sleep(3)  # Give server time to boot
-
-            # Check if it's running
-            if self.server_process.poll() is None:
-                # Additional check: try to connect to health endpoint
+            # Poll the health endpoint until the server answers, the process
+            # exits, or the startup deadline passes
+            deadline = time.monotonic() + SERVER_STARTUP_TIMEOUT
+            delays = iter(STARTUP_POLL_DELAYS)
+            while time.monotonic() < deadline and self.server_process.poll() is None:
                 try:
-                    import requests
-                    response = requests.get(f"{self.base_url}/health", timeout=2)
+                    response = self._get_health_client().get("/health", timeout=httpx.Timeout(0.5, connect=0.2))
                     if response.status_code == 200:
                         print(f"✓ MCP Server started successfully on {self.base_url}")
                         return True
-                    else:
-                        print(f"✗ Server started but health check failed: {response.status_code}")
-                except BaseException:
-                    print(f"✓ Server process started on {self.base_url} (health check unavailable)")
-                    return True
-                return True
+                except httpx.HTTPError:
+                    pass
+                time.sleep(next(delays, STARTUP_POLL_DELAYS[-1]))
+
+            if self.server_process.poll() is None:
+                print(f"✗ Server did not become healthy within {SERVER_STARTUP_TIMEOUT:.0f}s")
+                return False
             else:
                 stdout, stderr = self.server_process.communicate()
                 error_msg = stderr.decode() if stderr else stdout.decode()
@@ -411,6 +728,10 @@ class MCPServerTester:
             # Note: Can't await in sync context, but httpx handles cleanup on garbage collection
             self._async_client = None
         
+        if self._health_client is not None:
+            self._health_client.close()
+            self._health_client = None
+
         if self.server_process:
             self.server_process.terminate()
             try:
@@ -426,27 +747,11 @@ class MCPServerTester:
         This significantly improves performance under load by reusing connections
         instead of creating a new connection for each request.
         
-        The client is recreated if the event loop has changed (which happens
-        between pytest async tests).
+        Tests and async fixtures all run on the session-scoped event loop (the
+        asyncio_default_*_loop_scope settings in pytest.ini), so one client serves
+        the whole session.
         """
-        import asyncio
-        current_loop = asyncio.get_event_loop()
-        
-        # Check if we need to recreate the client (new event loop or closed client)
-        need_new_client = (
-            self._async_client is None or 
-            self._async_client.is_closed or
-            getattr(self, '_client_loop', None) is not current_loop
-        )
-        
-        if need_new_client:
-            # Close old client if it exists and isn't already closed
-            if self._async_client is not None and not self._async_client.is_closed:
-                try:
-                    await self._async_client.aclose()
-                except Exception:
-                    pass  # Ignore errors closing old client
-            
+        if self._async_client is None or self._async_client.is_closed:
             # Configure with higher limits for performance testing
             limits = httpx.Limits(
                 max_connections=100,
@@ -456,9 +761,11 @@ class MCPServerTester:
             self._async_client = httpx.AsyncClient(
                 base_url=self.base_url,
                 limits=limits,
+                # Multiplex concurrent calls over one connection where the server
+                # negotiates HTTP/2; plain-HTTP uvicorn keeps using HTTP/1.1
+                http2=HTTP2_AVAILABLE,
                 timeout=30.0  # Longer timeout for heavy operations
             )
-            self._client_loop = current_loop
             
         return self._async_client
     
@@ -471,23 +778,39 @@ class MCPServerTester:
     def is_server_running(self):
         """Check if server is responding"""
         try:
-            response = requests.get(f"{self.base_url}/health", timeout=2)
+            response = self._get_health_client().get("/health", timeout=httpx.Timeout(1.0, connect=0.2))
             return response.status_code == 200
-        except requests.exceptions.ConnectionError:
+        except httpx.ConnectError:
             return False
         except Exception as e:
             print(f"Error checking server health: {e}")
             return False
 
-    async def call_mcp_tool(self, tool_name, params=None):
+    async def _cancel_requests(self, rpc_ids):
+        """Send MCP notifications/cancelled for calls we stopped waiting on."""
+        client = await self._get_async_client()
+        for rpc_id in rpc_ids:
+            try:
+                await client.post("/", json={
+                    "jsonrpc": "2.0",
+                    "method": "notifications/cancelled",
+                    "params": {"requestId": rpc_id, "reason": "Client timed out"}
+                }, timeout=2.0)
+            except httpx.HTTPError:
+                pass
+
+    async def call_mcp_tool(self, tool_name, params=None, timeout=TOOL_CALL_TIMEOUT):
         """Call an MCP tool via HTTP asynchronously.
         
         Uses a persistent connection pool for better performance under load.
+        A call still running after ``timeout`` seconds is cancelled on the server
+        so it does not keep working into the next test.
         """
+        rpc_id = next(self._rpc_ids)
         try:
             payload = {
                 "jsonrpc": "2.0",
-                "id": 1,
+                "id": rpc_id,
                 "method": "tools/call",
                 "params": {
                     "name": tool_name,
@@ -497,15 +820,18 @@ class MCPServerTester:
 
             # Use persistent client for connection reuse
             client = await self._get_async_client()
-            response = await client.post(
+            response = await asyncio.wait_for(client.post(
                 "/",
-                json=payload,
+                content=_json_dumps(payload),
                 headers={"Content-Type": "application/json"},
-            )
+            ), timeout)
 
             response.raise_for_status()  # Raise an exception for 4xx or 5xx responses
-            return response.json()
+            return _json_loads(response.content)
 
+        except (asyncio.TimeoutError, httpx.TimeoutException):
+            await self._cancel_requests([rpc_id])
+            return {"error": f"Tool '{tool_name}' timed out after {timeout}s"}
         except httpx.RequestError as e:
             return {"error": f"An error occurred while requesting {e.request.url!r}: {e}"}
         except httpx.HTTPStatusError as e:
@@ -513,18 +839,169 @@ class MCPServerTester:
         except Exception as e:
             return {"error": str(e)}
 
+    async def document_count(self):
+        """Return total_documents from get_memory_stats, or None if unavailable"""
+        stats = await self.call_mcp_tool("get_memory_stats")
+        return stats.get('result', {}).get('total_documents')
+
+    async def get_document(self, document_id):
+        """Fetch a document by id via get_document and return its result (empty if the call failed)"""
+        result = await self.call_mcp_tool("get_document", {"document_id": document_id})
+        return result.get('result', {})
+
+    @staticmethod
+    def stored_count(*add_results):
+        """Count the documents that add_document/add_documents results actually stored.
+
+        An add folded into an existing duplicate reports assigned_tier 'existing'
+        and stores nothing, so it is left out; use this to compute the total to
+        pass to wait_for_documents.
+        """
+        count = 0
+        for add_result in add_results:
+            result = add_result.get('result', {})
+            for entry in result.get('documents', [result]):
+                if (entry.get('success', True) and entry.get('document_id')
+                        and entry.get('assigned_tier') != 'existing'):
+                    count += 1
+        return count
+
+    async def wait_for_documents(self, expected_total, timeout=INDEXING_TIMEOUT,
+                                 interval=INDEXING_POLL_INTERVAL):
+        """Poll get_memory_stats until total_documents reaches expected_total.
+
+        Replaces fixed sleeps after add_document: returns as soon as the documents
+        are visible instead of always waiting the worst case.
+
+        Returns:
+            True once the count is reached, False if the timeout elapsed first.
+            Callers should assert the result.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            count = await self.document_count()
+            if count is not None and count >= expected_total:
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(interval)
+
+    async def wait_for_maintenance(self, active, timeout=MAINTENANCE_TIMEOUT,
+                                   interval=INDEXING_POLL_INTERVAL):
+        """Poll get_lifecycle_stats until the maintenance thread is running (or stopped).
+
+        Replaces fixed sleeps after start/stop_background_maintenance.
+
+        Returns:
+            True once thread_active equals ``active``, False if the timeout elapsed
+            first (e.g. maintenance is disabled in the config). Callers should
+            assert the result.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            stats = await self.call_mcp_tool("get_lifecycle_stats")
+            maintenance = stats.get('result', {}).get('maintenance', {})
+            if maintenance.get('thread_active') is active:
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(interval)
+
+    async def call_mcp_tools_batch(self, calls, timeout=TOOL_CALL_TIMEOUT):
+        """Call several independent MCP tools in one JSON-RPC batch request.
+
+        The server dispatches the batch concurrently, so this costs a single
+        round trip instead of one per call.
+
+        Args:
+            calls: Sequence of (tool_name, params) tuples
+            timeout: Seconds to wait before cancelling the whole batch
+
+        Returns:
+            List of results in the same order as ``calls``; failed calls return
+            an ``{"error": ...}`` dict just like ``call_mcp_tool``
+        """
+        rpc_ids = [next(self._rpc_ids) for _ in calls]
+        payload = [
+            {
+                "jsonrpc": "2.0",
+                "id": rpc_id,
+                "method": "tools/call",
+                "params": {
+                    "name": tool_name,
+                    "arguments": params or {}
+                }
+            }
+            for rpc_id, (tool_name, params) in zip(rpc_ids, calls)
+        ]
+        try:
+            client = await self._get_async_client()
+            response = await asyncio.wait_for(client.post(
+                "/",
+                content=_json_dumps(payload),
+                headers={"Content-Type": "application/json"},
+            ), timeout)
+            response.raise_for_status()
+            responses = {item.get("id"): item for item in _json_loads(response.content)}
+            return [
+                responses.get(rpc_id, {"error": f"No response for batch entry {rpc_id}"})
+                for rpc_id in rpc_ids
+            ]
+
+        except (asyncio.TimeoutError, httpx.TimeoutException):
+            await self._cancel_requests(rpc_ids)
+            error = {"error": f"Tool batch timed out after {timeout}s"}
+        except httpx.RequestError as e:
+            error = {"error": f"An error occurred while requesting {e.request.url!r}: {e}"}
+        except httpx.HTTPStatusError as e:
+            error = {"error": f"Error response {e.response.status_code} while requesting {e.request.url!r}: {e}"}
+        except Exception as e:
+            error = {"error": str(e)}
+        return [error] * len(calls)
+
+
+# Tests and async fixtures share one session event loop. It runs on uvloop when
+# installed (it comes with uvicorn[standard]), matching the loop uvicorn picks
+# for the server; otherwise pytest-asyncio's default loop is used.
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+try:
+    # pytest-asyncio >= 1.4 customizes loops through a hook and deprecates
+    # overriding the event_loop_policy fixture
+    from pytest_asyncio.plugin import PytestAsyncioSpecs  # noqa: F401
+    _LOOP_FACTORIES_HOOK = True
+except ImportError:
+    _LOOP_FACTORIES_HOOK = False
+
+if uvloop is not None and _LOOP_FACTORIES_HOOK:
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config, item):
+        """Run the session loop on uvloop (pytest-asyncio >= 1.4)."""
+        return {"uvloop": uvloop.new_event_loop}
+
+elif uvloop is not None:
+    @pytest.fixture(scope="session")
+    def event_loop_policy():
+        """Run the session loop on uvloop (pytest-asyncio < 1.4)."""
+        return uvloop.EventLoopPolicy()
+
 
 @pytest.fixture(scope="session")
-def mcp_server_tester():
+async def mcp_server_tester():
     """Provides a server tester instance for starting/stopping the MCP server."""
     tester = MCPServerTester()
     yield tester
+    # Close the shared async client on the session loop it was created on
+    await tester.close_async_client()
     # Ensure server is stopped after all tests in the session are done
     tester.stop_server()
 
 
 @pytest.fixture(scope="session")
-def running_mcp_server(mcp_server_tester, shared_test_env, production_server_check, check_server_dependencies):
+async def running_mcp_server(mcp_server_tester, shared_test_env, production_server_check, check_server_dependencies):
     """Starts the MCP server once for the entire test session with shared test database.
     
     This fixture depends on production_server_check to ensure we don't accidentally
@@ -539,31 +1016,94 @@ def running_mcp_server(mcp_server_tester, shared_test_env, production_server_che
     mcp_server_tester.base_url = f"http://{mcp_server_tester.host}:{port}"
 
     if not mcp_server_tester.is_server_running():
+        # start_server blocks until the health endpoint answers, which includes
+        # ML model loading, so no extra settling time is needed here
+        print("⏳ Starting server and waiting for it to initialize (loading ML models)...")
         assert mcp_server_tester.start_server(config_file=str(config_path)), "Failed to start MCP server"
-        # Give it much more time for ML model loading and full startup
-        print("⏳ Waiting for server to fully initialize (loading ML models)...")
-        time.sleep(15)  # Much longer wait for ML model initialization
-
-        # Retry health check with backoff
-        for attempt in range(10):
-            if mcp_server_tester.is_server_running():
-                print("✓ Server is ready!")
-                break
-            print(f"⏳ Server not ready yet, retrying in {2 + attempt} seconds...")
-            time.sleep(2 + attempt)
-        else:
-            raise AssertionError("Server failed to become ready after extended wait")
+        print("✓ Server is ready!")
+
+    # Run one throwaway query so the first test doesn't pay for the embedding
+    # model's first forward pass; a query stores nothing, unlike add_document
+    await mcp_server_tester.call_mcp_tool("query_documents", {"query": "warmup", "k": 1})
     yield mcp_server_tester
     # Server shutdown handled by session fixture
 
 
+@pytest.fixture
+async def maintenance_stopped(running_mcp_server):
+    """Runs the test with background maintenance stopped, and stops it again afterwards.
+
+    Tests that start maintenance themselves don't need to stop it at the end;
+    teardown does so even if the test fails.
+    """
+    await running_mcp_server.call_mcp_tool("stop_background_maintenance")
+    assert await running_mcp_server.wait_for_maintenance(active=False), \
+        "Background maintenance did not stop"
+    yield running_mcp_server
+    await running_mcp_server.call_mcp_tool("stop_background_maintenance")
+
+
+# Canonical corpus for deduplication tests: two near-duplicate pairs plus distinct content
+DEDUP_CORPUS = [
+    {"content": "Duplicate content example one.", "metadata": {"type": "dedup_test", "pair": "example"}},
+    {"content": "Duplicate content example two.", "metadata": {"type": "dedup_test", "pair": "example"}},
+    {"content": "Advanced deduplication test document one.", "metadata": {"type": "dedup_test", "pair": "advanced"}},
+    {"content": "Advanced deduplication test document two.", "metadata": {"type": "dedup_test", "pair": "advanced"}},
+    {"content": "Similar advanced dedup test document.", "metadata": {"type": "dedup_test"}},
+    {"content": "Stats tracking test document for the dedup corpus.", "metadata": {"type": "dedup_test"}},
+]
+
+
 @pytest.fixture(scope="session")
-def memory_monitor():
+async def seeded_dedup_corpus(running_mcp_server):
+    """Adds DEDUP_CORPUS once per session with a single add_documents call.
+
+    Deduplication tests only need some near-duplicate content in short_term
+    memory, so they share this corpus instead of each seeding and indexing
+    their own documents. Seeding once keeps modules from piling up copies of
+    the same corpus in the shared database.
+    """
+    baseline = await running_mcp_server.document_count() or 0
+    result = await running_mcp_server.call_mcp_tool("add_documents", {"documents": DEDUP_CORPUS})
+    assert "error" not in result, f"Failed to seed dedup corpus: {result.get('error')}"
+    expected_total = baseline + running_mcp_server.stored_count(result)
+    assert await running_mcp_server.wait_for_documents(expected_total), \
+        "Dedup corpus was not indexed in time"
+    return DEDUP_CORPUS
+
+
+# Size of the shared corpus that query benchmarks search against
+QUERY_CORPUS_SIZE = 20
+
+
+@pytest.fixture(scope="session")
+async def seeded_query_corpus(running_mcp_server, data_generator):
+    """Adds a generated query corpus once per session and flushes the index.
+
+    Query benchmarks only read from the database, so they share this corpus
+    instead of each ingesting their own documents before measuring. Returns the
+    documents that were stored.
+    """
+    documents = data_generator.generate_test_dataset(QUERY_CORPUS_SIZE, duplicate_percentage=0)
+    result = await running_mcp_server.call_mcp_tool("add_documents", {
+        "documents": [{"content": doc['content'], "metadata": doc['metadata']} for doc in documents]
+    })
+    assert "error" not in result, f"Failed to seed query corpus: {result.get('error')}"
+    added = result['result']['documents']
+    await running_mcp_server.call_mcp_tool("flush_index")
+    return [doc for doc, entry in zip(documents, added) if entry['success']]
+
+
+@pytest.fixture(scope="session")
+async def memory_monitor():
     """Provides a memory monitor instance for the test session."""
     monitor = MemoryMonitor()
     yield monitor
     # Stop monitoring at the end of the session
-    monitor.stop_monitoring()
+    if monitor._task is not None:
+        await monitor.stop_monitoring_async()
+    else:
+        monitor.stop_monitoring()
 
 
 @pytest.fixture(scope="session")
@@ -574,13 +1114,8 @@ def check_server_dependencies():
     depend on running_mcp_server.
     """
     required_modules = ['fastapi', 'uvicorn']
-    missing = []
-
-    for module in required_modules:
-        try:
-            __import__(module)
-        except ImportError:
-            missing.append(module)
+    # Only look the modules up; the server subprocess does the actual import
+    missing = [module for module in required_modules if importlib.util.find_spec(module) is None]
 
     if missing:
         pytest.skip(f"Server dependencies not available: {missing}. Install with: pip install {' '.join(missing)}")
@@ -598,7 +1133,7 @@ def production_server_check():
     Note: This fixture is NOT autouse - unit tests don't need this check
     since they don't use a running server.
     """
-    test_port = int(os.environ.get('MCP_TEST_PORT', DEFAULT_TEST_PORT))
+    test_port = _test_port()
     
     # Check all common ports for running servers
     for port in COMMON_MCP_PORTS:
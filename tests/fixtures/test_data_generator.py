@@ -3,6 +3,20 @@ import random
 import time
 import json
 
+# orjson is optional; it serializes the generated JSON documents much faster
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, indent=2)
+
+    _loads = json.loads
+
 
 @pytest.fixture(scope="session")
 def data_generator():
@@ -12,20 +26,41 @@ def data_generator():
 class DataGenerator:
     """Generate realistic test data for various scenarios"""
 
+    # Number of documents rendered at a time per content type
+    POOL_SIZE = 200
+
     def __init__(self):
         self.code_keywords = ['function', 'class', 'import', 'return', 'def', 'if', 'for', 'while', 'try', 'except']
         self.text_keywords = ['the', 'and', 'or', 'but', 'however', 'therefore', 'because', 'since', 'when', 'where']
         self.data_keywords = ['data', 'json', 'csv', 'table', 'row', 'column', 'field', 'value', 'record', 'database']
         self.doc_keywords = ['guide', 'documentation', 'tutorial', 'example', 'howto', 'readme', 'manual', 'reference']
 
-    def generate_code_content(self, base_content="", similarity_level=0.8):
-        """Generate code-like content with controlled similarity"""
-        if not base_content:
-            # Create base code content
-            functions = ['process_data', 'calculate_result', 'validate_input', 'format_output', 'handle_error']
-            variables = ['data', 'result', 'config', 'response', 'params']
-
-            content = f"""
+        # Base documents are rendered in batches and each one is handed out only
+        # once, so separate calls never get the same rendered document
+        self._renderers = {
+            'code': self._render_code_content,
+            'text': self._render_text_content,
+            'data': self._render_data_content,
+            'documentation': self._render_documentation_content
+        }
+        self._pool = {content_type: [] for content_type in self._renderers}
+
+    def _take_from_pool(self, content_type, count):
+        """Remove and return count freshly rendered base documents, refilling the pool as needed"""
+        pool = self._pool[content_type]
+        render = self._renderers[content_type]
+        while len(pool) < count:
+            pool.extend(render() for _ in range(self.POOL_SIZE))
+        taken = pool[len(pool) - count:]
+        del pool[len(pool) - count:]
+        return taken
+
+    def _render_code_content(self):
+        """Render a new piece of code-like content"""
+        functions = ['process_data', 'calculate_result', 'validate_input', 'format_output', 'handle_error']
+        variables = ['data', 'result', 'config', 'response', 'params']
+
+        return f"""
 def {random.choice(functions)}({', '.join(random.sample(variables, 2))}):
     '''Process {random.choice(['user input', 'data records', 'configuration', 'response data'])}'''
 
@@ -45,39 +80,13 @@ def {random.choice(functions)}({', '.join(random.sample(variables, 2))}):
 "{random.choice(['localhost', 'example.com', '/api/v1', '/data'])}"
 }}
 """
-        else:
-            # Modify existing content based on similarity level
-            lines = base_content.strip().split('\n')
-            num_changes = int(len(lines) * (1 - similarity_level))
-
-            for _ in range(num_changes):
-                if lines:
-                    line_idx = random.randint(0, len(lines) - 1)
-                    line = lines[line_idx]
 
-                    # Make small modifications
-                    if 'def ' in line:
-                        line = line.replace('def ', 'def new_')
-                    elif '=' in line and not line.strip().startswith('#'):
-                        parts = line.split('=')
-                        if len(parts) == 2:
-                            line = f"{parts[0]}= {random.choice(['modified_value', 'updated_data', 'new_result'])}"
-                    elif random.random() < 0.3:
-                        line = f"    # Modified: {line.strip()}"
-
-                    lines[line_idx] = line
-
-            content = '\n'.join(lines)
-
-        return content
-
-    def generate_text_content(self, base_content="", similarity_level=0.8):
-        """Generate text content with controlled similarity"""
+    def _render_text_content(self):
+        """Render a new piece of text content"""
         topics = ['machine learning', 'data analysis', 'software development', 'project management', 'system design']
+        topic = random.choice(topics)
 
-        if not base_content:
-            topic = random.choice(topics)
-            content = f"""
+        return f"""
 # Understanding {topic.title()}
 
 {topic.title()} is a crucial aspect of modern technology that involves \
@@ -104,10 +113,105 @@ When working with {topic}, it's important to:
 {random.choice(['developers', 'analysts', 'engineers', 'professionals'])} \
 working in {random.choice(['technology', 'business', 'research', 'industry'])}
 """
+
+    def _render_data_content(self):
+        """Render a new piece of data-like content"""
+        fields = ['id', 'name', 'value', 'timestamp', 'status', 'category', 'priority', 'description']
+        content = {
+            random.choice(fields): random.choice([
+                random.randint(1, 1000),
+                f"item_{random.randint(1, 100)}",
+                random.uniform(0, 100),
+                time.time(),
+                random.choice(['active', 'inactive', 'pending']),
+                random.choice(['high', 'medium', 'low']),
+                f"Description for {random.choice(['data', 'record', 'item', 'entry'])}"
+            ]) for _ in range(random.randint(3, 8))
+        }
+        return _dumps(content)
+
+    def _render_documentation_content(self):
+        """Render a new piece of documentation-like content"""
+        components = ['API', 'Database', 'Service', 'Module', 'Component']
+        component = random.choice(components)
+
+        return f"""
+# {component} Documentation
+
+## Overview
+The {component.lower()} provides functionality for \
+{random.choice(['data processing', 'user management', 'system integration', 'performance monitoring'])}.
+
+## Installation
+```bash
+pip install {component.lower()}-package
+```
+
+## Usage
+```python
+from {component.lower()} import {component}
+
+# Initialize
+{component.lower()} = {component}()
+
+# Basic usage
+result = {component.lower()}.{random.choice(['process', 'execute', 'run', 'handle'])}(data)
+```
+
+## Configuration
+- `timeout`: {random.randint(5, 60)} seconds
+- `retry_count`: {random.randint(1, 5)}
+- `debug_mode`: {random.choice(['True', 'False'])}
+
+## Examples
+See the examples directory for complete usage examples.
+"""
+
+    def generate_code_content(self, base_content="", similarity_level=0.8):
+        """Generate code-like content with controlled similarity"""
+        if not base_content:
+            return self._take_from_pool('code', 1)[0]
+        else:
+            # Modify existing content based on similarity level
+            base_content = base_content.strip()
+            num_changes = int((base_content.count('\n') + 1) * (1 - similarity_level))
+            if num_changes == 0:
+                return base_content
+            lines = base_content.split('\n')
+
+            for _ in range(num_changes):
+                if lines:
+                    line_idx = random.randint(0, len(lines) - 1)
+                    line = lines[line_idx]
+
+                    # Make small modifications
+                    if 'def ' in line:
+                        line = line.replace('def ', 'def new_')
+                    elif '=' in line and not line.strip().startswith('#'):
+                        parts = line.split('=')
+                        if len(parts) == 2:
+                            line = f"{parts[0]}= {random.choice(['modified_value', 'updated_data', 'new_result'])}"
+                    elif random.random() < 0.3:
+                        line = f"    # Modified: {line.strip()}"
+
+                    lines[line_idx] = line
+
+            content = '\n'.join(lines)
+
+        return content
+
+    def generate_text_content(self, base_content="", similarity_level=0.8):
+        """Generate text content with controlled similarity"""
+        if not base_content:
+            return self._take_from_pool('text', 1)[0]
         else:
             # Modify existing content
-            sentences = base_content.replace('\n', ' ').split('.')
-            num_changes = int(len(sentences) * (1 - similarity_level))
+            base_content = base_content.replace('\n', ' ')
+            num_changes = int((base_content.count('.') + 1) * (1 - similarity_level))
+            if num_changes == 0:
+                # Same result as the split/join below with nothing modified
+                return base_content.replace('.', '. ')
+            sentences = base_content.split('.')
 
             for _ in range(num_changes):
                 if sentences:
@@ -130,23 +234,11 @@ working in {random.choice(['technology', 'business', 'research', 'industry'])}
     def generate_data_content(self, base_content="", similarity_level=0.8):
         """Generate data-like content"""
         if not base_content:
-            fields = ['id', 'name', 'value', 'timestamp', 'status', 'category', 'priority', 'description']
-            content = {
-                random.choice(fields): random.choice([
-                    random.randint(1, 1000),
-                    f"item_{random.randint(1, 100)}",
-                    random.uniform(0, 100),
-                    time.time(),
-                    random.choice(['active', 'inactive', 'pending']),
-                    random.choice(['high', 'medium', 'low']),
-                    f"Description for {random.choice(['data', 'record', 'item', 'entry'])}"
-                ]) for _ in range(random.randint(3, 8))
-            }
-            return json.dumps(content, indent=2)
+            return self._take_from_pool('data', 1)[0]
         else:
             # Modify existing JSON data
             try:
-                data = json.loads(base_content)
+                data = _loads(base_content)
                 if isinstance(data, dict):
                     num_changes = max(1, int(len(data) * (1 - similarity_level)))
                     keys = list(data.keys())
@@ -157,51 +249,20 @@ working in {random.choice(['technology', 'business', 'research', 'industry'])}
                                 data[key] = data[key] * random.uniform(0.8, 1.2)
                             elif isinstance(data[key], str):
                                 data[key] = f"modified_{data[key]}"
-                return json.dumps(data, indent=2)
+                return _dumps(data)
             except BaseException:
                 return base_content
 
     def generate_documentation_content(self, base_content="", similarity_level=0.8):
         """Generate documentation-like content"""
         if not base_content:
-            components = ['API', 'Database', 'Service', 'Module', 'Component']
-            component = random.choice(components)
-
-            content = f"""
-# {component} Documentation
-
-## Overview
-The {component.lower()} provides functionality for \
-{random.choice(['data processing', 'user management', 'system integration', 'performance monitoring'])}.
-
-## Installation
-```bash
-pip install {component.lower()}-package
-```
-
-## Usage
-```python
-from {component.lower()} import {component}
-
-# Initialize
-{component.lower()} = {component}()
-
-# Basic usage
-result = {component.lower()}.{random.choice(['process', 'execute', 'run', 'handle'])}(data)
-```
-
-## Configuration
-- `timeout`: {random.randint(5, 60)} seconds
-- `retry_count`: {random.randint(1, 5)}
-- `debug_mode`: {random.choice(['True', 'False'])}
-
-## Examples
-See the examples directory for complete usage examples.
-"""
+            return self._take_from_pool('documentation', 1)[0]
         else:
             # Modify documentation
+            num_changes = int((base_content.count('\n') + 1) * (1 - similarity_level))
+            if num_changes == 0:
+                return base_content
             lines = base_content.split('\n')
-            num_changes = int(len(lines) * (1 - similarity_level))
 
             for _ in range(num_changes):
                 if lines:
@@ -221,6 +282,7 @@ See the examples directory for complete usage examples.
     def generate_test_dataset(self, total_documents=100, duplicate_percentage=30):
         """Generate a complete test dataset with known duplicate patterns"""
         documents = []
+        now = time.time()
 
         # Calculate how many of each type (ensure we get the exact total)
         per_type = total_documents // 4
@@ -239,41 +301,41 @@ See the examples directory for complete usage examples.
             docs_for_type = per_type + (1 if idx < remainder else 0)
 
             # Generate base documents
-            base_docs = []
-            for i in range(docs_for_type - duplicates_per_type):
-                content = generator()
-                doc = {
+            base_contents = self._take_from_pool(content_type, docs_for_type - duplicates_per_type)
+            base_docs = [
+                {
                     'content': content,
                     'metadata': {
                         'type': content_type,
                         'source': f'generated_{content_type}_{i}',
-                        'timestamp': time.time() - random.randint(0, 86400 * 30),  # Last 30 days
+                        'timestamp': now - random.randint(0, 86400 * 30),  # Last 30 days
                         'is_duplicate': False,
                         'importance_score': random.uniform(0.3, 0.9)
                     }
                 }
-                base_docs.append(doc)
-                documents.append(doc)
-
-            # Generate duplicates based on existing documents
-            for i in range(duplicates_per_type):
-                if base_docs:
-                    base_doc = random.choice(base_docs)
-                    similarity_level = random.uniform(0.85, 0.98)  # High similarity
-
-                    duplicate_content = generator(base_doc['content'], similarity_level)
-                    duplicate_doc = {
-                        'content': duplicate_content,
+                for i, content in enumerate(base_contents)
+            ]
+            documents.extend(base_docs)
+
+            # Generate duplicates based on existing documents; the random draws are
+            # made in batches up front and the documents built in one pass
+            if base_docs and duplicates_per_type:
+                sources = random.choices(base_docs, k=duplicates_per_type)
+                similarity_levels = [random.uniform(0.85, 0.98) for _ in sources]  # High similarity
+                documents.extend(
+                    {
+                        'content': generator(base_doc['content'], similarity_level),
                         'metadata': {
                             'type': content_type,
                             'source': f'duplicate_{content_type}_{i}',
-                            'timestamp': time.time() - random.randint(0, 86400 * 7),  # Last 7 days
+                            'timestamp': now - random.randint(0, 86400 * 7),  # Last 7 days
                             'is_duplicate': True,
                             'duplicate_of': base_doc['metadata']['source'],
                             'similarity_level': similarity_level,
                             'importance_score': random.uniform(0.2, 0.7)
                         }
                     }
-                    documents.append(duplicate_doc)
+                    for i, (base_doc, similarity_level) in enumerate(zip(sources, similarity_levels))
+                )
 
         return documents
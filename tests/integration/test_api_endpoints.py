@@ -1,15 +1,16 @@
 import pytest
-import httpx
 import asyncio
+import logging
 import time
 
+logger = logging.getLogger(__name__)
+
 
 @pytest.mark.integration
 @pytest.mark.asyncio
 async def test_add_document_concurrent_calls(running_mcp_server):
     """Test concurrent calls to add_document to ensure non-blocking behavior."""
     # Server is already running via fixture
-    base_url = running_mcp_server.base_url
     num_concurrent_calls = 10
     documents_to_add = []
     for i in range(num_concurrent_calls):
@@ -26,44 +27,64 @@ async def test_add_document_concurrent_calls(running_mcp_server):
             }
         })
 
-    async with httpx.AsyncClient(base_url=base_url) as client:
-        start_time = time.time()
-        tasks = []
-        for doc_payload in documents_to_add:
-            tasks.append(client.post("/", json=doc_payload, timeout=30))
-
-        responses = await asyncio.gather(*tasks, return_exceptions=True)
-        end_time = time.time()
-
-        # Check responses
-        for i, response in enumerate(responses):
-            assert not isinstance(response, Exception), f"Call {i} failed with exception: {response}"
-            assert response.status_code == 200, f"Call {i} received non-200 status: {response.status_code}"
-            json_response = response.json()
-            assert "error" not in json_response, f"Call {i} returned error: {json_response.get('error')}"
-            # Parse the MCP-compliant response format: result contains structured data directly
-            result = json_response['result']
-            # For successful operations, check the message or status
-            if 'message' in result:
-                assert 'success' in result['message'].lower(
-                ) or 'added' in result['message'].lower(), f"Call {i} operation failed: {result}"
-            elif 'error' in result:
-                assert False, f"Call {i} returned error: {result['error']}"
-            else:
-                # As long as there's no error field, consider it successful
-                assert 'error' not in result, f"Call {i} operation failed: {result}"
-
-        duration = end_time - start_time
-        print(f"\nConcurrent add_document calls ({num_concurrent_calls}) took {duration:.2f} seconds.")
-
-        # Assert that the total time is reasonable for concurrent operations
-        # This is a heuristic: it should be closer to the time of a single call + overhead,
-        # not the sum of all individual call times if they were blocking.
-        # A single call might take ~0.5-1.5s depending on embedding model loading etc.
-        # So 10 concurrent calls should ideally be < 5 seconds, but depends on system.
-        # We'll set a generous upper bound for now.
-        assert duration < (num_concurrent_calls * 0.5), \
-            f"Concurrent calls took too long, suggesting blocking I/O. Duration: {duration:.2f}s"
+    # Reuse the tester's pooled client rather than opening fresh connections
+    client = await running_mcp_server._get_async_client()
+
+    # Time one warm call so the burst is judged against this machine's latency
+    baseline_payload = {
+        "jsonrpc": "2.0",
+        "id": 0,
+        "method": "tools/call",
+        "params": {
+            "name": "add_document",
+            "arguments": {
+                "content": "Concurrent test baseline document",
+                "metadata": {"source": "concurrent_test_baseline"}
+            }
+        }
+    }
+    single_start = time.perf_counter()
+    baseline_response = await client.post("/", json=baseline_payload, timeout=30)
+    single_rtt = time.perf_counter() - single_start
+    assert baseline_response.status_code == 200, \
+        f"Baseline call received non-200 status: {baseline_response.status_code}"
+
+    start_time = time.perf_counter()
+    tasks = []
+    for doc_payload in documents_to_add:
+        tasks.append(client.post("/", json=doc_payload, timeout=30))
+
+    responses = await asyncio.gather(*tasks, return_exceptions=True)
+    end_time = time.perf_counter()
+
+    # Check responses
+    for i, response in enumerate(responses):
+        assert not isinstance(response, Exception), f"Call {i} failed with exception: {response}"
+        assert response.status_code == 200, f"Call {i} received non-200 status: {response.status_code}"
+        json_response = response.json()
+        assert "error" not in json_response, f"Call {i} returned error: {json_response.get('error')}"
+        # Parse the MCP-compliant response format: result contains structured data directly
+        result = json_response['result']
+        # For successful operations, check the message or status
+        if 'message' in result:
+            assert 'success' in result['message'].lower(
+            ) or 'added' in result['message'].lower(), f"Call {i} operation failed: {result}"
+        elif 'error' in result:
+            assert False, f"Call {i} returned error: {result['error']}"
+        else:
+            # As long as there's no error field, consider it successful
+            assert 'error' not in result, f"Call {i} operation failed: {result}"
+
+    duration = end_time - start_time
+    logger.info("Concurrent add_document calls (%d) took %.2f seconds (single call %.3fs, ratio %.1fx)",
+                num_concurrent_calls, duration, single_rtt, duration / single_rtt)
+
+    # The burst should cost about one call plus overhead; a server that blocks
+    # its event loop serializes the calls and scales with num_concurrent_calls.
+    max_duration = max(1.5, single_rtt * 2 + 0.5)
+    assert duration < max_duration, \
+        f"Concurrent calls took too long, suggesting blocking I/O. " \
+        f"Duration: {duration:.2f}s, limit: {max_duration:.2f}s"
 
     # Verify documents were added (optional, but good for completeness)
     stats_result = await running_mcp_server.call_mcp_tool("get_memory_stats")
@@ -88,12 +109,15 @@ async def test_add_document_concurrent_calls(running_mcp_server):
 async def test_query_documents_tool(running_mcp_server):
     """Test the query_documents tool."""
     # Add a document to query
+    baseline = await running_mcp_server.document_count() or 0
     add_result = await running_mcp_server.call_mcp_tool("add_document", {
         "content": "This is a document about testing and software quality.",
         "metadata": {"type": "test_query"}
     })
     assert "error" not in add_result, f"Failed to add document for query test: {add_result.get('error')}"
-    await asyncio.sleep(1)  # Give ChromaDB time to index
+    expected_total = baseline + running_mcp_server.stored_count(add_result)
+    assert await running_mcp_server.wait_for_documents(expected_total), \
+        "Added document was not indexed in time"
 
     query_result = await running_mcp_server.call_mcp_tool("query_documents", {
         "query": "software testing",
@@ -115,6 +139,82 @@ async def test_get_memory_stats_tool(running_mcp_server):
     assert "collections" in stats_result['result'], "collections missing from stats"
 
 
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_repeated_query_hits_embedding_cache(running_mcp_server):
+    """Test that repeating a query reuses its cached embedding."""
+    query = {"query": "embedding cache repeated query", "k": 1}
+    first_query = await running_mcp_server.call_mcp_tool("query_documents", query)
+    assert "error" not in first_query, f"Error querying documents: {first_query.get('error')}"
+
+    stats_before = await running_mcp_server.call_mcp_tool("get_memory_stats")
+    hits_before = stats_before['result']['embedding_cache']['hits']
+
+    second_query = await running_mcp_server.call_mcp_tool("query_documents", query)
+    assert "error" not in second_query, f"Error querying documents: {second_query.get('error')}"
+
+    stats_after = await running_mcp_server.call_mcp_tool("get_memory_stats")
+    assert stats_after['result']['embedding_cache']['hits'] > hits_before, \
+        "Repeated query should be served from the embedding cache"
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_json_rpc_batch_request(running_mcp_server):
+    """Test that a JSON-RPC batch returns one response per request, skipping notifications."""
+    client = await running_mcp_server._get_async_client()
+    response = await client.post("/", json=[
+        {"jsonrpc": "2.0", "id": 1, "method": "tools/call",
+         "params": {"name": "get_memory_stats", "arguments": {}}},
+        {"jsonrpc": "2.0", "method": "notifications/initialized"},
+        {"jsonrpc": "2.0", "id": 2, "method": "no/such_method"},
+    ])
+    assert response.status_code == 200, f"Batch request failed: {response.text}"
+
+    responses = response.json()
+    assert [item['id'] for item in responses] == [1, 2], "Batch responses missing or out of order"
+    assert "total_documents" in responses[0]['result'], "total_documents missing from batched stats"
+    assert "error" in responses[1], "Unknown method in batch should return an error"
+
+    empty_response = await client.post("/", json=[])
+    assert empty_response.status_code == 400, "Empty batch should be rejected"
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_in_flight_request_ids_are_scoped_to_session(running_mcp_server):
+    """Test that reused request ids still run, and can only be cancelled within their session."""
+    client = await running_mcp_server._get_async_client()
+    query_call = {"jsonrpc": "2.0", "id": 7, "method": "tools/call",
+                  "params": {"name": "query_documents", "arguments": {"query": "session scoping", "k": 1}}}
+
+    # A second call reusing an in-flight id in the same session still runs
+    duplicate = await client.post("/", json=[query_call, query_call], headers={"Mcp-Session-Id": "session-a"})
+    for response in duplicate.json():
+        assert "result" in response, f"Call reusing an in-flight id should run: {response}"
+
+    # The same id in another session runs independently, and that session cannot cancel it
+    responses = await asyncio.gather(
+        client.post("/", json=query_call, headers={"Mcp-Session-Id": "session-a"}),
+        client.post("/", json=query_call, headers={"Mcp-Session-Id": "session-b"}),
+        client.post("/", json={"jsonrpc": "2.0", "method": "notifications/cancelled", "params": {"requestId": 7}},
+                    headers={"Mcp-Session-Id": "session-c"}),
+    )
+    for response in responses[:2]:
+        assert "result" in response.json(), f"Call should not be refused or cancelled: {response.text}"
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_timed_out_call_is_cancelled(running_mcp_server):
+    """Test that a call past its timeout reports an error and leaves the server usable."""
+    result = await running_mcp_server.call_mcp_tool("get_comprehensive_analytics", timeout=0.001)
+    assert "timed out" in result.get('error', ''), f"Expected a timeout error, got: {result}"
+
+    stats_result = await running_mcp_server.call_mcp_tool("get_memory_stats")
+    assert "error" not in stats_result, f"Server unusable after cancellation: {stats_result.get('error')}"
+
+
 @pytest.mark.integration
 @pytest.mark.asyncio
 async def test_get_lifecycle_stats_tool(running_mcp_server):
@@ -130,12 +230,15 @@ async def test_get_lifecycle_stats_tool(running_mcp_server):
 async def test_query_permanent_documents_tool(running_mcp_server):
     """Test the query_permanent_documents tool."""
     # Add a permanent document
+    baseline = await running_mcp_server.document_count() or 0
     add_result = await running_mcp_server.call_mcp_tool("add_document", {
         "content": "This is a permanent record of critical importance.",
         "metadata": {"permanence_flag": "critical"}
     })
     assert "error" not in add_result, f"Failed to add permanent document: {add_result.get('error')}"
-    await asyncio.sleep(1)  # Give ChromaDB time to index
+    expected_total = baseline + running_mcp_server.stored_count(add_result)
+    assert await running_mcp_server.wait_for_documents(expected_total), \
+        "Added document was not indexed in time"
 
     query_result = await running_mcp_server.call_mcp_tool("query_permanent_documents", {
         "query": "critical record",
@@ -147,37 +250,6 @@ async def test_query_permanent_documents_tool(running_mcp_server):
         "Permanent query did not return expected content"
 
 
-@pytest.mark.integration
-@pytest.mark.asyncio
-async def test_get_deduplication_stats_tool(running_mcp_server):
-    """Test the get_deduplication_stats tool."""
-    stats_result = await running_mcp_server.call_mcp_tool("get_deduplication_stats")
-    assert "error" not in stats_result, f"Error getting deduplication stats: {stats_result.get('error')}"
-    assert "total_duplicates_found" in stats_result['result'], "total_duplicates_found missing from dedup stats"
-    assert "enabled" in stats_result['result'], "enabled flag missing from dedup stats"
-
-
-@pytest.mark.integration
-@pytest.mark.asyncio
-async def test_preview_duplicates_tool(running_mcp_server):
-    """Test the preview_duplicates tool."""
-    # Add some potentially duplicate content
-    await running_mcp_server.call_mcp_tool(
-        "add_document", {"content": "Duplicate content example one.", "metadata": {"type": "dedup_test"}}
-    )
-    await running_mcp_server.call_mcp_tool(
-        "add_document", {"content": "Duplicate content example two.", "metadata": {"type": "dedup_test"}}
-    )
-    await asyncio.sleep(1)  # Give ChromaDB time to index
-
-    preview_result = await running_mcp_server.call_mcp_tool(
-        "preview_duplicates", {"collection": "short_term", "limit": 5}
-    )
-    assert "error" not in preview_result, f"Error previewing duplicates: {preview_result.get('error')}"
-    assert "duplicates_found" in preview_result['result'], "duplicates_found missing from preview result"
-    assert "preview_pairs" in preview_result['result'], "preview_pairs missing from preview result"
-
-
 @pytest.mark.integration
 @pytest.mark.asyncio
 async def test_get_query_performance_tool(running_mcp_server):
@@ -187,7 +259,6 @@ async def test_get_query_performance_tool(running_mcp_server):
         "add_document", {"content": "Performance test document.", "metadata": {"type": "perf_test"}}
     )
     await running_mcp_server.call_mcp_tool("query_documents", {"query": "performance", "k": 1})
-    await asyncio.sleep(1)  # Give monitor time to log
 
     perf_result = await running_mcp_server.call_mcp_tool("get_query_performance", {"time_window": "all"})
     assert "error" not in perf_result, f"Error getting query performance: {perf_result.get('error')}"
@@ -214,7 +285,6 @@ async def test_export_performance_data_tool(running_mcp_server):
         "add_document", {"content": "Export test data.", "metadata": {"type": "export_test"}}
     )
     await running_mcp_server.call_mcp_tool("query_documents", {"query": "export", "k": 1})
-    await asyncio.sleep(1)
 
     export_result = await running_mcp_server.call_mcp_tool("export_performance_data", {"format": "json"})
     assert "error" not in export_result, f"Error exporting performance data: {export_result.get('error')}"
@@ -267,13 +337,14 @@ async def test_get_predictive_insights_tool(running_mcp_server):
 async def test_get_chunk_relationships_tool(running_mcp_server):
     """Test the get_chunk_relationships tool."""
     # Add some related documents to generate relationships
-    await running_mcp_server.call_mcp_tool(
-        "add_document", {"content": "Chunk A: First part of a story.", "metadata": {"story_id": "story1"}}
-    )
-    await running_mcp_server.call_mcp_tool(
-        "add_document", {"content": "Chunk B: Second part of the same story.", "metadata": {"story_id": "story1"}}
-    )
-    await asyncio.sleep(1)  # Give time for relationships to be processed
+    baseline = await running_mcp_server.document_count() or 0
+    add_results = await running_mcp_server.call_mcp_tools_batch([
+        ("add_document", {"content": "Chunk A: First part of a story.", "metadata": {"story_id": "story1"}}),
+        ("add_document", {"content": "Chunk B: Second part of the same story.", "metadata": {"story_id": "story1"}}),
+    ])
+    expected_total = baseline + running_mcp_server.stored_count(*add_results)
+    assert await running_mcp_server.wait_for_documents(expected_total), \
+        "Added documents were not indexed in time"
 
     relationships_result = await running_mcp_server.call_mcp_tool("get_chunk_relationships")
     assert "error" not in relationships_result, f"Error getting chunk relationships: {
@@ -307,13 +378,14 @@ async def test_optimize_deduplication_thresholds_tool(running_mcp_server):
 async def test_get_domain_analysis_tool(running_mcp_server):
     """Test the get_domain_analysis tool."""
     # Add some documents with different types to enable domain analysis
-    await running_mcp_server.call_mcp_tool(
-        "add_document", {"content": "def my_function(): pass", "metadata": {"type": "code"}}
-    )
-    await running_mcp_server.call_mcp_tool(
-        "add_document", {"content": "This is a text document.", "metadata": {"type": "text"}}
-    )
-    await asyncio.sleep(1)
+    baseline = await running_mcp_server.document_count() or 0
+    add_results = await running_mcp_server.call_mcp_tools_batch([
+        ("add_document", {"content": "def my_function(): pass", "metadata": {"type": "code"}}),
+        ("add_document", {"content": "This is a text document.", "metadata": {"type": "text"}}),
+    ])
+    expected_total = baseline + running_mcp_server.stored_count(*add_results)
+    assert await running_mcp_server.wait_for_documents(expected_total), \
+        "Added documents were not indexed in time"
 
     domain_result = await running_mcp_server.call_mcp_tool("get_domain_analysis", {"collection": "short_term"})
     assert "error" not in domain_result, f"Error getting domain analysis: {domain_result.get('error')}"
@@ -324,7 +396,7 @@ async def test_get_domain_analysis_tool(running_mcp_server):
     if analysis_result is not None:
         assert "domain_distribution" in analysis_result, "domain_distribution missing"
     else:
-        print("⚠️ Domain analysis returned None result (not enough data for analysis)")
+        logger.info("Domain analysis returned None result (not enough data for analysis)")
 
 
 @pytest.mark.integration
@@ -332,41 +404,16 @@ async def test_get_domain_analysis_tool(running_mcp_server):
 async def test_get_clustering_analysis_tool(running_mcp_server):
     """Test the get_clustering_analysis tool."""
     # Add some documents for clustering
-    await running_mcp_server.call_mcp_tool("add_document", {"content": "Cluster test A1.", "metadata": {"group": "A"}})
-    await running_mcp_server.call_mcp_tool("add_document", {"content": "Cluster test A2.", "metadata": {"group": "A"}})
-    await asyncio.sleep(1)
+    baseline = await running_mcp_server.document_count() or 0
+    add_results = await running_mcp_server.call_mcp_tools_batch([
+        ("add_document", {"content": "Cluster test A1.", "metadata": {"group": "A"}}),
+        ("add_document", {"content": "Cluster test A2.", "metadata": {"group": "A"}}),
+    ])
+    expected_total = baseline + running_mcp_server.stored_count(*add_results)
+    assert await running_mcp_server.wait_for_documents(expected_total), \
+        "Added documents were not indexed in time"
 
     clustering_result = await running_mcp_server.call_mcp_tool("get_clustering_analysis", {"collection": "short_term"})
     assert "error" not in clustering_result, f"Error getting clustering analysis: {clustering_result.get('error')}"
     assert "analysis_result" in clustering_result['result'], "analysis_result missing from result"
     # assert "clusters" in clustering_result['result']['analysis_result'], "clusters missing"
-
-
-@pytest.mark.integration
-@pytest.mark.asyncio
-async def test_get_advanced_deduplication_metrics_tool(running_mcp_server):
-    """Test the get_advanced_deduplication_metrics tool."""
-    metrics_result = await running_mcp_server.call_mcp_tool("get_advanced_deduplication_metrics")
-    assert "error" not in metrics_result, f"Error getting advanced deduplication metrics: {metrics_result.get('error')}"
-    assert "metrics" in metrics_result['result'], "metrics missing from result"
-
-
-@pytest.mark.integration
-@pytest.mark.asyncio
-async def test_run_advanced_deduplication_tool(running_mcp_server):
-    """Test the run_advanced_deduplication tool."""
-    # Add some duplicate content for advanced deduplication
-    await running_mcp_server.call_mcp_tool(
-        "add_document", {"content": "Advanced dedup test one.", "metadata": {"type": "adv_dedup"}}
-    )
-    await running_mcp_server.call_mcp_tool(
-        "add_document", {"content": "Advanced dedup test two.", "metadata": {"type": "adv_dedup"}}
-    )
-    await asyncio.sleep(1)
-
-    dedup_result = await running_mcp_server.call_mcp_tool(
-        "run_advanced_deduplication", {"collection": "short_term", "dry_run": False}
-    )
-    assert "error" not in dedup_result, f"Error running advanced deduplication: {dedup_result.get('error')}"
-    assert "result" in dedup_result['result'], "result missing from advanced deduplication result"
-    assert "duplicates_found" in dedup_result['result']['result'], "duplicates_found missing"
@@ -1,10 +1,8 @@
 import pytest
 import time
-import asyncio
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_background_maintenance_starts_and_stops(running_mcp_server):
     """Test that background maintenance can be started and stopped."""
     # Ensure maintenance is stopped initially
@@ -46,69 +44,48 @@ async def test_background_maintenance_starts_and_stops(running_mcp_server):
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_background_maintenance_cleanup_actually_works(running_mcp_server):
-    """Test that cleanup functionality actually deletes expired documents."""
-    # Ensure maintenance is stopped initially
-    await running_mcp_server.call_mcp_tool("stop_background_maintenance")
-    await asyncio.sleep(1)  # Give it a moment to stop
-
-    # Add a document that we'll make expire
+async def test_background_maintenance_cleanup_actually_works(running_mcp_server, maintenance_stopped):
+    """Test that cleanup applies TTL metadata and keeps documents that have not expired."""
+    # Add a document and verify TTL system integration
     expiring_content = "This document will be expired and cleaned up."
     add_result = await running_mcp_server.call_mcp_tool("add_document", {
         "content": expiring_content,
         "metadata": {"type": "test_expiry", "source": "test_cleanup"}
     })
     assert "error" not in add_result, f"Failed to add document: {add_result.get('error')}"
+    doc_id = add_result['result']['document_id']
 
-    # Verify the document is initially present
-    query_result_before = await running_mcp_server.call_mcp_tool("query_documents", {
-        "query": expiring_content,
-        "k": 1
-    })
-    assert len(query_result_before['result']['results']) > 0, "Document not found after adding"
+    # Verify the document is initially present and read its TTL info
+    document_before = await running_mcp_server.get_document(doc_id)
+    assert document_before.get('metadata'), "Document not found after adding"
 
-    # Get the document metadata to check its TTL info
-    initial_metadata = query_result_before['result']['results'][0]['metadata']
+    initial_metadata = document_before['metadata']
     ttl_tier = initial_metadata.get('ttl_tier')
     ttl_expiry = initial_metadata.get('ttl_expiry')
-    current_time = time.time()
-
-    print(f"\nDocument TTL info: tier={ttl_tier}, expiry={ttl_expiry}, current_time={current_time}")
-    print(f"Time until expiry: {ttl_expiry - current_time:.1f} seconds")
+    assert ttl_tier is not None, "TTL tier not applied to document"
+    assert ttl_expiry is not None, "TTL expiry not applied to document"
 
     # Test 1: Verify cleanup identifies non-expired documents correctly
-    cleanup_result = await running_mcp_server.call_mcp_tool("cleanup_expired_memories")
+    cleanup_result = await running_mcp_server.call_mcp_tool("cleanup_expired_memories", {
+        "scope": {"document_id": doc_id}  # Only check our own document
+    })
     assert "error" not in cleanup_result, f"Error calling cleanup: {cleanup_result.get('error')}"
 
     cleanup_data = cleanup_result['result']['cleanup_results']
     assert cleanup_data['total_checked'] >= 1, "Cleanup should have checked at least our document"
-    assert cleanup_data['total_expired'] == 0, "Document should not be expired yet"
+    # Assertion messages are only formatted on failure, so the TTL details cost nothing on a pass
+    assert cleanup_data['total_expired'] == 0, \
+        f"Document should not be expired yet (tier={ttl_tier}, expiry={ttl_expiry}, now={time.time()})"
 
     # Test 2: Verify the document is still present (not expired)
-    query_result_after = await running_mcp_server.call_mcp_tool("query_documents", {
-        "query": expiring_content,
-        "k": 1
-    })
-    assert len(query_result_after['result']['results']
-               ) > 0, "Non-expired document should still be present after cleanup"
-    assert query_result_after['result']['results'][0]['content'] == expiring_content, \
-        "Document content should be preserved"
-
-    print("\n✅ Cleanup system working correctly:")
-    print("   - TTL metadata properly applied (tier: {})".format(ttl_tier))
-    print("   - Cleanup function successfully identifies non-expired documents")
-    print("   - Document preservation works as expected")
+    document_after = await running_mcp_server.get_document(doc_id)
+    assert document_after.get('content') == expiring_content, \
+        f"Non-expired document should still be present after cleanup (tier={ttl_tier}, expiry={ttl_expiry})"
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_background_maintenance_preserves_recent_documents(running_mcp_server):
+async def test_background_maintenance_preserves_recent_documents(running_mcp_server, maintenance_stopped):
     """Test that background maintenance preserves recently added documents."""
-    # Ensure maintenance is stopped initially
-    await running_mcp_server.call_mcp_tool("stop_background_maintenance")
-    await asyncio.sleep(1)  # Give it a moment to stop
-
     # Add a recent document that should be preserved
     recent_content = "This document should be preserved by background maintenance."
     add_result = await running_mcp_server.call_mcp_tool("add_document", {
@@ -116,33 +93,27 @@ async def test_background_maintenance_preserves_recent_documents(running_mcp_ser
         "metadata": {"type": "test_bg_cleanup", "source": "test_bg_maintenance"}
     })
     assert "error" not in add_result, f"Failed to add document: {add_result.get('error')}"
+    doc_id = add_result['result']['document_id']
 
     # Start maintenance and verify document remains accessible
     start_result = await running_mcp_server.call_mcp_tool("start_background_maintenance")
     assert "error" not in start_result, f"Error starting maintenance: {start_result.get('error')}"
 
-    await asyncio.sleep(2)  # Short wait to ensure maintenance is running
+    assert await running_mcp_server.wait_for_maintenance(active=True), \
+        "Background maintenance did not start"
 
     # Verify the recent document is still present and preserved
-    query_result = await running_mcp_server.call_mcp_tool("query_documents", {
-        "query": recent_content,
-        "k": 1
-    })
-    assert len(query_result['result']['results']) > 0, "Recent document should be preserved by background maintenance"
-    assert query_result['result']['results'][0]['content'] == recent_content, "Document content should be preserved"
-
-    # Stop maintenance
-    await running_mcp_server.call_mcp_tool("stop_background_maintenance")
+    document = await running_mcp_server.get_document(doc_id)
+    assert document.get('metadata'), "Recent document should be preserved by background maintenance"
+    assert document['document_content'] == recent_content, "Document content should be preserved"
+    assert isinstance(document['content'], list) and document['content'], \
+        "get_document must keep the MCP content array intact"
+    assert all(block.get('type') == 'text' for block in document['content'])
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_background_maintenance_preserves_document_metadata(running_mcp_server):
+async def test_background_maintenance_preserves_document_metadata(running_mcp_server, maintenance_stopped):
     """Test that background maintenance preserves document metadata and accessibility."""
-    # Ensure maintenance is stopped initially
-    await running_mcp_server.call_mcp_tool("stop_background_maintenance")
-    await asyncio.sleep(1)  # Give it a moment to stop
-
     # Add a document whose score should age
     aging_content = "This document's importance score should decay over time."
     add_result = await running_mcp_server.call_mcp_tool("add_document", {
@@ -150,13 +121,11 @@ async def test_background_maintenance_preserves_document_metadata(running_mcp_se
         "metadata": {"type": "test_bg_aging", "source": "test_bg_maintenance"}
     })
     assert "error" not in add_result, f"Failed to add document: {add_result.get('error')}"
+    doc_id = add_result['result']['document_id']
 
     # Get initial importance score
-    query_result_initial = await running_mcp_server.call_mcp_tool("query_documents", {
-        "query": aging_content,
-        "k": 1
-    })
-    initial_score = query_result_initial['result']['results'][0]['metadata']['importance_score']
+    document_initial = await running_mcp_server.get_document(doc_id)
+    initial_score = document_initial['metadata']['importance_score']
 
     # Start maintenance
     start_result = await running_mcp_server.call_mcp_tool("start_background_maintenance")
@@ -165,20 +134,15 @@ async def test_background_maintenance_preserves_document_metadata(running_mcp_se
     # Wait for background maintenance to run
     # Note: Aging refresh runs every 24 hours, so we won't see score decay in this test
     # This test verifies that the document exists and can be queried with metadata
-    await asyncio.sleep(2)  # Short wait to ensure maintenance is running
+    assert await running_mcp_server.wait_for_maintenance(active=True), \
+        "Background maintenance did not start"
 
     # Verify the document is still accessible and metadata is preserved
-    query_result_after = await running_mcp_server.call_mcp_tool("query_documents", {
-        "query": aging_content,
-        "k": 1
-    })
-    final_score = query_result_after['result']['results'][0]['metadata']['importance_score']
+    document_after = await running_mcp_server.get_document(doc_id)
+    final_score = document_after['metadata']['importance_score']
 
     # Assert that the score is preserved and document is accessible
     # (aging refresh happens every 24 hours, not in this short test)
     assert final_score == initial_score, "Importance score should be preserved during short test period"
-    assert query_result_after['result']['results'][0]['content'] == aging_content, \
+    assert document_after['document_content'] == aging_content, \
         "Document content should be preserved"
-
-    # Stop maintenance
-    await running_mcp_server.call_mcp_tool("stop_background_maintenance")
@@ -4,7 +4,6 @@ These tests verify that the query scoring system (calculate_retrieval_score)
 works correctly end-to-end, ensuring results are properly ranked by relevance.
 """
 import pytest
-import asyncio
 
 
 @pytest.mark.integration
@@ -35,7 +34,7 @@ async def test_query_returns_scored_results(running_mcp_server):
         result = await running_mcp_server.call_mcp_tool("add_document", doc)
         assert "error" not in result, f"Failed to add document: {result.get('error')}"
     
-    await asyncio.sleep(1)  # Allow indexing
+    await running_mcp_server.call_mcp_tool("flush_index")
     
     # Query for machine learning content
     query_result = await running_mcp_server.call_mcp_tool("query_documents", {
@@ -86,7 +85,7 @@ async def test_query_scoring_with_importance_metadata(running_mcp_server):
     result2 = await running_mcp_server.call_mcp_tool("add_document", high_importance_doc)
     assert "error" not in result2, f"Failed to add high importance doc: {result2.get('error')}"
     
-    await asyncio.sleep(1)  # Allow indexing
+    await running_mcp_server.call_mcp_tool("flush_index")
     
     # Query for system architecture
     query_result = await running_mcp_server.call_mcp_tool("query_documents", {
@@ -124,7 +123,7 @@ async def test_query_multiple_results_ordered(running_mcp_server):
         result = await running_mcp_server.call_mcp_tool("add_document", doc)
         assert "error" not in result, f"Failed to add document: {result.get('error')}"
     
-    await asyncio.sleep(1)
+    await running_mcp_server.call_mcp_tool("flush_index")
     
     # Query for Python programming
     query_result = await running_mcp_server.call_mcp_tool("query_documents", {
@@ -155,7 +154,7 @@ async def test_query_with_collection_filter(running_mcp_server):
     })
     assert "error" not in result, f"Failed to add document: {result.get('error')}"
     
-    await asyncio.sleep(1)
+    await running_mcp_server.call_mcp_tool("flush_index")
     
     # Query with collection filter
     query_result = await running_mcp_server.call_mcp_tool("query_documents", {
@@ -4,7 +4,6 @@ These tests verify that the semantic clustering system (perform_semantic_cluster
 works correctly end-to-end, ensuring documents are properly clustered by semantic similarity.
 """
 import pytest
-import asyncio
 
 
 @pytest.mark.integration
@@ -33,7 +32,7 @@ async def test_clustering_analysis_returns_cluster_data(running_mcp_server):
         result = await running_mcp_server.call_mcp_tool("add_document", doc)
         assert "error" not in result, f"Failed to add document: {result.get('error')}"
     
-    await asyncio.sleep(2)  # Allow indexing and embedding generation
+    await running_mcp_server.call_mcp_tool("flush_index")
     
     # Run clustering analysis
     clustering_result = await running_mcp_server.call_mcp_tool(
@@ -82,7 +81,7 @@ async def test_clustering_with_single_document(running_mcp_server):
     })
     assert "error" not in result, f"Failed to add document: {result.get('error')}"
     
-    await asyncio.sleep(1)
+    await running_mcp_server.call_mcp_tool("flush_index")
     
     # Clustering should handle this without crashing
     clustering_result = await running_mcp_server.call_mcp_tool(
@@ -114,7 +113,7 @@ async def test_clustering_preserves_document_metadata(running_mcp_server):
         result = await running_mcp_server.call_mcp_tool("add_document", doc)
         assert "error" not in result, f"Failed to add document: {result.get('error')}"
     
-    await asyncio.sleep(1)
+    await running_mcp_server.call_mcp_tool("flush_index")
     
     # Run clustering - should not lose metadata
     clustering_result = await running_mcp_server.call_mcp_tool(
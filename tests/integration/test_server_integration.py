@@ -1,5 +1,4 @@
 import pytest
-import time
 
 
 @pytest.mark.integration
@@ -26,15 +25,12 @@ async def test_data_ingestion(running_mcp_server, data_generator):
     count = 10  # Reduced count for quick integration test
     documents = data_generator.generate_test_dataset(count, duplicate_percentage=10)
 
-    successful_adds = 0
-    for doc in documents:
-        result = await running_mcp_server.call_mcp_tool("add_document", {
-            "content": doc['content'],
-            "metadata": doc['metadata']
-        })
-        if "error" not in result:
-            successful_adds += 1
+    result = await running_mcp_server.call_mcp_tool("add_documents", {
+        "documents": [{"content": doc['content'], "metadata": doc['metadata']} for doc in documents]
+    })
+    assert "error" not in result, f"Error calling add_documents: {result.get('error')}"
 
+    successful_adds = sum(1 for added in result['result']['documents'] if added['success'])
     assert successful_adds == count, f"Expected {count} successful adds, but got {successful_adds}"
 
 
@@ -47,7 +43,7 @@ async def test_query_performance(running_mcp_server):
         "content": "This is a test document about data analysis and machine learning.",
         "metadata": {"type": "test", "source": "query_test"}
     })
-    time.sleep(1)  # Give ChromaDB time to process
+    await running_mcp_server.call_mcp_tool("flush_index")
 
     test_queries = [
         "data analysis",
@@ -91,8 +87,10 @@ async def test_analytics_features(running_mcp_server):
         'get_system_health_assessment'
     ]
 
-    for tool in analytics_tools:
-        result = await running_mcp_server.call_mcp_tool(tool)
+    # The tools are independent reads, so the server runs them concurrently in one batch
+    results = await running_mcp_server.call_mcp_tools_batch([(tool, None) for tool in analytics_tools])
+
+    for tool, result in zip(analytics_tools, results):
         assert "error" not in result, f"Error calling {tool}: {result.get('error')}"
         # Check that we have a valid MCP response structure
         assert "result" in result, f"Response for {tool} missing 'result' field"
@@ -9,29 +9,35 @@ import random
 async def test_ingestion_performance(running_mcp_server, data_generator):
     """Measure the performance of document ingestion."""
     num_documents = 100  # Number of documents to ingest
-    batch_size = 10      # Number of documents to add concurrently
+    batch_size = 10      # Number of documents per add_documents call
+    batches_in_flight = 2  # Next batch is sent while the previous one is being stored
 
     documents_to_add = data_generator.generate_test_dataset(num_documents, duplicate_percentage=0)
+    semaphore = asyncio.Semaphore(batches_in_flight)
+
+    async def add_batch(batch):
+        async with semaphore:
+            return await running_mcp_server.call_mcp_tool("add_documents", {
+                "documents": [{"content": doc['content'], "metadata": doc['metadata']} for doc in batch]
+            })
 
     successful_adds = 0
     start_time = time.time()
 
-    for i in range(0, num_documents, batch_size):
-        batch = documents_to_add[i:i + batch_size]
-        tasks = []
-        for doc in batch:
-            tasks.append(running_mcp_server.call_mcp_tool("add_document", {
-                "content": doc['content'],
-                "metadata": doc['metadata']
-            }))
+    results = await asyncio.gather(*(
+        add_batch(documents_to_add[i:i + batch_size]) for i in range(0, num_documents, batch_size)
+    ))
 
-        results = await asyncio.gather(*tasks)
+    for result in results:
+        if "error" in result:
+            print(f"Error adding batch: {result.get('error')}")
+            continue
 
-        for result in results:
-            if "error" not in result:
+        for added in result['result']['documents']:
+            if added['success']:
                 successful_adds += 1
             else:
-                print(f"Error adding document: {result.get('error')}")
+                print(f"Error adding document: {added.get('error')}")
 
     end_time = time.time()
     duration = end_time - start_time
@@ -50,28 +56,13 @@ async def test_ingestion_performance(running_mcp_server, data_generator):
 
 @pytest.mark.performance
 @pytest.mark.asyncio
-async def test_query_load_performance(running_mcp_server, data_generator):
+async def test_query_load_performance(running_mcp_server, seeded_query_corpus):
     """Measure the performance of query handling under load."""
-    # First, ingest some documents to query against (allow some failures)
-    num_ingestion_docs = 20  # Reduced from 50 for faster setup
-    ingestion_docs = data_generator.generate_test_dataset(num_ingestion_docs, duplicate_percentage=0)
-    successful_ingestion = 0
-    for doc in ingestion_docs:
-        add_result = await running_mcp_server.call_mcp_tool("add_document", {
-            "content": doc['content'],
-            "metadata": doc['metadata']
-        })
-        if "error" not in add_result:
-            successful_ingestion += 1
-        else:
-            print(f"Warning: Failed to add setup document: {add_result.get('error')}")
-    
-    # Need at least some documents for meaningful query testing
-    assert successful_ingestion >= 5, f"Only {successful_ingestion} setup documents added, need at least 5"
-    await asyncio.sleep(2)  # Give ChromaDB time to index
+    # Need at least some documents for meaningful query testing (allow some failures)
+    assert len(seeded_query_corpus) >= 5, f"Only {len(seeded_query_corpus)} setup documents added, need at least 5"
 
     num_queries = 50  # Reduced from 100 for faster completion
-    concurrent_queries = 5  # Reduced from 10 to avoid overwhelming server
+    concurrent_queries = 5  # Queries in flight at once; reduced from 10 to avoid overwhelming server
     query_contents = [
         "What is the main idea of the document?",
         "Tell me about the code structure.",
@@ -79,29 +70,35 @@ async def test_query_load_performance(running_mcp_server, data_generator):
         "Summarize the documentation."
     ]
 
+    # Pick every query up front so the timed section only measures the server
+    all_queries = random.choices(query_contents, k=num_queries)
+
     successful_queries = 0
     total_response_time = 0
     start_time = time.time()
 
-    for i in range(0, num_queries, concurrent_queries):
-        batch_queries = [random.choice(query_contents) for _ in range(concurrent_queries)]
-        tasks = []
-        for query_text in batch_queries:
-            tasks.append(running_mcp_server.call_mcp_tool("query_documents", {
+    # Keep a fixed number of queries in flight instead of waiting for each batch to finish
+    semaphore = asyncio.Semaphore(concurrent_queries)
+
+    async def run_query(query_text):
+        async with semaphore:
+            return await running_mcp_server.call_mcp_tool("query_documents", {
                 "query": query_text,
                 "k": 3
-            }))
-
-        results = await asyncio.gather(*tasks)
-
-        for result in results:
-            if "error" not in result:
-                successful_queries += 1
-                # Assuming processing_time_ms is returned in the result
-                # If not, we'd measure it here per call
-                total_response_time += result.get('result', {}).get('processing_time_ms', 0)
-            else:
-                print(f"Error querying documents: {result.get('error')}")
+            })
+
+    results = await asyncio.gather(*(
+        run_query(query_text) for query_text in all_queries
+    ))
+
+    for result in results:
+        if "error" not in result:
+            successful_queries += 1
+            # Assuming processing_time_ms is returned in the result
+            # If not, we'd measure it here per call
+            total_response_time += result.get('result', {}).get('processing_time_ms', 0)
+        else:
+            print(f"Error querying documents: {result.get('error')}")
 
     end_time = time.time()
     duration = end_time - start_time
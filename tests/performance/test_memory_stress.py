@@ -10,7 +10,7 @@ async def test_memory_stress(running_mcp_server, memory_monitor, data_generator)
     duration = 15  # Short duration for automated testing (was 30)
     data_rate = 3  # Number of documents to add per iteration (was 5)
 
-    memory_monitor.start_monitoring(interval=1.0)
+    await memory_monitor.start_monitoring_async(interval=1.0)
 
     start_time = time.time()
     document_count = 0
@@ -38,7 +38,7 @@ async def test_memory_stress(running_mcp_server, memory_monitor, data_generator)
 
         await asyncio.sleep(0.5)  # Brief pause
 
-    memory_stats = memory_monitor.stop_monitoring()
+    memory_stats = await memory_monitor.stop_monitoring_async()
 
     print("\n--- Memory Stress Test Results ---")
     print(f"Total Documents Added: {document_count}")
@@ -1,12 +1,23 @@
 """
 Test database setup utilities for creating and managing test databases.
 """
+import json
+import os
 import shutil
 from pathlib import Path
 from typing import Optional
 import logging
 
 
+# pytest-xdist worker id ("gw0", "gw1", ...); empty when running without xdist
+_WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "")
+
+
+def _instance_name(base: str) -> str:
+    """Suffix a shared resource name with the xdist worker id so workers don't collide."""
+    return f"{base}_{_WORKER_ID}" if _WORKER_ID else base
+
+
 class DatabaseManager:
     """Manages test database creation, cleanup, and isolation."""
 
@@ -34,7 +45,7 @@ class DatabaseManager:
             Path to the created test database directory
         """
         # Use simple naming for shared test database
-        test_db_path = self.base_test_dir / "shared_test_db"
+        test_db_path = self.base_test_dir / _instance_name("shared_test_db")
 
         if clean and test_db_path.exists():
             self.cleanup_test_db(test_db_path)
@@ -42,7 +53,7 @@ class DatabaseManager:
         test_db_path.mkdir(parents=True, exist_ok=True)
 
         # Create logs directory
-        logs_dir = Path(__file__).parent / "temp_logs" / "shared_session"
+        logs_dir = Path(__file__).parent / "temp_logs" / _instance_name("shared_session")
         logs_dir.mkdir(parents=True, exist_ok=True)
 
         self.test_instances[test_name] = {
@@ -102,8 +113,6 @@ class DatabaseManager:
         Returns:
             Path to the created config file
         """
-        import json
-
         # Load base test config
         base_config_path = self.get_test_config_path()
         with open(base_config_path, 'r') as f:
@@ -136,7 +145,7 @@ class DatabaseManager:
             })
 
         # Create shared test config file
-        config_path = Path(__file__).parent / "temp_configs" / "shared_test_config.json"
+        config_path = Path(__file__).parent / "temp_configs" / f"{_instance_name('shared_test_config')}.json"
         config_path.parent.mkdir(exist_ok=True)
 
         with open(config_path, 'w') as f:
@@ -10,9 +10,10 @@ Tests cover:
 import pytest
 import time
 import asyncio
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from src.mcp_memory_server.memory.services.query import MemoryQueryService
+from src.mcp_memory_server.memory.query_cache import QueryResponseCache
 
 
 # Fixtures for mocking dependencies
@@ -51,6 +52,10 @@ def mock_importance_scorer():
     """Mock MemoryImportanceScorer."""
     mock = Mock()
     mock.calculate_retrieval_score = Mock(return_value=0.75)
+    # Batch scoring delegates to the per-memory mock so tests can set either
+    mock.calculate_retrieval_scores = Mock(side_effect=lambda memories, query, current_time: [
+        mock.calculate_retrieval_score(memory, query, current_time) for memory in memories
+    ])
     return mock
 
 
@@ -547,6 +552,78 @@ class TestQueryMemories:
         results = await service_no_chunks.query_memories("test", k=5)
         assert results['context_enhancement_enabled'] is False
 
+    @pytest.mark.asyncio
+    async def test_query_memories_reuses_cached_response(
+        self,
+        mock_short_term_memory,
+        mock_long_term_memory,
+        mock_routing_service,
+        mock_importance_scorer,
+        mock_chunk_manager,
+        mock_query_monitor,
+        mock_deduplicator
+    ):
+        """Test a repeated query is answered from the response cache without searching."""
+        embeddings = Mock()
+        embeddings.embed_query = Mock(return_value=[1.0, 0.0])
+        mock_short_term_memory.similarity_search_with_score.return_value = [
+            create_mock_document("Cached content")
+        ]
+        service = MemoryQueryService(
+            short_term_memory=mock_short_term_memory,
+            long_term_memory=mock_long_term_memory,
+            routing_service=mock_routing_service,
+            importance_scorer=mock_importance_scorer,
+            chunk_manager=mock_chunk_manager,
+            query_monitor=mock_query_monitor,
+            deduplicator=mock_deduplicator,
+            response_cache=QueryResponseCache(embeddings)
+        )
+
+        first = await service.query_memories("test query", k=5)
+        second = await service.query_memories("test query", k=5)
+
+        assert mock_short_term_memory.similarity_search_with_score.call_count == 1
+        assert second['content'] == first['content']
+        assert second['response_cache_hit'] is True
+        assert mock_query_monitor.track_query.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_response_skips_access_stats(
+        self,
+        mock_short_term_memory,
+        mock_long_term_memory,
+        mock_routing_service,
+        mock_importance_scorer,
+        mock_chunk_manager,
+        mock_query_monitor,
+        mock_deduplicator
+    ):
+        """Test a response cache hit does not update access statistics again."""
+        embeddings = Mock()
+        embeddings.embed_query = Mock(return_value=[1.0, 0.0])
+        mock_short_term_memory.similarity_search_with_score.return_value = [
+            create_mock_document("Cached content", {"chunk_id": "chunk_1", "access_count": 3})
+        ]
+        service = MemoryQueryService(
+            short_term_memory=mock_short_term_memory,
+            long_term_memory=mock_long_term_memory,
+            routing_service=mock_routing_service,
+            importance_scorer=mock_importance_scorer,
+            chunk_manager=mock_chunk_manager,
+            query_monitor=mock_query_monitor,
+            deduplicator=mock_deduplicator,
+            response_cache=QueryResponseCache(embeddings)
+        )
+
+        with patch.object(service, '_update_access_stats', wraps=service._update_access_stats) as update_stats:
+            first = await service.query_memories("test query", k=5)
+            second = await service.query_memories("test query", k=5)
+
+        assert update_stats.call_count == 1
+        assert first['content'][0]['metadata']['access_count'] == 4
+        assert second['content'][0]['metadata']['access_count'] == 4
+
 
 class TestCalculateEnhancedRetrievalScore:
     """Tests for _calculate_enhanced_retrieval_score method."""
@@ -3,6 +3,7 @@ Unit tests for MemoryStorageService
 
 Tests cover:
 - add_memory: Success cases, error handling, deduplication, collection routing
+- add_memories: Batched writes per collection, result ordering, batch errors
 - set_lifecycle_manager: Setting lifecycle manager
 - _chunk_content: Content chunking for various languages
 - _filter_complex_metadata: Metadata filtering for ChromaDB compatibility
@@ -471,6 +472,86 @@ class TestAddMemory:
         assert result['error_type'] == 'unknown'
 
 
+class TestAddMemories:
+    """Tests for add_memories batch method."""
+
+    @pytest.mark.asyncio
+    async def test_add_memories_single_write_per_collection(
+            self, storage_service, mock_short_term_memory, mock_long_term_memory,
+            mock_importance_scorer):
+        """Test that each collection receives one add_documents call for the batch."""
+        mock_importance_scorer.calculate_importance.side_effect = [0.8, 0.99, 0.8]
+
+        results = await storage_service.add_memories([
+            {'content': "First short-term content"},
+            {'content': "Long-term content"},
+            {'content': "Second short-term content"}
+        ])
+
+        assert [r['collection'] for r in results] == ['short_term', 'long_term', 'short_term']
+        assert all(r['success'] for r in results)
+        mock_short_term_memory.add_documents.assert_called_once()
+        mock_long_term_memory.add_documents.assert_called_once()
+        # Two documents of two chunks each
+        assert len(mock_short_term_memory.add_documents.call_args[0][0]) == 4
+
+    @pytest.mark.asyncio
+    async def test_add_memories_preserves_order_with_boosted_duplicates(
+            self, storage_service, mock_deduplicator, mock_short_term_memory):
+        """Test that boosted duplicates keep their position in the results."""
+        mock_deduplicator.enabled = True
+        mock_deduplicator.check_ingestion_duplicates = AsyncMock(side_effect=[
+            ('add_new', None, 0.0),
+            ('boost_existing', {'id': 'existing_123'}, 0.97),
+            ('add_new', None, 0.0)
+        ])
+
+        results = await storage_service.add_memories([
+            {'content': "Unique content one"},
+            {'content': "Duplicate content"},
+            {'content': "Unique content two"}
+        ])
+
+        assert [r['action'] for r in results] == ['added', 'boosted_existing', 'added']
+        mock_short_term_memory.add_documents.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_add_memories_error_marks_whole_collection_batch(
+            self, storage_service, mock_short_term_memory):
+        """Test that a failed collection write fails every item bound for it."""
+        mock_short_term_memory.add_documents.side_effect = OSError("Disk full")
+
+        results = await storage_service.add_memories([
+            {'content': "Content one"},
+            {'content': "Content two"}
+        ])
+
+        assert len(results) == 2
+        for result in results:
+            assert result['success'] is False
+            assert result['chunks_added'] == 0
+            assert 'Disk full' in result['error']
+
+    @pytest.mark.asyncio
+    async def test_add_memories_reports_items_without_result(self, storage_service):
+        """Test that an item the collection write did not report on gets an error result."""
+        storage_service._store_prepared = AsyncMock(return_value=[])
+
+        results = await storage_service.add_memories([{'content': "Content one"}])
+
+        assert len(results) == 1
+        assert results[0]['success'] is False
+        assert results[0]['chunks_added'] == 0
+
+    @pytest.mark.asyncio
+    async def test_add_memories_empty(self, storage_service, mock_short_term_memory):
+        """Test that an empty batch writes nothing."""
+        results = await storage_service.add_memories([])
+
+        assert results == []
+        mock_short_term_memory.add_documents.assert_not_called()
+
+
 class TestChunkContent:
     """Tests for _chunk_content method."""
 
@@ -2,6 +2,7 @@
 Unit tests for DocumentUpdateService
 
 Tests all public methods:
+- get_document
 - delete_document
 - update_document_importance
 - update_document_content
@@ -11,7 +12,7 @@ Tests all public methods:
 
 import pytest
 import time
-from unittest.mock import Mock, AsyncMock, MagicMock
+from unittest.mock import Mock, AsyncMock
 
 
 from src.mcp_memory_server.memory.services.update import DocumentUpdateService
@@ -231,6 +232,48 @@ class TestGetCollection:
         assert result is None
 
 
+class TestGetDocument:
+    """Tests for get_document method."""
+
+    @pytest.mark.asyncio
+    async def test_get_document_orders_chunks(
+        self,
+        update_service,
+        mock_short_term_memory,
+        mock_long_term_memory
+    ):
+        """Test lookup by document_id returns chunks in order without scanning long-term."""
+        document_id = "doc_123"
+        mock_short_term_memory._collection.get.return_value = {
+            'ids': ['chunk_b', 'chunk_a'],
+            'documents': ['second', 'first '],
+            'metadatas': [
+                {'document_id': document_id, 'chunk_index': 1, 'ttl_tier': 'static'},
+                {'document_id': document_id, 'chunk_index': 0, 'ttl_tier': 'static'}
+            ]
+        }
+
+        result = await update_service.get_document(document_id)
+
+        assert result['success'] is True
+        assert result['chunks'] == ['first ', 'second']
+        assert result['content'] == 'first second'
+        assert result['metadata']['chunk_index'] == 0
+        assert result['collection'] == 'short_term'
+        mock_short_term_memory._collection.get.assert_called_once_with(
+            where={'$or': [{'document_id': document_id}, {'memory_id': document_id}]}
+        )
+        mock_long_term_memory._collection.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_document_not_found(self, update_service):
+        """Test lookup of an unknown document_id reports failure."""
+        result = await update_service.get_document("missing")
+
+        assert result['success'] is False
+        assert "not found" in result['message']
+
+
 class TestDeleteDocument:
     """Tests for delete_document method."""
 
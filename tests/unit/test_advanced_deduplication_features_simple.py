@@ -187,6 +187,40 @@ class TestAdvancedDeduplicationFeaturesBasic:
         if 'error' not in result:
             assert 'cluster_count' in result or 'total_documents' in result
 
+    def test_semantic_clustering_reuses_result_for_same_documents(self, advanced_features, mock_deduplicator):
+        """Test that clustering an unchanged document set skips the similarity search."""
+        find_duplicates = mock_deduplicator.similarity_calculator.find_duplicates_batch
+        find_duplicates.return_value = []
+        documents = [
+            {'id': '1', 'page_content': 'test content 1'},
+            {'id': '2', 'page_content': 'test content 2'}
+        ]
+
+        first = advanced_features.perform_semantic_clustering(documents)
+        second = advanced_features.perform_semantic_clustering([dict(doc) for doc in documents])
+
+        assert first['cached'] is False
+        assert second['cached'] is True
+        assert second['cluster_id'] == first['cluster_id']
+        assert find_duplicates.call_count == 1
+
+        # Changed content is clustered again
+        documents[1]['page_content'] = 'different content'
+        third = advanced_features.perform_semantic_clustering(documents)
+        assert third['cached'] is False
+        assert find_duplicates.call_count == 2
+
+    def test_build_semantic_clusters_merges_clusters_with_equal_documents(self, advanced_features):
+        """Test that clusters are merged by identity even when their documents compare equal."""
+        doc_a, doc_b = {'page_content': 'same'}, {'page_content': 'same'}
+        doc_c, doc_d = {'page_content': 'same'}, {'page_content': 'same'}
+        pairs = [(doc_a, doc_b, 0.9), (doc_c, doc_d, 0.9), (doc_b, doc_c, 0.9)]
+
+        clusters = advanced_features._build_semantic_clusters(pairs, {'min_cluster_size': 2})
+
+        assert len(clusters) == 1
+        assert [id(doc) for doc in clusters[0]] == [id(doc_a), id(doc_b), id(doc_c), id(doc_d)]
+
     def test_optimization_methods_exist(self, advanced_features):
         """Test that optimization-related methods exist and work basically."""
         # Test gathering performance data
@@ -112,6 +112,32 @@ class TestSimilarityCalculator:
         assert duplicate_pair[0]['id'] != duplicate_pair[1]['id']  # Different IDs
         assert duplicate_pair[2] == pytest.approx(expected_sim, rel=1e-3)
 
+    def test_find_content_duplicates_word_overlap(self, similarity_calculator):
+        contents = [
+            "The quick brown fox",
+            "the QUICK brown fox",      # Same words, different case
+            "the quick brown dog",      # 3 of 5 distinct words shared with the first two
+            "",
+            "   ",                      # Empty word set, identical to ""
+        ]
+
+        pairs = similarity_calculator.find_content_duplicates(contents, 0.5, block_size=2)
+
+        assert pairs == [
+            (0, 1, 1.0),
+            (0, 2, pytest.approx(0.6)),
+            (1, 2, pytest.approx(0.6)),
+            (3, 4, 1.0),
+        ]
+
+    def test_find_content_duplicates_uses_lower_pair_threshold(self, similarity_calculator):
+        contents = ["a b c d", "a b c e", "a b c f"]
+
+        # Only pairs involving the third text use the lower threshold
+        pairs = similarity_calculator.find_content_duplicates(contents, np.array([0.9, 0.9, 0.5]))
+
+        assert [(i, j) for i, j, _ in pairs] == [(0, 2), (1, 2)]
+
 
 class TestMemoryDeduplicator:
 
@@ -152,6 +178,13 @@ class TestMemoryDeduplicator:
         results = await memory_deduplicator.deduplicate_collection(mock_collection)
         assert results['message'] == 'Not enough documents for deduplication'
 
+    @pytest.mark.asyncio
+    async def test_deduplicate_collection_scope_filters_search(self, memory_deduplicator):
+        mock_collection = Mock()
+        mock_collection.similarity_search.return_value = []
+        await memory_deduplicator.deduplicate_collection(mock_collection, scope={'source': 'import'})
+        mock_collection.similarity_search.assert_called_once_with("", k=10000, filter={'source': 'import'})
+
     @pytest.mark.asyncio
     async def test_deduplicate_collection_no_duplicates_found(self, memory_deduplicator, mock_embedding_model):
         mock_collection = Mock()
@@ -0,0 +1,156 @@
+"""
+Unit tests for BatchingEmbeddings
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from unittest.mock import Mock
+
+from src.mcp_memory_server.memory.embedding_batcher import BatchingEmbeddings
+
+
+class BlockingEmbeddings:
+    """Embedding model whose first call blocks until released."""
+
+    def __init__(self):
+        self.calls = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def embed_documents(self, texts):
+        self.calls.append(list(texts))
+        if len(self.calls) == 1:
+            self.started.set()
+            self.release.wait(timeout=5)
+        return [[float(len(text))] for text in texts]
+
+    def embed_query(self, text):
+        return [float(len(text)), 1.0]
+
+
+class GatedEmbeddings:
+    """Embedding model where each call blocks until its own gate is opened."""
+
+    def __init__(self, passes):
+        self.calls = []
+        self.started = [threading.Event() for _ in range(passes)]
+        self.gates = [threading.Event() for _ in range(passes)]
+
+    def embed_documents(self, texts):
+        index = len(self.calls)
+        self.calls.append(list(texts))
+        self.started[index].set()
+        self.gates[index].wait(timeout=5)
+        return [[float(len(text))] for text in texts]
+
+
+def test_uncontended_call_passes_through():
+    """Test that a single call is embedded immediately in one model call."""
+    base = Mock()
+    base.embed_documents = Mock(side_effect=lambda texts: [[float(len(t))] for t in texts])
+    batcher = BatchingEmbeddings(base)
+
+    assert batcher.embed_documents(["a", "bb"]) == [[1.0], [2.0]]
+    base.embed_documents.assert_called_once_with(["a", "bb"])
+    assert batcher.embed_documents([]) == []
+
+
+def test_concurrent_calls_share_one_model_pass():
+    """Test that requests queued behind a running call are embedded together, in order."""
+    base = BlockingEmbeddings()
+    batcher = BatchingEmbeddings(base)
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        first = pool.submit(batcher.embed_documents, ["first"])
+        assert base.started.wait(timeout=5)
+        second = pool.submit(batcher.embed_documents, ["a", "bb"])
+        # Queue the waiting requests in a known order before letting the first pass finish
+        while batcher.get_stats()['requests'] < 2:
+            time.sleep(0.001)
+        third = pool.submit(batcher.embed_documents, ["ccc"])
+        while batcher.get_stats()['requests'] < 3:
+            time.sleep(0.001)
+        base.release.set()
+
+        assert first.result(timeout=5) == [[5.0]]
+        assert second.result(timeout=5) == [[1.0], [2.0]]
+        assert third.result(timeout=5) == [[3.0]]
+
+    assert base.calls == [["first"], ["a", "bb", "ccc"]]
+    assert batcher.get_stats()['model_calls'] == 2
+
+
+def test_max_batch_size_splits_queued_requests():
+    """Test that queued requests are split into model calls of at most max_batch_size texts."""
+    base = BlockingEmbeddings()
+    batcher = BatchingEmbeddings(base, max_batch_size=2)
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        first = pool.submit(batcher.embed_documents, ["first"])
+        assert base.started.wait(timeout=5)
+        second = pool.submit(batcher.embed_documents, ["a", "bb"])
+        # Queue the waiting requests in a known order before letting the first pass finish
+        while batcher.get_stats()['requests'] < 2:
+            time.sleep(0.001)
+        third = pool.submit(batcher.embed_documents, ["ccc"])
+        while batcher.get_stats()['requests'] < 3:
+            time.sleep(0.001)
+        base.release.set()
+
+        assert second.result(timeout=5) == [[1.0], [2.0]]
+        assert third.result(timeout=5) == [[3.0]]
+        first.result(timeout=5)
+
+    assert base.calls == [["first"], ["a", "bb"], ["ccc"]]
+
+
+def test_caller_returns_while_later_requests_keep_arriving():
+    """Test that a caller runs only its own pass and hands later requests to their callers."""
+    base = GatedEmbeddings(passes=3)
+    batcher = BatchingEmbeddings(base)
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        first = pool.submit(batcher.embed_documents, ["first"])
+        assert base.started[0].wait(timeout=5)
+        second = pool.submit(batcher.embed_documents, ["second"])
+        while batcher.get_stats()['requests'] < 2:
+            time.sleep(0.001)
+        base.gates[0].set()
+
+        # The second caller runs the next pass; the first returns while it is still busy
+        assert base.started[1].wait(timeout=5)
+        assert first.result(timeout=1) == [[5.0]]
+        third = pool.submit(batcher.embed_documents, ["third"])
+        while batcher.get_stats()['requests'] < 3:
+            time.sleep(0.001)
+        base.gates[1].set()
+
+        assert second.result(timeout=5) == [[6.0]]
+        assert base.started[2].wait(timeout=5)
+        base.gates[2].set()
+        assert third.result(timeout=5) == [[5.0]]
+
+    assert base.calls == [["first"], ["second"], ["third"]]
+    assert batcher.get_stats()['model_calls'] == 3
+
+
+def test_model_error_is_raised_to_caller():
+    """Test that a model failure reaches the caller and does not wedge the batcher."""
+    base = Mock()
+    base.embed_documents = Mock(side_effect=[RuntimeError("model failed"), [[1.0]]])
+    batcher = BatchingEmbeddings(base)
+
+    with pytest.raises(RuntimeError, match="model failed"):
+        batcher.embed_documents(["a"])
+
+    assert batcher.embed_documents(["a"]) == [[1.0]]
+
+
+def test_embed_query_passes_through():
+    """Test that queries go straight to the underlying model."""
+    batcher = BatchingEmbeddings(BlockingEmbeddings())
+
+    assert batcher.embed_query("query") == [5.0, 1.0]
@@ -0,0 +1,106 @@
+"""
+Unit tests for CachedEmbeddings
+"""
+
+import pytest
+from unittest.mock import Mock
+
+from src.mcp_memory_server.memory.embedding_cache import CachedEmbeddings
+
+
+@pytest.fixture
+def base_embeddings():
+    """Mock embedding model returning a vector derived from the text length."""
+    mock = Mock()
+    mock.embed_documents = Mock(side_effect=lambda texts: [[float(len(t))] for t in texts])
+    mock.embed_query = Mock(side_effect=lambda text: [float(len(text)), 1.0])
+    return mock
+
+
+def test_embed_documents_only_computes_misses(base_embeddings):
+    """Test that cached texts are not sent to the model again."""
+    cache = CachedEmbeddings(base_embeddings)
+
+    assert cache.embed_documents(["a", "bb"]) == [[1.0], [2.0]]
+    assert cache.embed_documents(["bb", "ccc", "a"]) == [[2.0], [3.0], [1.0]]
+
+    # Second call only embedded the new text
+    assert base_embeddings.embed_documents.call_args_list[1][0][0] == ["ccc"]
+    stats = cache.get_stats()
+    assert stats['hits'] == 2
+    assert stats['misses'] == 3
+
+
+def test_embed_documents_all_cached_skips_model(base_embeddings):
+    """Test that a fully cached batch never calls the model."""
+    cache = CachedEmbeddings(base_embeddings)
+    cache.embed_documents(["x", "y"])
+
+    cache.embed_documents(["y", "x"])
+
+    assert base_embeddings.embed_documents.call_count == 1
+
+
+def test_embed_documents_embeds_repeated_text_once(base_embeddings):
+    """Test that duplicate texts within one batch reach the model only once."""
+    cache = CachedEmbeddings(base_embeddings)
+
+    assert cache.embed_documents(["a", "bb", "a", "a"]) == [[1.0], [2.0], [1.0], [1.0]]
+
+    base_embeddings.embed_documents.assert_called_once_with(["a", "bb"])
+
+
+def test_embed_query_cached_separately(base_embeddings):
+    """Test that queries are cached independently of documents."""
+    cache = CachedEmbeddings(base_embeddings)
+    cache.embed_documents(["query"])
+
+    assert cache.embed_query("query") == [5.0, 1.0]
+    assert cache.embed_query("query") == [5.0, 1.0]
+    base_embeddings.embed_query.assert_called_once_with("query")
+
+
+def test_symmetric_query_reuses_document_vector(base_embeddings):
+    """Test that a symmetric model answers a query for stored text from the cache."""
+    cache = CachedEmbeddings(base_embeddings, symmetric_queries=True)
+    cache.embed_documents(["query"])
+
+    assert cache.embed_query("query") == [5.0]
+    assert base_embeddings.embed_documents.call_count == 1
+    base_embeddings.embed_query.assert_not_called()
+
+
+def test_lru_eviction(base_embeddings):
+    """Test that the least recently used entry is evicted first."""
+    cache = CachedEmbeddings(base_embeddings, max_size=2)
+    cache.embed_documents(["a", "b"])
+    cache.embed_documents(["a"])  # Refresh "a"
+    cache.embed_documents(["c"])  # Evicts "b"
+
+    cache.embed_documents(["a", "b"])
+
+    assert base_embeddings.embed_documents.call_args_list[-1][0][0] == ["b"]
+    assert cache.get_stats()['size'] == 2
+
+
+def test_zero_size_disables_cache(base_embeddings):
+    """Test that max_size=0 always calls the model."""
+    cache = CachedEmbeddings(base_embeddings, max_size=0)
+    cache.embed_documents(["a"])
+    cache.embed_documents(["a"])
+
+    assert base_embeddings.embed_documents.call_count == 2
+    assert cache.get_stats()['size'] == 0
+
+
+def test_cached_vectors_round_trip_as_float_lists(base_embeddings):
+    """Test that vectors stored as float32 come back unchanged as plain lists."""
+    vector = [0.1234567, -2.5, 3.0e-8]
+    base_embeddings.embed_documents = Mock(return_value=[vector])
+    cache = CachedEmbeddings(base_embeddings)
+    first = cache.embed_documents(["text"])[0]
+
+    cached = cache.embed_documents(["text"])[0]
+
+    assert isinstance(cached, list)
+    assert cached == pytest.approx(first, rel=1e-6)
@@ -0,0 +1,98 @@
+"""
+Unit tests for QueryResponseCache
+"""
+
+import pytest
+from unittest.mock import Mock
+
+from src.mcp_memory_server.memory.query_cache import QueryResponseCache
+
+
+VECTORS = {
+    "data analysis": [1.0, 0.0, 0.0],
+    "analyze the data": [0.99, 0.1, 0.0],
+    "code structure": [0.0, 1.0, 0.0],
+}
+
+
+@pytest.fixture
+def embeddings():
+    """Mock embedding model with fixed vectors per query."""
+    mock = Mock()
+    mock.embed_query = Mock(side_effect=lambda text: VECTORS[text])
+    return mock
+
+
+def test_similar_query_reuses_response(embeddings):
+    """Test that a query above the similarity threshold gets the cached response."""
+    cache = QueryResponseCache(embeddings, similarity_threshold=0.95)
+    cache.store("data analysis", "ns", {"content": ["result"]})
+
+    assert cache.lookup("analyze the data", "ns") == {"content": ["result"]}
+    assert cache.lookup("code structure", "ns") is None
+
+    stats = cache.get_stats()
+    assert stats['hits'] == 1
+    assert stats['misses'] == 1
+
+
+def test_lookup_is_scoped_to_namespace(embeddings):
+    """Test that responses are not shared across namespaces."""
+    cache = QueryResponseCache(embeddings)
+    cache.store("data analysis", ("short_term", 5), {"content": []})
+
+    assert cache.lookup("data analysis", ("long_term", 5)) is None
+
+
+def test_cached_response_is_copied(embeddings):
+    """Test that callers cannot mutate the cached response."""
+    cache = QueryResponseCache(embeddings)
+    response = {"content": [{"text": "result"}]}
+    cache.store("data analysis", "ns", response)
+    response["content"].clear()
+
+    hit = cache.lookup("data analysis", "ns")
+    hit["content"][0]["text"] = "changed"
+
+    assert cache.lookup("data analysis", "ns") == {"content": [{"text": "result"}]}
+
+
+def test_expired_entries_are_dropped(embeddings):
+    """Test that entries older than the TTL are not reused."""
+    cache = QueryResponseCache(embeddings, ttl_seconds=-1)
+    cache.store("data analysis", "ns", {"content": []})
+
+    assert cache.lookup("data analysis", "ns") is None
+    assert cache.get_stats()['size'] == 0
+
+
+def test_invalidate_clears_entries(embeddings):
+    """Test that invalidation drops every cached response."""
+    cache = QueryResponseCache(embeddings)
+    cache.store("data analysis", "ns", {"content": []})
+
+    cache.invalidate()
+
+    assert cache.lookup("data analysis", "ns") is None
+    assert cache.get_stats()['invalidations'] == 1
+
+
+def test_lru_eviction(embeddings):
+    """Test that the least recently used response is evicted first."""
+    cache = QueryResponseCache(embeddings, max_size=2)
+    cache.store("data analysis", "a", {"id": "a"})
+    cache.store("data analysis", "b", {"id": "b"})
+    cache.lookup("data analysis", "a")  # Refresh "a"
+    cache.store("code structure", "c", {"id": "c"})  # Evicts "b"
+
+    assert cache.lookup("data analysis", "b") is None
+    assert cache.lookup("data analysis", "a") == {"id": "a"}
+
+
+def test_zero_size_disables_cache(embeddings):
+    """Test that max_size=0 never stores or embeds."""
+    cache = QueryResponseCache(embeddings, max_size=0)
+    cache.store("data analysis", "ns", {"content": []})
+
+    assert cache.lookup("data analysis", "ns") is None
+    embeddings.embed_query.assert_not_called()
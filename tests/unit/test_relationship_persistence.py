@@ -9,7 +9,7 @@ Tests the serialization, deserialization, and persistence of:
 
 import json
 import pytest
-from unittest.mock import Mock, AsyncMock, MagicMock
+from unittest.mock import Mock, AsyncMock
 
 from src.mcp_memory_server.memory.chunk_relationships import (
     ChunkRelationshipManager,
@@ -17,7 +17,6 @@ from src.mcp_memory_server.memory.chunk_relationships import (
     FIELD_RELATED_CHUNKS,
     FIELD_DEDUP_SOURCES,
     FIELD_RELATIONSHIP_STRENGTH,
-    FIELD_DEDUP_HISTORY,
     MAX_MERGE_HISTORY_SIZE,
     MAX_RELATIONSHIPS_PER_CHUNK,
 )
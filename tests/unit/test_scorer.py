@@ -264,6 +264,24 @@ class TestMemoryImportanceScorer:
         score = importance_scorer.calculate_retrieval_score(memory_data_no_distance, query, current_time)
         assert score >= 0.0
 
+    def test_calculate_retrieval_scores_matches_single_scores(self, importance_scorer):
+        """Test that batch scoring returns the same scores as scoring each memory alone."""
+        current_time = time.time()
+        memories = [
+            {'metadata': {'timestamp': current_time - 3600, 'access_count': 5, 'importance_score': 0.9},
+             'distance': 0.2},
+            {'metadata': {}, 'distance': 1.7},
+            {'metadata': {'access_count': 500}},
+        ]
+
+        scores = importance_scorer.calculate_retrieval_scores(memories, "test query", current_time)
+
+        assert scores == pytest.approx([
+            importance_scorer.calculate_retrieval_score(memory, "test query", current_time)
+            for memory in memories
+        ])
+        assert importance_scorer.calculate_retrieval_scores([], "test query") == []
+
     def test_calculate_importance_is_important_false_caps_score(self):
         """Test that is_important: False caps score below permanent tier (0.95)."""
         # Create scorer with config that would normally produce score > 0.95